@@ -0,0 +1,77 @@
+"""Seeded synthetic tables used by the benchmarks."""
+
+import numpy as np
+import pandas as pd
+
+
+def make_table(
+    n_rows: int,
+    n_columns: int,
+    null_rate: float = 0.0,
+    cardinality: int = 10,
+    categorical_fraction: float = 0.2,
+    datetime_fraction: float = 0.0,
+    random_state: int = 0,
+):
+    """
+    Builds a table mixing numeric, categorical and datetime columns.
+
+    Numeric columns alternate between normal, log-normal and uniform values so
+    distribution transformations have something to do. The target is a noisy
+    linear combination of the numeric columns, binarized.
+
+    Args:
+        n_rows (int): Number of rows.
+        n_columns (int): Number of feature columns.
+        null_rate (float, optional): Fraction of missing values in the numeric and categorical columns. Defaults to 0.0.
+        cardinality (int, optional): Number of distinct values of the categorical columns. Defaults to 10.
+        categorical_fraction (float, optional): Fraction of categorical columns. Defaults to 0.2.
+        datetime_fraction (float, optional): Fraction of datetime columns. Defaults to 0.0.
+        random_state (int, optional): Seed of the generator. Defaults to 0.
+
+    Returns:
+        tuple: Feature DataFrame and target Series.
+    """
+    rng = np.random.default_rng(random_state)
+
+    n_datetime = int(round(n_columns * datetime_fraction))
+    n_categorical = int(round(n_columns * categorical_fraction))
+    n_numeric = max(n_columns - n_categorical - n_datetime, 0)
+
+    columns = {}
+    for i in range(n_numeric):
+        kind = i % 3
+        if kind == 0:
+            values = rng.normal(size=n_rows)
+        elif kind == 1:
+            values = rng.lognormal(size=n_rows)
+        else:
+            values = rng.uniform(-10, 10, size=n_rows)
+        columns[f"num_{i}"] = values
+
+    categories = np.array([f"cat_{j}" for j in range(cardinality)], dtype=object)
+    for i in range(n_categorical):
+        columns[f"cat_{i}"] = categories[rng.integers(cardinality, size=n_rows)]
+
+    start = np.datetime64("2020-01-01T00:00:00")
+    for i in range(n_datetime):
+        seconds = rng.integers(0, 5 * 365 * 24 * 3600, size=n_rows)
+        columns[f"date_{i}"] = start + seconds.astype("timedelta64[s]")
+
+    X = pd.DataFrame(columns)
+
+    numeric = X.filter(like="num_").to_numpy()
+    weights = rng.normal(size=numeric.shape[1])
+    signal = numeric @ weights if numeric.shape[1] else np.zeros(n_rows)
+    signal = signal + rng.normal(scale=signal.std() or 1.0, size=n_rows)
+    y = pd.Series((signal > np.median(signal)).astype(int), name="target")
+
+    if null_rate > 0:
+        # Datetime columns are kept complete: the search imputes them with 0,
+        # which mixes timestamps and integers
+        mask = rng.random(X.shape) < null_rate
+        for position, column in enumerate(X.columns):
+            if not column.startswith("date_"):
+                X.loc[mask[:, position], column] = None
+
+    return X, y
@@ -0,0 +1,203 @@
+"""
+Import-time benchmarks of the package.
+
+Times the import of the public entry points in fresh interpreters, and checks
+that the light ones do not load heavy optional dependencies (matplotlib, rich,
+category_encoders) beyond what scikit-learn itself loads:
+
+    python -m benchmarks.imports run --output baseline.json
+    python -m benchmarks.imports run --output current.json
+    python -m benchmarks.imports compare baseline.json current.json
+
+`run` exits with a non-zero status if a light entry point loads a heavy module.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import List
+
+import numpy as np
+
+from .transformers import _environment
+
+# Statements timed, and whether they must avoid the heavy modules
+TARGETS = {
+    "cross": ("import cross", True),
+    "CrossTransformer": (
+        "from cross import CrossTransformer\n"
+        "from cross.transformations import MissingValuesHandler, ScaleTransformation",
+        True,
+    ),
+    "transformations": ("import cross.transformations", True),
+    "auto_transform": ("from cross import auto_transform", False),
+}
+
+# Dependencies of scikit-learn itself, imported by every entry point
+BASELINE = "import sklearn.base, sklearn.impute, sklearn.preprocessing"
+
+HEAVY_MODULES = ["matplotlib", "rich", "category_encoders"]
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(statement: str) -> dict:
+    """
+    Runs an import statement in a fresh interpreter.
+
+    Args:
+        statement (str): Python code to time.
+
+    Returns:
+        dict: Seconds taken and names of the modules loaded afterwards.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _heavy(modules) -> List[str]:
+    roots = {module.split(".")[0] for module in modules}
+    return sorted(roots.intersection(HEAVY_MODULES))
+
+
+def run(targets: List[str], repeats: int = 5, verbose: bool = True) -> dict:
+    """
+    Benchmarks the import time of the entry points.
+
+    Args:
+        targets (List[str]): Names of the entry points in `TARGETS`.
+        repeats (int, optional): Fresh interpreters per entry point. Defaults to 5.
+        verbose (bool, optional): Whether to print each measurement. Defaults to True.
+
+    Returns:
+        dict: Environment metadata and one result per entry point, with the
+        heavy modules it loads beyond scikit-learn.
+    """
+    baseline = set(_heavy(measure_import(BASELINE)["modules"]))
+    results = []
+
+    for name in targets:
+        statement, light = TARGETS[name]
+        measurements = [measure_import(statement) for _ in range(repeats)]
+        heavy = [m for m in _heavy(measurements[0]["modules"]) if m not in baseline]
+
+        result = {
+            "target": name,
+            "light": light,
+            "seconds_p50": float(np.median([m["seconds"] for m in measurements])),
+            "modules": len(measurements[0]["modules"]),
+            "heavy_modules": heavy,
+        }
+        results.append(result)
+
+        if verbose:
+            print(
+                f"{name}: p50={result['seconds_p50'] * 1000:.0f}ms, "
+                f"{result['modules']} modules, heavy={heavy or 'none'}"
+            )
+
+    meta = _environment(repeats, None)
+    meta["sklearn_heavy_modules"] = sorted(baseline)
+    return {"meta": meta, "results": results}
+
+
+def violations(output: dict) -> List[dict]:
+    """Returns the light entry points that load heavy modules."""
+    return [r for r in output["results"] if r["light"] and r["heavy_modules"]]
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.1) -> List[dict]:
+    """
+    Finds the entry points of `current` slower to import than in `baseline`.
+
+    Args:
+        baseline (dict): Output of `run` for the reference version.
+        current (dict): Output of `run` for the version under test.
+        tolerance (float, optional): Allowed relative increase of the median
+            import time. Defaults to 0.1.
+
+    Returns:
+        List[dict]: Regressed entry points, with their baseline and current times.
+    """
+    reference = {result["target"]: result for result in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = reference.get(result["target"])
+        if before is None:
+            continue
+
+        if result["seconds_p50"] > before["seconds_p50"] * (1 + tolerance):
+            regressions.append(
+                {
+                    "target": result["target"],
+                    "baseline": before["seconds_p50"],
+                    "current": result["seconds_p50"],
+                    "change": result["seconds_p50"] / before["seconds_p50"] - 1,
+                }
+            )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS)
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--output", help="JSON file where results are written")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        output = run(args.targets, args.repeats)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+
+        for result in violations(output):
+            print(f"{result['target']} imports {', '.join(result['heavy_modules'])}")
+        return 1 if violations(output) else 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(
+            f"{regression['target']}: {regression['baseline'] * 1000:.0f}ms -> "
+            f"{regression['current'] * 1000:.0f}ms ({regression['change']:+.0%})"
+        )
+
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
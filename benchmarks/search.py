@@ -0,0 +1,284 @@
+"""
+End-to-end benchmarks of the `auto_transform` search.
+
+Runs `auto_transform` on seeded synthetic tables with different column mixes
+and on the scikit-learn toy datasets, with a linear and a tree model, and
+records the model fits and time of each stage and the final score:
+
+    python -m benchmarks.search run --output baseline.json
+    python -m benchmarks.search run --output current.json
+    python -m benchmarks.search compare baseline.json current.json
+
+Some selectors use estimators without a fixed seed, so fits and scores can vary
+slightly between runs of the same version.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+import warnings
+from typing import List
+
+import numpy as np
+from sklearn.datasets import load_breast_cancer, load_diabetes, load_iris, load_wine
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.model_selection import cross_val_score
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+from cross import CrossTransformer, auto_transform
+from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared.evaluate_model.evaluate_model import build_pipeline
+
+from .datasets import make_table
+from .transformers import _environment
+
+# Fractions of categorical and datetime columns of the synthetic tables
+MIXES = {
+    "numeric": {"categorical_fraction": 0.0, "datetime_fraction": 0.0},
+    "mixed": {"categorical_fraction": 0.3, "datetime_fraction": 0.1},
+    "categorical": {"categorical_fraction": 0.6, "datetime_fraction": 0.0},
+}
+
+TOY_DATASETS = {
+    "iris": (load_iris, "classification"),
+    "wine": (load_wine, "classification"),
+    "breast_cancer": (load_breast_cancer, "classification"),
+    "diabetes": (load_diabetes, "regression"),
+}
+
+MODELS = {
+    ("linear", "classification"): lambda: LogisticRegression(max_iter=1000),
+    ("tree", "classification"): lambda: DecisionTreeClassifier(random_state=0),
+    ("linear", "regression"): lambda: Ridge(),
+    ("tree", "regression"): lambda: DecisionTreeRegressor(random_state=0),
+}
+
+SCORING = {"classification": "accuracy", "regression": "neg_mean_squared_error"}
+
+GRIDS = {
+    "quick": {
+        "rows": [500],
+        "columns": [10],
+        "mixes": ["numeric", "mixed"],
+        "toy_datasets": ["iris"],
+    },
+    "full": {
+        "rows": [1_000, 10_000, 100_000],
+        "columns": [10, 50],
+        "mixes": list(MIXES),
+        "toy_datasets": list(TOY_DATASETS),
+    },
+}
+
+
+def _datasets(grid: dict, random_state: int):
+    """Yields the name, task, features and target of every dataset of the grid."""
+    for name in grid["toy_datasets"]:
+        loader, task = TOY_DATASETS[name]
+        X, y = loader(return_X_y=True, as_frame=True)
+        yield name, task, X, y
+
+    for n_rows, n_columns, mix in itertools.product(
+        grid["rows"], grid["columns"], grid["mixes"]
+    ):
+        X, y = make_table(
+            n_rows, n_columns, null_rate=0.05, random_state=random_state, **MIXES[mix]
+        )
+        yield f"synthetic_{mix}_{n_rows}x{n_columns}", "classification", X, y
+
+
+def _score_transformations(X, y, model, scoring, cv, transformations):
+    # The transformations run before the datetime columns are dropped, so the
+    # features extracted from them are scored too
+    pipeline = Pipeline(
+        [
+            ("transformer", CrossTransformer(transformations)),
+            ("model", build_pipeline(model)),
+        ]
+    )
+    return np.mean(cross_val_score(pipeline, X, y, scoring=scoring, cv=cv))
+
+
+def run(
+    grid: dict,
+    models: List[str],
+    cv: int = 5,
+    n_jobs: int = -1,
+    random_state: int = 0,
+    verbose: bool = True,
+) -> dict:
+    """
+    Runs `auto_transform` on every dataset and model of the grid.
+
+    Args:
+        grid (dict): Lists of "rows", "columns", "mixes" and "toy_datasets".
+        models (List[str]): Model types, "linear" and/or "tree".
+        cv (int, optional): Number of CV folds. Defaults to 5.
+        n_jobs (int, optional): Workers used by the search. Defaults to -1.
+        random_state (int, optional): Seed of the synthetic tables. Defaults to 0.
+        verbose (bool, optional): Whether to print each result. Defaults to True.
+
+    Returns:
+        dict: Environment metadata and one result per dataset and model.
+    """
+    results = []
+
+    for (dataset, task, X, y), model_type in itertools.product(
+        _datasets(grid, random_state), models
+    ):
+        model = MODELS[(model_type, task)]()
+        scoring = SCORING[task]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            start = time.perf_counter()
+            transformations, report = auto_transform(
+                X,
+                y,
+                model,
+                scoring,
+                cv=cv,
+                verbose=False,
+                n_jobs=n_jobs,
+                return_report=True,
+                profile=True,
+            )
+            wall_time = time.perf_counter() - start
+
+            baseline_score = evaluate_model(X, y, model, scoring, cv)
+            final_score = _score_transformations(
+                X, y, model, scoring, cv, transformations
+            )
+
+        profile = report["profile"].to_dict()
+        result = {
+            "dataset": dataset,
+            "model": model_type,
+            "rows": len(X),
+            "columns": X.shape[1],
+            "wall_time": wall_time,
+            "fits": profile["total"]["fits"],
+            "baseline_score": baseline_score,
+            "final_score": final_score,
+            "n_transformations": len(transformations),
+            "stages": [
+                {key: stage[key] for key in ["stage", "wall_time", "fits"]}
+                for stage in profile["stages"]
+            ],
+        }
+        results.append(result)
+
+        if verbose:
+            print(
+                f"{dataset} / {model_type}: {result['fits']} fits in "
+                f"{wall_time:.1f}s, score {baseline_score:.4f} -> {final_score:.4f}"
+            )
+
+    return {"meta": _environment(None, random_state), "results": results}
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.1) -> List[dict]:
+    """
+    Finds the runs of `current` that got slower, fitted more models or scored worse.
+
+    Args:
+        baseline (dict): Output of `run` for the reference version.
+        current (dict): Output of `run` for the version under test.
+        tolerance (float, optional): Allowed relative increase of the time and
+            fits, and relative decrease of the final score. Defaults to 0.1.
+
+    Returns:
+        List[dict]: Regressed runs, with their baseline and current values.
+    """
+    reference = {(r["dataset"], r["model"]): r for r in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = reference.get((result["dataset"], result["model"]))
+        if before is None:
+            continue
+
+        checks = {
+            "wall_time": result["wall_time"] > before["wall_time"] * (1 + tolerance),
+            "fits": result["fits"] > before["fits"] * (1 + tolerance),
+            "final_score": result["final_score"]
+            < before["final_score"] - abs(before["final_score"]) * tolerance,
+        }
+
+        for metric, regressed in checks.items():
+            if regressed:
+                regressions.append(
+                    {
+                        "dataset": result["dataset"],
+                        "model": result["model"],
+                        "metric": metric,
+                        "baseline": before[metric],
+                        "current": result[metric],
+                    }
+                )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--grid", choices=list(GRIDS), default="quick")
+    run_parser.add_argument("--rows", type=int, nargs="+")
+    run_parser.add_argument("--columns", type=int, nargs="+")
+    run_parser.add_argument("--mixes", nargs="+", choices=list(MIXES))
+    run_parser.add_argument("--toy-datasets", nargs="+", choices=list(TOY_DATASETS))
+    run_parser.add_argument(
+        "--models", nargs="+", choices=["linear", "tree"], default=["linear", "tree"]
+    )
+    run_parser.add_argument("--cv", type=int, default=5)
+    run_parser.add_argument("--n-jobs", type=int, default=-1)
+    run_parser.add_argument("--random-state", type=int, default=0)
+    run_parser.add_argument("--output", help="JSON file where results are written")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        grid = dict(GRIDS[args.grid])
+        for field in ["rows", "columns", "mixes", "toy_datasets"]:
+            if getattr(args, field) is not None:
+                grid[field] = getattr(args, field)
+
+        output = run(grid, args.models, args.cv, args.n_jobs, args.random_state)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(
+            f"{regression['dataset']} / {regression['model']} "
+            f"{regression['metric']}: {regression['baseline']:.4g} -> "
+            f"{regression['current']:.4g}"
+        )
+
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
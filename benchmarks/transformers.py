@@ -0,0 +1,680 @@
+"""
+Throughput and latency benchmarks of the transformers.
+
+Times `fit`, `transform` and `fit_transform` of every class in
+`cross.transformations` and of a `CrossTransformer` chaining several of them,
+on synthetic tables across a grid of rows, columns, null rates and
+cardinalities. Results are written as JSON so they can be compared between
+library versions:
+
+    python -m benchmarks.transformers run --output baseline.json
+    python -m benchmarks.transformers run --output current.json
+    python -m benchmarks.transformers compare baseline.json current.json
+
+The `scaling` command measures the speedup of a compiled `CrossTransformer`
+transforming row blocks on several threads:
+
+    python -m benchmarks.transformers scaling --rows 1000000 --n-jobs 1 2 4 8 16
+
+The `arrow` command compares a `CrossTransformer` taking and returning Arrow
+tables with the NumPy-backed path, which converts the table to pandas and the
+result back to Arrow (requires pyarrow):
+
+    python -m benchmarks.transformers arrow --rows 1000000 --columns 100
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from cross import CrossTransformer
+from cross.transformations import (
+    CategoricalEncoding,
+    ColumnSelection,
+    CyclicalFeaturesTransformer,
+    DateTimeTransformer,
+    DimensionalityReduction,
+    MathematicalOperations,
+    MissingValuesHandler,
+    MissingValuesIndicator,
+    NonLinearTransformation,
+    Normalization,
+    NumericalBinning,
+    OutliersHandler,
+    QuantileTransformation,
+    ScaleTransformation,
+    SplineTransformation,
+)
+from cross.transformations.utils import dtypes
+
+from .datasets import make_table
+
+GRIDS = {
+    "quick": {
+        "rows": [1_000, 10_000],
+        "columns": [10, 100],
+        "null_rates": [0.0, 0.1],
+        "cardinalities": [10],
+    },
+    "full": {
+        "rows": [1_000, 100_000, 10_000_000],
+        "columns": [10, 200, 2_000],
+        "null_rates": [0.0, 0.1, 0.5],
+        "cardinalities": [10, 1_000],
+    },
+}
+
+# Tables above this size are skipped, as they do not fit in memory
+MAX_CELLS = 200_000_000
+
+OPERATIONS = ["fit", "transform", "fit_transform"]
+
+
+def _numeric(X):
+    return [c for c in dtypes.numerical_columns(X) if c.startswith("num_")]
+
+
+def _categorical(X):
+    return [c for c in X.columns if c.startswith("cat_")]
+
+
+def _datetime(X):
+    return [c for c in X.columns if c.startswith("date_")]
+
+
+def _cyclical(X):
+    # Cyclical features are applied to the months extracted from the datetimes
+    return [c for c in X.columns if c.startswith("date_") and c.endswith("_month")]
+
+
+def _pairs(columns):
+    return list(zip(columns[::2], columns[1::2]))
+
+
+# Builds each transformer for a synthetic table, using every applicable column
+TRANSFORMERS: Dict[str, Callable] = {
+    "MissingValuesIndicator": lambda X: MissingValuesIndicator(
+        features=list(X.columns)
+    ),
+    "MissingValuesHandler": lambda X: MissingValuesHandler(
+        transformation_options={
+            **{c: "median" for c in _numeric(X)},
+            **{c: "most_frequent" for c in _categorical(X)},
+        }
+    ),
+    "OutliersHandler": lambda X: OutliersHandler(
+        transformation_options={c: ("cap", "iqr") for c in _numeric(X)},
+        thresholds={c: 1.5 for c in _numeric(X)},
+    ),
+    "NonLinearTransformation": lambda X: NonLinearTransformation(
+        transformation_options={c: "yeo_johnson" for c in _numeric(X)}
+    ),
+    "QuantileTransformation": lambda X: QuantileTransformation(
+        transformation_options={c: "normal" for c in _numeric(X)}
+    ),
+    "ScaleTransformation": lambda X: ScaleTransformation(
+        transformation_options={c: "standard" for c in _numeric(X)}
+    ),
+    "Normalization": lambda X: Normalization(
+        transformation_options={c: "l2" for c in _numeric(X)}
+    ),
+    "SplineTransformation": lambda X: SplineTransformation(
+        transformation_options={
+            c: {"n_knots": 5, "degree": 3, "extrapolation": "constant"}
+            for c in _numeric(X)
+        }
+    ),
+    "NumericalBinning": lambda X: NumericalBinning(
+        transformation_options={c: ("quantile", 5) for c in _numeric(X)}
+    ),
+    "MathematicalOperations": lambda X: MathematicalOperations(
+        operations_options=[(a, b, "multiply") for a, b in _pairs(_numeric(X))]
+    ),
+    "CategoricalEncoding": lambda X: CategoricalEncoding(
+        transformation_options={c: "count" for c in _categorical(X)}
+    ),
+    "DateTimeTransformer": lambda X: DateTimeTransformer(features=_datetime(X)),
+    "CyclicalFeaturesTransformer": lambda X: CyclicalFeaturesTransformer(
+        transformation_options={c: 12 for c in _cyclical(X)}
+    ),
+    "ColumnSelection": lambda X: ColumnSelection(features=_numeric(X)[::2]),
+    "DimensionalityReduction": lambda X: DimensionalityReduction(
+        features=_numeric(X), method="pca", n_components=2
+    ),
+}
+
+
+def _pipeline(X) -> CrossTransformer:
+    numeric = _numeric(X)
+    categorical = _categorical(X)
+
+    return CrossTransformer(
+        [
+            {
+                "name": "MissingValuesHandler",
+                "params": {
+                    "transformation_options": {
+                        **{c: "median" for c in numeric},
+                        **{c: "most_frequent" for c in categorical},
+                    }
+                },
+            },
+            {
+                "name": "ScaleTransformation",
+                "params": {"transformation_options": {c: "standard" for c in numeric}},
+            },
+            {
+                "name": "MathematicalOperations",
+                "params": {
+                    "operations_options": [
+                        (a, b, "multiply") for a, b in _pairs(numeric)
+                    ]
+                },
+            },
+            {
+                "name": "CategoricalEncoding",
+                "params": {"transformation_options": {c: "count" for c in categorical}},
+            },
+        ]
+    )
+
+
+def _prepare(name, X):
+    """Returns the input of a transformer, e.g. imputed or with datetime parts."""
+    if name in ["CrossTransformer", "MissingValuesIndicator", "MissingValuesHandler"]:
+        return X
+
+    X = X.copy()
+    numeric = _numeric(X)
+    X[numeric] = X[numeric].fillna(0)
+
+    if name == "CyclicalFeaturesTransformer":
+        X = DateTimeTransformer(features=_datetime(X)).fit_transform(X)
+
+    return X
+
+
+def _build(name, X, copy=True):
+    transformer = _pipeline(X) if name == "CrossTransformer" else TRANSFORMERS[name](X)
+    return transformer.set_params(copy=copy)
+
+
+def _run_operation(name, operation, X, y, copy=True):
+    """Returns a callable running `operation`, with `transform` fitted beforehand."""
+    # Without copies the input is modified, so every call gets its own frame,
+    # as a caller that owns its data would pass
+    data = (lambda: X) if copy else X.copy
+
+    if operation == "transform":
+        transformer = _build(name, X, copy).fit(data(), y)
+        return lambda: transformer.transform(data())
+
+    if operation == "fit":
+        return lambda: _build(name, X, copy).fit(data(), y)
+
+    return lambda: _build(name, X, copy).fit_transform(data(), y)
+
+
+def _measure(func: Callable, repeats: int) -> dict:
+    func()  # Warm-up
+
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return {
+        "latency_p50": p50,
+        "latency_p90": p90,
+        "latency_p99": p99,
+        "peak_memory_mb": peak / 1024**2,
+    }
+
+
+def run(
+    grid: dict,
+    transformers: List[str],
+    repeats: int = 5,
+    random_state: int = 0,
+    copy: bool = True,
+    verbose: bool = True,
+) -> dict:
+    """
+    Benchmarks the transformers on every table of the grid.
+
+    Args:
+        grid (dict): Lists of "rows", "columns", "null_rates" and "cardinalities".
+        transformers (List[str]): Names of the transformers to benchmark.
+        repeats (int, optional): Timed repetitions per measurement. Defaults to 5.
+        random_state (int, optional): Seed of the synthetic tables. Defaults to 0.
+        copy (bool, optional): `copy` parameter of the transformers. Without
+            copies, each call receives a fresh copy of the table, which is
+            included in the peak memory. Defaults to True.
+        verbose (bool, optional): Whether to print each measurement. Defaults to True.
+
+    Returns:
+        dict: Environment metadata and one result per measurement.
+    """
+    results = []
+
+    for n_rows, n_columns, null_rate, cardinality in itertools.product(
+        grid["rows"], grid["columns"], grid["null_rates"], grid["cardinalities"]
+    ):
+        if n_rows * n_columns > MAX_CELLS:
+            continue
+
+        X, y = make_table(
+            n_rows,
+            n_columns,
+            null_rate=null_rate,
+            cardinality=cardinality,
+            datetime_fraction=0.1,
+            random_state=random_state,
+        )
+
+        for name in transformers:
+            X_input = _prepare(name, X)
+
+            for operation in OPERATIONS:
+                result = {
+                    "transformer": name,
+                    "operation": operation,
+                    "rows": n_rows,
+                    "columns": n_columns,
+                    "null_rate": null_rate,
+                    "cardinality": cardinality,
+                }
+
+                try:
+                    func = _run_operation(name, operation, X_input, y, copy)
+                    result.update(_measure(func, repeats))
+                    result["input_memory_mb"] = (
+                        X_input.memory_usage(deep=True).sum() / 1024**2
+                    )
+                    result["rows_per_sec"] = n_rows / result["latency_p50"]
+                except Exception as e:
+                    result["error"] = repr(e)
+
+                results.append(result)
+                if verbose:
+                    _print_result(result)
+
+    meta = _environment(repeats, random_state)
+    meta["copy"] = copy
+    return {"meta": meta, "results": results}
+
+
+def scaling(
+    n_rows: int,
+    n_columns: int,
+    n_jobs: List[int],
+    repeats: int = 5,
+    random_state: int = 0,
+    verbose: bool = True,
+) -> dict:
+    """
+    Benchmarks a compiled `CrossTransformer.transform` with several thread counts.
+
+    Args:
+        n_rows (int): Rows of the synthetic table.
+        n_columns (int): Columns of the synthetic table.
+        n_jobs (List[int]): Thread counts to measure.
+        repeats (int, optional): Timed repetitions per measurement. Defaults to 5.
+        random_state (int, optional): Seed of the synthetic table. Defaults to 0.
+        verbose (bool, optional): Whether to print each measurement. Defaults to True.
+
+    Returns:
+        dict: Environment metadata and one result per thread count, with its
+        speedup and parallel efficiency over the first thread count.
+    """
+    X, y = make_table(
+        n_rows,
+        n_columns,
+        null_rate=0.1,
+        cardinality=10,
+        datetime_fraction=0.0,
+        random_state=random_state,
+    )
+    transformer = _pipeline(X).fit(X, y).compile()
+    results = []
+
+    for jobs in n_jobs:
+        result = {"n_jobs": jobs, "rows": n_rows, "columns": n_columns}
+        result.update(_measure(lambda: transformer.transform(X, n_jobs=jobs), repeats))
+        result["rows_per_sec"] = n_rows / result["latency_p50"]
+        result["speedup"] = (
+            results[0]["latency_p50"] / result["latency_p50"] if results else 1.0
+        )
+        result["efficiency"] = result["speedup"] * n_jobs[0] / jobs
+        results.append(result)
+
+        if verbose:
+            print(
+                f"n_jobs={jobs}: {result['rows_per_sec']:,.0f} rows/s, "
+                f"p50={result['latency_p50'] * 1000:.2f}ms, "
+                f"speedup={result['speedup']:.2f}x, "
+                f"efficiency={result['efficiency']:.0%}"
+            )
+
+    meta = _environment(repeats, random_state)
+    meta["cpu_count"] = os.cpu_count()
+    return {"meta": meta, "results": results}
+
+
+def arrow(
+    n_rows: int,
+    n_columns: int,
+    null_rate: float = 0.0,
+    compiled: bool = False,
+    repeats: int = 5,
+    random_state: int = 0,
+    verbose: bool = True,
+) -> dict:
+    """
+    Benchmarks a `CrossTransformer` from an Arrow table to an Arrow table.
+
+    The "numpy" path converts the table to NumPy-backed pandas, transforms it
+    and converts the result back to Arrow. The "arrow" path passes the table
+    as is and returns Arrow output, so unmodified columns are never copied
+    and numeric columns are read through views of their buffers.
+
+    Args:
+        n_rows (int): Rows of the synthetic table.
+        n_columns (int): Columns of the synthetic table.
+        null_rate (float, optional): Fraction of missing values. Arrow columns
+            with nulls cannot be viewed without copying. Defaults to 0.0.
+        compiled (bool, optional): Whether to compile the transformers.
+            Defaults to False.
+        repeats (int, optional): Timed repetitions per measurement. Defaults to 5.
+        random_state (int, optional): Seed of the synthetic table. Defaults to 0.
+        verbose (bool, optional): Whether to print each measurement. Defaults to True.
+
+    Returns:
+        dict: Environment metadata and one result per path, with its speedup
+        over the NumPy-backed path.
+    """
+    # Imported on first use, as the other benchmarks do not need it
+    import pyarrow as pa
+
+    X, y = make_table(
+        n_rows,
+        n_columns,
+        null_rate=null_rate,
+        cardinality=10,
+        datetime_fraction=0.0,
+        random_state=random_state,
+    )
+    table = pa.Table.from_pandas(X, preserve_index=False)
+
+    def numpy_path(transformer):
+        X = table.to_pandas()
+        return pa.Table.from_pandas(transformer.transform(X), preserve_index=False)
+
+    paths = {
+        "numpy": (_pipeline(X).fit(X, y), numpy_path),
+        "arrow": (
+            _pipeline(X).set_params(arrow_output=True).fit(table, y),
+            lambda transformer: transformer.transform(table),
+        ),
+    }
+    results = []
+
+    for name, (transformer, path) in paths.items():
+        result = {
+            "path": name,
+            "rows": n_rows,
+            "columns": n_columns,
+            "null_rate": null_rate,
+            "compiled": compiled,
+        }
+
+        try:
+            if compiled:
+                transformer.compile()
+
+            result.update(_measure(lambda: path(transformer), repeats))
+            result["rows_per_sec"] = n_rows / result["latency_p50"]
+            result["speedup"] = (
+                results[0]["latency_p50"] / result["latency_p50"]
+                if results and "error" not in results[0]
+                else 1.0
+            )
+        except Exception as e:
+            result["error"] = repr(e)
+
+        results.append(result)
+
+        if verbose:
+            if "error" in result:
+                print(f"{name}: {result['error']}")
+            else:
+                print(
+                    f"{name}: {result['rows_per_sec']:,.0f} rows/s, "
+                    f"p50={result['latency_p50'] * 1000:.2f}ms, "
+                    f"peak={result['peak_memory_mb']:.1f}MB, "
+                    f"speedup={result['speedup']:.2f}x"
+                )
+
+    meta = _environment(repeats, random_state)
+    meta["pyarrow"] = pa.__version__
+    return {"meta": meta, "results": results}
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.1) -> List[dict]:
+    """
+    Finds the measurements of `current` slower than `baseline` beyond a tolerance.
+
+    Args:
+        baseline (dict): Output of `run` for the reference version.
+        current (dict): Output of `run` for the version under test.
+        tolerance (float, optional): Allowed relative increase of the median
+            latency and of the peak memory. Defaults to 0.1.
+
+    Returns:
+        List[dict]: Regressed measurements, with their baseline and current values.
+    """
+    reference = {_key(result): result for result in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        before = reference.get(_key(result))
+        if before is None or "error" in before or "error" in result:
+            continue
+
+        for metric in ["latency_p50", "peak_memory_mb"]:
+            if result[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    {
+                        **{k: result[k] for k in _KEY_FIELDS},
+                        "metric": metric,
+                        "baseline": before[metric],
+                        "current": result[metric],
+                        "change": result[metric] / before[metric] - 1,
+                    }
+                )
+
+    return regressions
+
+
+_KEY_FIELDS = [
+    "transformer",
+    "operation",
+    "rows",
+    "columns",
+    "null_rate",
+    "cardinality",
+]
+
+
+def _key(result):
+    return tuple(result[field] for field in _KEY_FIELDS)
+
+
+def _environment(repeats, random_state):
+    import cross
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cross": getattr(cross, "__version__", None),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "scikit-learn": sklearn.__version__,
+        "repeats": repeats,
+        "random_state": random_state,
+    }
+
+
+def _print_result(result):
+    table = f"{result['rows']}x{result['columns']} nulls={result['null_rate']} card={result['cardinality']}"
+    label = f"{result['transformer']}.{result['operation']} [{table}]"
+
+    if "error" in result:
+        print(f"{label}: {result['error']}")
+    else:
+        print(
+            f"{label}: {result['rows_per_sec']:,.0f} rows/s, "
+            f"p50={result['latency_p50'] * 1000:.2f}ms, "
+            f"p99={result['latency_p99'] * 1000:.2f}ms, "
+            f"peak={result['peak_memory_mb']:.1f}MB "
+            f"(input {result['input_memory_mb']:.1f}MB)"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("--grid", choices=list(GRIDS), default="quick")
+    run_parser.add_argument("--rows", type=int, nargs="+")
+    run_parser.add_argument("--columns", type=int, nargs="+")
+    run_parser.add_argument("--null-rates", type=float, nargs="+")
+    run_parser.add_argument("--cardinalities", type=int, nargs="+")
+    run_parser.add_argument(
+        "--transformers",
+        nargs="+",
+        default=[*TRANSFORMERS, "CrossTransformer"],
+        choices=[*TRANSFORMERS, "CrossTransformer"],
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--random-state", type=int, default=0)
+    run_parser.add_argument(
+        "--no-copy",
+        dest="copy",
+        action="store_false",
+        help="Let the transformers modify their input instead of copying it",
+    )
+    run_parser.add_argument("--output", help="JSON file where results are written")
+
+    scaling_parser = subparsers.add_parser(
+        "scaling", help="Measure the speedup of a multithreaded transform"
+    )
+    scaling_parser.add_argument("--rows", type=int, default=1_000_000)
+    scaling_parser.add_argument("--columns", type=int, default=100)
+    scaling_parser.add_argument(
+        "--n-jobs", type=int, nargs="+", default=[1, 2, 4, 8, 16]
+    )
+    scaling_parser.add_argument("--repeats", type=int, default=5)
+    scaling_parser.add_argument("--random-state", type=int, default=0)
+    scaling_parser.add_argument("--output", help="JSON file where results are written")
+
+    arrow_parser = subparsers.add_parser(
+        "arrow", help="Compare Arrow input and output with the NumPy-backed path"
+    )
+    arrow_parser.add_argument("--rows", type=int, default=1_000_000)
+    arrow_parser.add_argument("--columns", type=int, default=100)
+    arrow_parser.add_argument("--null-rate", type=float, default=0.0)
+    arrow_parser.add_argument(
+        "--compile", action="store_true", help="Compile the transformers"
+    )
+    arrow_parser.add_argument("--repeats", type=int, default=5)
+    arrow_parser.add_argument("--random-state", type=int, default=0)
+    arrow_parser.add_argument("--output", help="JSON file where results are written")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        grid = dict(GRIDS[args.grid])
+        for field in ["rows", "columns", "null_rates", "cardinalities"]:
+            if getattr(args, field):
+                grid[field] = getattr(args, field)
+
+        output = run(
+            grid, args.transformers, args.repeats, args.random_state, args.copy
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+        return 0
+
+    if args.command == "scaling":
+        output = scaling(
+            args.rows, args.columns, args.n_jobs, args.repeats, args.random_state
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+        return 0
+
+    if args.command == "arrow":
+        output = arrow(
+            args.rows,
+            args.columns,
+            args.null_rate,
+            args.compile,
+            args.repeats,
+            args.random_state,
+        )
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(output, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(
+            f"{regression['transformer']}.{regression['operation']} "
+            f"[{regression['rows']}x{regression['columns']} "
+            f"nulls={regression['null_rate']} card={regression['cardinality']}] "
+            f"{regression['metric']}: {regression['baseline']:.4g} -> "
+            f"{regression['current']:.4g} ({regression['change']:+.0%})"
+        )
+
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
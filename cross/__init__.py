@@ -1,2 +1,29 @@
-from .auto_transform import auto_transform
+import sys
+import types
+
 from .cross_transformer import CrossTransformer
+
+
+def __getattr__(name):
+    # auto_transform imports every parameter selector, matplotlib and rich, so
+    # it is only imported on first use
+    if name == "auto_transform":
+        from .auto_transform import auto_transform
+
+        globals()["auto_transform"] = auto_transform
+        return auto_transform
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing the `cross.auto_transform` module must not replace the
+        # `auto_transform` function exported by the package
+        if name == "auto_transform" and isinstance(value, types.ModuleType):
+            return
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
@@ -1,7 +1,7 @@
 from collections import defaultdict
 from typing import Any, Dict, Optional
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import CategoricalEncoding
 from cross.transformations.utils import dtypes
@@ -10,7 +10,16 @@ from cross.utils.verbose import VerboseLogger
 
 class CategoricalEncodingParameterSelector:
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Beginning search for optimal categorical encodings.")
 
@@ -18,6 +27,8 @@ class CategoricalEncodingParameterSelector:
         total_columns = len(candidate_encodings)
         best_encoding_config = {}
 
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+
         for index, (column, encodings) in enumerate(
             candidate_encodings.items(), start=1
         ):
@@ -28,11 +39,13 @@ class CategoricalEncodingParameterSelector:
             best_score = float("-inf") if direction == "maximize" else float("inf")
             optimal_encoding = None
 
-            for encoding_method in encodings:
-                current_encoding = {column: encoding_method}
-                transformer = CategoricalEncoding(current_encoding)
+            transformers = [
+                CategoricalEncoding({column: encoding_method})
+                for encoding_method in encodings
+            ]
+            scores = context.evaluate_many(transformers, direction)
 
-                score = evaluate_model(X, y, model, scoring, cv, groups, transformer)
+            for encoding_method, score in zip(encodings, scores):
                 logger.progress(f"   ↪ Tried '{encoding_method}' → Score: {score:.4f}")
 
                 if is_score_improved(score, best_score, direction):
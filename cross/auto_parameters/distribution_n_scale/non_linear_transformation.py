@@ -11,7 +11,16 @@ class NonLinearTransformationParameterSelector:
     SKEWNESS_THRESHOLD = 0.5
 
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Beginning search for optimal non-linear transformations.")
 
@@ -1,7 +1,7 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from cross.auto_parameters.shared import evaluate_model
-from cross.auto_parameters.shared.utils import is_score_improved
+from cross.auto_parameters.shared import EvaluationContext
+from cross.auto_parameters.shared.utils import is_score_improved, selection_score
 from cross.transformations import Normalization
 from cross.transformations.utils import dtypes
 from cross.utils.verbose import VerboseLogger
@@ -10,16 +10,30 @@ from cross.utils.verbose import VerboseLogger
 class NormalizationParameterSelector:
     NORMALIZATION_OPTIONS = ["l1", "l2"]
 
+    # Score of the data with the last selection applied, None if unknown
+    best_score = None
+
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Beginning search for optimal normalization parameters.")
 
         numeric_columns = dtypes.numerical_columns(X)
         total_columns = len(numeric_columns)
         selected_normalizations = {}
+        column_scores = []
 
-        base_score = evaluate_model(X, y, model, scoring, cv, groups)
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(f"Baseline score (no normalization): {base_score:.4f}")
 
         for index, column in enumerate(numeric_columns, start=1):
@@ -27,16 +41,24 @@ class NormalizationParameterSelector:
                 f"[{index}/{total_columns}] Evaluating normalization for column: '{column}'"
             )
 
-            best_option = self._evaluate_column_normalizations(
-                X, y, model, scoring, base_score, column, direction, cv, groups, logger
+            best_option, best_score = self._evaluate_column_normalizations(
+                context, base_score, column, direction, logger
             )
 
             if best_option:
                 selected_normalizations.update(best_option)
+                column_scores.append(best_score)
                 logger.task_result(
                     f"Selected normalization for '{column}': {list(best_option.values())[0]}"
                 )
 
+        self.best_score = selection_score(
+            context,
+            base_score,
+            column_scores,
+            Normalization(transformation_options=selected_normalizations),
+        )
+
         if selected_normalizations:
             logger.task_result(
                 f"Normalization strategy selected for {len(selected_normalizations)} column(s)."
@@ -48,30 +70,28 @@ class NormalizationParameterSelector:
 
     def _evaluate_column_normalizations(
         self,
-        X,
-        y,
-        model,
-        scoring,
+        context: EvaluationContext,
         base_score: float,
         column: str,
         direction: str,
-        cv,
-        groups,
         logger: VerboseLogger,
-    ) -> Dict[str, str]:
+    ) -> Tuple[Dict[str, str], float]:
         best_score = base_score
         best_normalization = {}
 
-        for method in self.NORMALIZATION_OPTIONS:
-            transformation = Normalization({column: method})
-            score = evaluate_model(X, y, model, scoring, cv, groups, transformation)
+        scores = context.evaluate_many(
+            [Normalization({column: method}) for method in self.NORMALIZATION_OPTIONS],
+            direction,
+        )
+
+        for method, score in zip(self.NORMALIZATION_OPTIONS, scores):
             logger.progress(f"   ↪ Tried '{method}' → Score: {score:.4f}")
 
             if is_score_improved(score, best_score, direction):
                 best_score = score
                 best_normalization = {column: method}
 
-        return best_normalization
+        return best_normalization, best_score
 
     def _build_transformation_result(
         self, transformation_options: Dict[str, str]
@@ -1,7 +1,7 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from cross.auto_parameters.shared import evaluate_model
-from cross.auto_parameters.shared.utils import is_score_improved
+from cross.auto_parameters.shared import EvaluationContext
+from cross.auto_parameters.shared.utils import is_score_improved, selection_score
 from cross.transformations import QuantileTransformation
 from cross.transformations.utils import dtypes
 from cross.utils.verbose import VerboseLogger
@@ -10,16 +10,30 @@ from cross.utils.verbose import VerboseLogger
 class QuantileTransformationParameterSelector:
     TRANSFORMATION_OPTIONS = ["uniform", "normal"]
 
+    # Score of the data with the last selection applied, None if unknown
+    best_score = None
+
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Beginning search for optimal quantile transformations.")
 
         numeric_columns = dtypes.numerical_columns(X)
         total_columns = len(numeric_columns)
         selected_transformations = {}
+        column_scores = []
 
-        base_score = evaluate_model(X, y, model, scoring, cv, groups)
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(
             f"Baseline score (no quantile transformation): {base_score:.4f}"
         )
@@ -29,16 +43,24 @@ class QuantileTransformationParameterSelector:
                 f"[{index}/{total_columns}] Evaluating column: '{column}'"
             )
 
-            best_option = self._evaluate_column_transformations(
-                X, y, model, scoring, base_score, column, direction, cv, groups, logger
+            best_option, best_score = self._evaluate_column_transformations(
+                context, base_score, column, direction, logger
             )
 
             if best_option:
                 selected_transformations.update(best_option)
+                column_scores.append(best_score)
                 logger.task_result(
                     f"Selected transformation for '{column}': {list(best_option.values())[0]}"
                 )
 
+        self.best_score = selection_score(
+            context,
+            base_score,
+            column_scores,
+            QuantileTransformation(transformation_options=selected_transformations),
+        )
+
         if selected_transformations:
             logger.task_result(
                 f"Quantile transformation selected for {len(selected_transformations)} column(s)."
@@ -50,30 +72,31 @@ class QuantileTransformationParameterSelector:
 
     def _evaluate_column_transformations(
         self,
-        X,
-        y,
-        model,
-        scoring,
+        context: EvaluationContext,
         base_score: float,
         column: str,
         direction: str,
-        cv,
-        groups,
         logger: VerboseLogger,
-    ) -> Dict[str, str]:
+    ) -> Tuple[Dict[str, str], float]:
         best_score = base_score
         best_transformation = {}
 
-        for option in self.TRANSFORMATION_OPTIONS:
-            transformation = QuantileTransformation({column: option})
-            score = evaluate_model(X, y, model, scoring, cv, groups, transformation)
+        scores = context.evaluate_many(
+            [
+                QuantileTransformation({column: option})
+                for option in self.TRANSFORMATION_OPTIONS
+            ],
+            direction,
+        )
+
+        for option, score in zip(self.TRANSFORMATION_OPTIONS, scores):
             logger.progress(f"   ↪ Tried '{option}' → Score: {score:.4f}")
 
             if is_score_improved(score, best_score, direction):
                 best_score = score
                 best_transformation = {column: option}
 
-        return best_transformation
+        return best_transformation, best_score
 
     def _build_transformation_result(
         self, transformation_options: Dict[str, str]
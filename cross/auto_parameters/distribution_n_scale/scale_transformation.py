@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import ScaleTransformation
 from cross.transformations.utils import dtypes
@@ -12,7 +12,16 @@ class ScaleTransformationParameterSelector:
     QUANTILE_RANGE_OPTIONS = [5.0, 25.0]
 
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Beginning search for optimal scaling transformations.")
 
@@ -21,7 +30,8 @@ class ScaleTransformationParameterSelector:
 
         selected_scalers = {"transformation_options": {}, "quantile_range": {}}
 
-        base_score = evaluate_model(X, y, model, scoring, cv, groups)
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(f"Baseline score (no scaling): {base_score:.4f}")
 
         for index, column in enumerate(numeric_columns, start=1):
@@ -30,7 +40,7 @@ class ScaleTransformationParameterSelector:
             )
 
             best_for_column = self._evaluate_scalers_for_column(
-                X, y, model, scoring, base_score, column, direction, cv, groups, logger
+                context, base_score, column, direction, logger
             )
 
             if best_for_column:
@@ -61,48 +71,46 @@ class ScaleTransformationParameterSelector:
 
     def _evaluate_scalers_for_column(
         self,
-        X,
-        y,
-        model,
-        scoring,
+        context: EvaluationContext,
         base_score: float,
         column: str,
         direction: str,
-        cv,
-        groups,
         logger: VerboseLogger,
     ) -> Dict[str, Dict[str, Any]]:
         best_score = base_score
         best_params = {}
 
+        candidates = []
         for scaler in self.SCALER_OPTIONS:
             if scaler == "robust":
                 for q_low in self.QUANTILE_RANGE_OPTIONS:
                     q_range = (q_low, 100.0 - q_low)
-                    params = {
-                        "transformation_options": {column: scaler},
-                        "quantile_range": {column: q_range},
-                    }
-                    transformer = ScaleTransformation(**params)
-                    score = evaluate_model(
-                        X, y, model, scoring, cv, groups, transformer
+                    candidates.append(
+                        {
+                            "transformation_options": {column: scaler},
+                            "quantile_range": {column: q_range},
+                        }
                     )
-                    logger.progress(
-                        f"   ↪ Tried '{scaler}' (quantile range {q_range}) → Score: {score:.4f}"
-                    )
-
-                    if is_score_improved(score, best_score, direction):
-                        best_score = score
-                        best_params = params
             else:
-                params = {"transformation_options": {column: scaler}}
-                transformer = ScaleTransformation(**params)
-                score = evaluate_model(X, y, model, scoring, cv, groups, transformer)
+                candidates.append({"transformation_options": {column: scaler}})
+
+        scores = context.evaluate_many(
+            [ScaleTransformation(**params) for params in candidates], direction
+        )
+
+        for params, score in zip(candidates, scores):
+            scaler = params["transformation_options"][column]
+            if "quantile_range" in params:
+                q_range = params["quantile_range"][column]
+                logger.progress(
+                    f"   ↪ Tried '{scaler}' (quantile range {q_range}) → Score: {score:.4f}"
+                )
+            else:
                 logger.progress(f"   ↪ Tried '{scaler}' → Score: {score:.4f}")
 
-                if is_score_improved(score, best_score, direction):
-                    best_score = score
-                    best_params = params
+            if is_score_improved(score, best_score, direction):
+                best_score = score
+                best_params = params
 
         return best_params
 
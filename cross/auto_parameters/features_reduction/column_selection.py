@@ -8,7 +8,16 @@ from cross.utils.verbose import VerboseLogger
 
 class ColumnSelectionParameterSelector:
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Dict[str, Any]:
         """
         Selects the most informative subset of features using recursive feature addition.
@@ -19,9 +28,15 @@ class ColumnSelectionParameterSelector:
 
         logger.task_start("Beginning feature selection")
 
-        selector = RecursiveFeatureAddition(model, scoring, direction, cv, groups)
+        selector = RecursiveFeatureAddition(
+            model, scoring, direction, cv, groups, executor=executor
+        )
         selected_features = selector.fit(X_filtered, y)
 
+        if not selected_features:
+            logger.warn("No features were selected")
+            return None
+
         logger.task_result(f"{len(selected_features)} feature(s) selected")
 
         transformer = ColumnSelection(selected_features)
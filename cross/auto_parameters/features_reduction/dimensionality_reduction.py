@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional, Tuple
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import DimensionalityReduction
 from cross.utils.verbose import VerboseLogger
@@ -10,7 +10,16 @@ class DimensionalityReductionParameterSelector:
     METHODS = ["kernel_pca", "lda", "pca", "truncated_svd"]
 
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, Any]]:
         logger.task_start("Starting dimensionality reduction")
 
@@ -23,7 +32,8 @@ class DimensionalityReductionParameterSelector:
 
         best_method = None
         best_n_components = None
-        best_score = evaluate_model(X, y, model, scoring, cv, groups)
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+        best_score = context.evaluate()
         logger.baseline(f"Base score: {best_score:.4f}")
 
         for method in self.METHODS:
@@ -32,7 +42,7 @@ class DimensionalityReductionParameterSelector:
                 max_components = min(max_components, n_classes - 1)
 
             n_components, score = self._search_optimal_components(
-                X, y, method, (2, max_components), model, scoring, direction, cv, groups
+                X, method, (2, max_components), context, direction
             )
             logger.progress(f"   ↪ Tried '{method}' → Score: {score:.4f}")
 
@@ -61,14 +71,10 @@ class DimensionalityReductionParameterSelector:
     def _search_optimal_components(
         self,
         X,
-        y,
         method: str,
         n_range: Tuple[int, int],
-        model,
-        scoring,
+        context: EvaluationContext,
         direction: str,
-        cv,
-        groups,
     ) -> Tuple[int, float]:
         low, high = n_range
         best_n = low
@@ -79,16 +85,16 @@ class DimensionalityReductionParameterSelector:
             mid1 = low + (high - low) // 3
             mid2 = high - (high - low) // 3
 
-            for mid in [mid1, mid2]:
-                if mid not in scores:
-                    transformer = DimensionalityReduction(
-                        features=list(X.columns),
-                        method=method,
-                        n_components=mid,
-                    )
-                    scores[mid] = evaluate_model(
-                        X, y, model, scoring, cv, groups, transformer
-                    )
+            pending = [mid for mid in dict.fromkeys([mid1, mid2]) if mid not in scores]
+            transformers = [
+                DimensionalityReduction(
+                    features=list(X.columns),
+                    method=method,
+                    n_components=mid,
+                )
+                for mid in pending
+            ]
+            scores.update(zip(pending, context.evaluate_many(transformers, direction)))
 
             score1, score2 = scores[mid1], scores[mid2]
 
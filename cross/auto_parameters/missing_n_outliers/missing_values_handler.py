@@ -1,7 +1,7 @@
 from collections import ChainMap
 from typing import Dict, Optional, Tuple
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import MissingValuesHandler
 from cross.transformations.utils import dtypes
@@ -24,7 +24,16 @@ class MissingValuesHandlerParameterSelector:
         }
 
     def select_best_parameters(
-        self, X, y, model, scoring, direction: str, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction: str,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ) -> Optional[Dict[str, object]]:
         cat_columns = dtypes.categorical_columns(X)
         num_columns = dtypes.numerical_columns(X)
@@ -39,6 +48,7 @@ class MissingValuesHandlerParameterSelector:
             logger.warn("No missing values found. Skipping imputation transformation.")
             return None
 
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
         best_strategies = {}
         best_knn_params = {}
 
@@ -47,15 +57,23 @@ class MissingValuesHandlerParameterSelector:
             is_numeric = column in num_columns
 
             strategy, params = self._find_best_strategy_for_column(
-                X, y, model, scoring, direction, cv, groups, column, logger, is_numeric
+                context, direction, column, logger, is_numeric
             )
 
+            if strategy is None:
+                logger.warn(f"No imputation could be evaluated for '{column}'")
+                continue
+
             best_strategies[column] = strategy
             logger.task_result(f"Selected imputation for '{column}': {strategy}")
 
             if strategy == "knn":
                 best_knn_params.update(params)
 
+        if not best_strategies:
+            logger.warn("No imputation was applied to any column")
+            return None
+
         logger.task_result(f"Imputation applied to {len(best_strategies)} column(s)")
 
         return self._build_result(best_strategies, best_knn_params)
@@ -65,13 +83,8 @@ class MissingValuesHandlerParameterSelector:
 
     def _find_best_strategy_for_column(
         self,
-        X,
-        y,
-        model,
-        scoring,
+        context: EvaluationContext,
         direction: str,
-        cv,
-        groups,
         column: str,
         logger: VerboseLogger,
         is_numeric: bool,
@@ -85,77 +98,47 @@ class MissingValuesHandlerParameterSelector:
             self.STRATEGIES["num"] if is_numeric else self.STRATEGIES["cat"],
         )
 
+        candidates = []
         for strategy, params in strategies.items():
             if strategy == "knn":
-                score, knn_param = self._evaluate_knn(
-                    X, y, model, scoring, direction, cv, groups, column, params, logger
-                )
+                for n_neighbors in params.get("n_neighbors", []):
+                    candidates.append((strategy, n_neighbors))
             else:
-                score = self._evaluate_strategy(
-                    X, y, model, scoring, cv, groups, column, strategy, logger
-                )
-                knn_param = {}
+                candidates.append((strategy, None))
+
+        scores = context.evaluate_many(
+            [
+                self._build_transformer(column, strategy, n_neighbors)
+                for strategy, n_neighbors in candidates
+            ],
+            direction,
+        )
+
+        for (strategy, n_neighbors), score in zip(candidates, scores):
+            if n_neighbors is None:
                 logger.progress(f"   ↪ Tried '{strategy}' → Score: {score:.4f}")
+            else:
+                logger.progress(
+                    f"   ↪ Tried 'knn' with n_neighbors={n_neighbors} → Score: {score:.4f}"
+                )
 
             if is_score_improved(score, base_score, direction):
                 base_score = score
                 best_strategy = strategy
-                best_params = knn_param
+                best_params = {} if n_neighbors is None else {column: n_neighbors}
 
         return best_strategy, best_params
 
-    def _evaluate_knn(
-        self,
-        X,
-        y,
-        model,
-        scoring,
-        direction: str,
-        cv,
-        groups,
-        column: str,
-        params: Dict[str, list],
-        logger: VerboseLogger,
-    ) -> Tuple[float, Dict[str, int]]:
-        best_score = float("-inf") if direction == "maximize" else float("inf")
-        best_param = {}
-
-        for n_neighbors in params.get("n_neighbors", []):
-            score = self._evaluate_strategy(
-                X, y, model, scoring, cv, groups, column, "knn", logger, n_neighbors
-            )
-            logger.progress(
-                f"   ↪ Tried 'knn' with n_neighbors={n_neighbors} → Score: {score:.4f}"
-            )
-
-            if is_score_improved(score, best_score, direction):
-                best_score = score
-                best_param = {column: n_neighbors}
-
-        return best_score, best_param
-
-    def _evaluate_strategy(
-        self,
-        X,
-        y,
-        model,
-        scoring,
-        cv,
-        groups,
-        column: str,
-        strategy: str,
-        logger: VerboseLogger,
-        n_neighbors: Optional[int] = None,
-    ) -> float:
+    def _build_transformer(
+        self, column: str, strategy: str, n_neighbors: Optional[int] = None
+    ) -> MissingValuesHandler:
         transformation_options = {column: strategy}
         knn_params = {column: n_neighbors} if n_neighbors is not None else None
 
-        transformer = MissingValuesHandler(
+        return MissingValuesHandler(
             transformation_options=transformation_options, n_neighbors=knn_params
         )
 
-        return evaluate_model(X, y, model, scoring, cv, groups, transformer)
-
     def _build_result(
         self, strategies: Dict[str, str], knn_params: Dict[str, int]
     ) -> Dict[str, object]:
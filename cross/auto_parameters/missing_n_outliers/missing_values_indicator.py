@@ -5,7 +5,16 @@ from cross.utils.verbose import VerboseLogger
 
 class MissingValuesIndicatorParameterSelector:
     def select_best_parameters(
-        self, X, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         # Keep only categorical and numerical columns
         cat_columns = dtypes.categorical_columns(X)
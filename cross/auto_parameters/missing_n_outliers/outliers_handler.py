@@ -4,7 +4,7 @@ import numpy as np
 from sklearn.ensemble import IsolationForest
 from sklearn.neighbors import LocalOutlierFactor
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import OutliersHandler
 from cross.transformations.utils import dtypes
@@ -13,7 +13,16 @@ from cross.utils.verbose import VerboseLogger
 
 class OutliersParameterSelector:
     def select_best_parameters(
-        self, X, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         columns = dtypes.numerical_columns(X)
         total_columns = len(columns)
@@ -28,7 +37,8 @@ class OutliersParameterSelector:
         }
 
         logger.task_start("Starting outlier handling search")
-        base_score = evaluate_model(X, y, model, scoring, cv, groups)
+        context = EvaluationContext(X, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(f"Base score: {base_score:.4f}")
 
         for i, column in enumerate(columns, start=1):
@@ -36,12 +46,8 @@ class OutliersParameterSelector:
 
             best_column_params = self._find_best_params_for_column(
                 X,
-                y,
-                model,
-                scoring,
+                context,
                 direction,
-                cv,
-                groups,
                 column,
                 base_score,
                 outlier_actions,
@@ -75,12 +81,8 @@ class OutliersParameterSelector:
     def _find_best_params_for_column(
         self,
         X,
-        y,
-        model,
-        scoring,
+        context,
         direction,
-        cv,
-        groups,
         column,
         base_score,
         actions,
@@ -90,14 +92,16 @@ class OutliersParameterSelector:
         best_score = base_score
         best_params = {}
 
-        for action, method, param in self._generate_combinations(actions, methods):
-            if not self._has_outliers(X[column], method, param):
-                continue
+        candidates = [
+            self._build_kwargs(column, action, method, param)
+            for action, method, param in self._generate_combinations(actions, methods)
+            if self._has_outliers(X[column], method, param)
+        ]
+        scores = context.evaluate_many(
+            [OutliersHandler(**kwargs) for kwargs in candidates], direction
+        )
 
-            kwargs = self._build_kwargs(column, action, method, param)
-            score = evaluate_model(
-                X, y, model, scoring, cv, groups, OutliersHandler(**kwargs)
-            )
+        for kwargs, score in zip(candidates, scores):
             logger.progress(
                 f"   ↪ Tried '{self._kwargs_to_string(kwargs, column)}' → Score: {score:.4f}"
             )
@@ -9,7 +9,16 @@ class MathematicalOperationsParameterSelector:
     NON_SYMMETRIC_OPERATIONS = ["divide"]
 
     def select_best_parameters(
-        self, x, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        x,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         numerical_columns = dtypes.numerical_columns(x)
         column_indices = range(len(numerical_columns))
@@ -21,6 +30,11 @@ class MathematicalOperationsParameterSelector:
         logger.task_start("Starting mathematical operations search")
 
         for i, idx1 in enumerate(column_indices, start=1):
+            if executor is not None and executor.exhausted:
+                executor.budget.truncate()
+                logger.warn("Budget exhausted, keeping the operations found so far")
+                break
+
             col1 = numerical_columns[idx1]
             logger.task_update(f"[{i}/{total_columns}] Evaluating column: '{col1}'")
 
@@ -52,7 +66,9 @@ class MathematicalOperationsParameterSelector:
                 x, y
             )
 
-            rfa = RecursiveFeatureAddition(model, scoring, direction, cv, groups)
+            rfa = RecursiveFeatureAddition(
+                model, scoring, direction, cv, groups, executor=executor
+            )
             refined_features = rfa.fit(x_transformed, y)
 
             selected_operations = self._filter_selected_transformations(
@@ -1,6 +1,6 @@
 from itertools import product
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import NumericalBinning
 from cross.transformations.utils import dtypes
@@ -12,7 +12,16 @@ class NumericalBinningParameterSelector:
     BIN_COUNTS = [3, 8, 20]
 
     def select_best_parameters(
-        self, x, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        x,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         columns = dtypes.numerical_columns(x)
         total_columns = len(columns)
@@ -21,7 +30,8 @@ class NumericalBinningParameterSelector:
 
         logger.task_start("Starting numerical binning search")
 
-        base_score = evaluate_model(x, y, model, scoring, cv, groups)
+        context = EvaluationContext(x, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(f"Base score: {base_score:.4f}")
 
         for i, column in enumerate(columns, start=1):
@@ -31,14 +41,18 @@ class NumericalBinningParameterSelector:
             best_score = base_score
             best_column_params = None
 
-            for strategy, n_bins in all_combinations:
-                if n_unique <= n_bins:
-                    continue
+            combinations = [
+                (strategy, n_bins)
+                for strategy, n_bins in all_combinations
+                if n_unique > n_bins
+            ]
+            transformers = [
+                NumericalBinning({column: (strategy, n_bins)})
+                for strategy, n_bins in combinations
+            ]
+            scores = context.evaluate_many(transformers, direction)
 
-                transformation_option = {column: (strategy, n_bins)}
-                transformer = NumericalBinning(transformation_option)
-
-                score = evaluate_model(x, y, model, scoring, cv, groups, transformer)
+            for (strategy, n_bins), score in zip(combinations, scores):
                 logger.progress(
                     f"   ↪ Tried strategy='{strategy}', bins={n_bins} → Score: {score:.4f}"
                 )
@@ -1,6 +1,6 @@
 from itertools import product
 
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import EvaluationContext
 from cross.auto_parameters.shared.utils import is_score_improved
 from cross.transformations import SplineTransformation
 from cross.transformations.utils import dtypes
@@ -13,21 +13,31 @@ class SplineTransformationParameterSelector:
     EXTRAPOLATION_OPTIONS = ["constant", "linear"]
 
     def select_best_parameters(
-        self, x, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        x,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         columns = dtypes.numerical_columns(x)
         total_columns = len(columns)
         best_transformations = {}
 
         logger.task_start("Starting spline transformation search")
-        base_score = evaluate_model(x, y, model, scoring, cv, groups)
+        context = EvaluationContext(x, y, model, scoring, cv, groups, executor=executor)
+        base_score = context.evaluate()
         logger.baseline(f"Base score: {base_score:.4f}")
 
         for i, column in enumerate(columns, start=1):
             logger.task_update(f"[{i}/{total_columns}] Evaluating column: '{column}'")
 
             best_params = self._find_best_spline_params_for_column(
-                x, y, model, scoring, direction, cv, groups, base_score, column, logger
+                context, direction, base_score, column, logger
             )
 
             if best_params:
@@ -48,24 +58,31 @@ class SplineTransformationParameterSelector:
         return None
 
     def _find_best_spline_params_for_column(
-        self, x, y, model, scoring, direction, cv, groups, base_score, column, logger
+        self, context, direction, base_score, column, logger
     ):
         best_score = base_score
         best_params = {}
 
-        for n_knots, degree, extrapolation in product(
-            self.N_KNOTS_OPTIONS, self.DEGREE_OPTIONS, self.EXTRAPOLATION_OPTIONS
-        ):
-            params = {
+        candidates = [
+            {
                 column: {
                     "degree": degree,
                     "n_knots": n_knots,
                     "extrapolation": extrapolation,
                 }
             }
+            for n_knots, degree, extrapolation in product(
+                self.N_KNOTS_OPTIONS, self.DEGREE_OPTIONS, self.EXTRAPOLATION_OPTIONS
+            )
+        ]
+        scores = context.evaluate_many(
+            [SplineTransformation(params) for params in candidates], direction
+        )
 
-            transformer = SplineTransformation(params)
-            score = evaluate_model(x, y, model, scoring, cv, groups, transformer)
+        for params, score in zip(candidates, scores):
+            degree = params[column]["degree"]
+            n_knots = params[column]["n_knots"]
+            extrapolation = params[column]["extrapolation"]
             logger.progress(
                 f"   ↪ Tried extrapolation='{extrapolation}', degree={degree}, n_knots={n_knots} → Score: {score:.4f}"
             )
@@ -16,7 +16,16 @@ class CyclicalFeaturesTransformerParameterSelector:
     UNIQUE_VALUE_RATIO_THRESHOLD = 0.10
 
     def select_best_parameters(
-        self, x, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        x,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         numerical_columns = dtypes.numerical_columns(x)
         transformation_options = {}
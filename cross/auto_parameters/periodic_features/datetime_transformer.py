@@ -5,7 +5,16 @@ from cross.utils.verbose import VerboseLogger
 
 class DateTimeTransformerParameterSelector:
     def select_best_parameters(
-        self, X, y, model, scoring, direction, cv, groups, logger: VerboseLogger
+        self,
+        X,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger: VerboseLogger,
+        executor=None,
     ):
         datetime_columns = dtypes.datetime_columns(X)
 
@@ -1,2 +1,6 @@
-from .evaluate_model import evaluate_model
+from .budget import Budget, StageBudget
+from .evaluate_model import EvaluationContext, Racing, evaluate_model
+from .executor import CandidateExecutor, SharedObject
 from .feature_selector import ProbeFeatureSelector, RecursiveFeatureAddition
+from .profiler import SearchProfiler
+from .score_cache import ScoreCache
@@ -0,0 +1 @@
+from .budget import Budget, StageBudget
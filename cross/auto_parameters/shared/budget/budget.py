@@ -0,0 +1,147 @@
+import time
+from typing import List, Optional
+
+
+class Budget:
+    """
+    Time and evaluation budget of an `auto_transform` run.
+
+    The budget is spread across the stages of the search: each stage gets an
+    equal share of what is left when it starts, so the budget a stage does not
+    use is available to the following ones. Within a stage, candidates that do
+    not fit in its share are not evaluated, and the parameter selector returns
+    the best result found so far.
+    """
+
+    def __init__(
+        self,
+        max_time: Optional[float] = None,
+        max_evaluations: Optional[int] = None,
+        n_stages: int = 1,
+    ):
+        """
+        Args:
+            max_time (Optional[float], optional): Maximum search time in seconds. Defaults to None.
+            max_evaluations (Optional[int], optional): Maximum number of candidate evaluations. Defaults to None.
+            n_stages (int, optional): Number of stages the budget is spread across. Defaults to 1.
+        """
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.n_stages = n_stages
+
+        self.evaluations = 0
+        self.truncated_stages = []
+
+        self._start = time.monotonic()
+        self._started_stages = 0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._start
+
+    def stage(self, name: str) -> "StageBudget":
+        """
+        Starts the next stage with its share of the remaining budget.
+
+        Args:
+            name (str): Name of the stage.
+
+        Returns:
+            StageBudget: Budget of the stage.
+        """
+        remaining_stages = max(self.n_stages - self._started_stages, 1)
+        self._started_stages += 1
+
+        deadline = None
+        if self.max_time is not None:
+            remaining_time = max(self.max_time - self.elapsed, 0)
+            deadline = time.monotonic() + remaining_time / remaining_stages
+
+        evaluations = None
+        if self.max_evaluations is not None:
+            remaining = max(self.max_evaluations - self.evaluations, 0)
+            evaluations = -(-remaining // remaining_stages)
+
+        return StageBudget(self, name, deadline, evaluations)
+
+    def merge(self, copies: List["Budget"]):
+        """
+        Adds the usage recorded by copies of this budget, e.g. the ones sent to
+        worker processes that searched independent branches.
+
+        Args:
+            copies (List[Budget]): Copies taken from this budget before they were used.
+        """
+        evaluations = self.evaluations
+        started_stages = self._started_stages
+        truncated = len(self.truncated_stages)
+
+        for copy in copies:
+            self.evaluations += copy.evaluations - evaluations
+            self._started_stages += copy._started_stages - started_stages
+            self.truncated_stages.extend(copy.truncated_stages[truncated:])
+
+    def report(self) -> dict:
+        """
+        Summarizes the use of the budget.
+
+        Returns:
+            dict: Limits, time and evaluations used, and the stages cut short.
+        """
+        return {
+            "max_time": self.max_time,
+            "max_evaluations": self.max_evaluations,
+            "elapsed": self.elapsed,
+            "evaluations": self.evaluations,
+            "truncated_stages": list(self.truncated_stages),
+        }
+
+
+class StageBudget:
+    """Share of a `Budget` assigned to one stage of the search."""
+
+    def __init__(
+        self,
+        budget: Budget,
+        name: str,
+        deadline: Optional[float],
+        evaluations: Optional[int],
+    ):
+        self.budget = budget
+        self.name = name
+        self.deadline = deadline
+        self.evaluations = evaluations
+        self.truncated = False
+
+    @property
+    def exhausted(self) -> bool:
+        out_of_time = self.deadline is not None and time.monotonic() >= self.deadline
+        out_of_evaluations = self.evaluations is not None and self.evaluations <= 0
+        return out_of_time or out_of_evaluations
+
+    def take(self, n_evaluations: int) -> int:
+        """
+        Reserves evaluations for a batch of candidates.
+
+        Args:
+            n_evaluations (int): Number of candidates to evaluate.
+
+        Returns:
+            int: Number of candidates that fit in the budget.
+        """
+        allowed = 0 if self.exhausted else n_evaluations
+        if self.evaluations is not None:
+            allowed = min(allowed, self.evaluations)
+            self.evaluations -= allowed
+
+        if allowed < n_evaluations:
+            self.truncate()
+
+        self.budget.evaluations += allowed
+        return allowed
+
+    def truncate(self):
+        """Marks the stage as cut short by the budget."""
+        if not self.truncated:
+            self.truncated = True
+            self.budget.truncated_stages.append(self.name)
@@ -1 +1,3 @@
 from .evaluate_model import evaluate_model
+from .evaluation_context import EvaluationContext
+from .racing import Racing
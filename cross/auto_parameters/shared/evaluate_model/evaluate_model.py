@@ -6,6 +6,8 @@ from sklearn.model_selection import cross_val_score
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OrdinalEncoder
 
+from cross.utils import is_sparse_column, to_sparse_matrix
+
 
 # Custom selector to exclude datetime columns
 class ExcludeDatetimeColumns(BaseEstimator, TransformerMixin):
@@ -19,16 +21,35 @@ class ExcludeDatetimeColumns(BaseEstimator, TransformerMixin):
         return X[self.columns_]
 
 
+# Sparse columns, e.g. from transformers with `sparse_output`, reach the model
+# as a sparse matrix instead of being imputed as dense numeric columns
+class SparseColumns(BaseEstimator, TransformerMixin):
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        return to_sparse_matrix(X)
+
+
+def dense_numeric_columns(X):
+    numeric = X.select_dtypes(include="number").columns
+    return [column for column in numeric if not is_sparse_column(X, column)]
+
+
+def sparse_columns(X):
+    return [column for column in X.columns if is_sparse_column(X, column)]
+
+
 def build_pipeline(model, transformer=None):
     steps = []
 
-    # Step 0: Drop datetime columns
-    steps.append(("drop_datetime", ExcludeDatetimeColumns()))
-
-    # Step 1: Optional custom transformer
+    # Step 0: Optional custom transformer, which may read datetime columns
     if transformer:
         steps.append(("transformer", transformer))
 
+    # Step 1: Drop the datetime columns left
+    steps.append(("drop_datetime", ExcludeDatetimeColumns()))
+
     # Step 2: Define imputers
     numeric_imputer = SimpleImputer(strategy="constant", fill_value=0)
     categorical_imputer = SimpleImputer(strategy="constant", fill_value="missing")
@@ -47,7 +68,8 @@ def build_pipeline(model, transformer=None):
     # Step 4: Combine both pipelines
     preprocessor = ColumnTransformer(
         transformers=[
-            ("numeric", numeric_imputer, make_column_selector(dtype_include="number")),
+            ("numeric", numeric_imputer, dense_numeric_columns),
+            ("sparse", SparseColumns(), sparse_columns),
             (
                 "categorical",
                 categorical_pipeline,
@@ -55,6 +77,8 @@ def build_pipeline(model, transformer=None):
             ),
         ],
         remainder="drop",  # drop unhandled types like datetime
+        # Sparse output whenever there are sparse columns
+        sparse_threshold=1.0,
     )
 
     # Step 5: Add preprocessing and model
@@ -0,0 +1,578 @@
+import time
+import warnings
+
+import numpy as np
+from sklearn.base import clone, is_classifier
+from sklearn.impute import SimpleImputer
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OrdinalEncoder
+
+from cross.auto_parameters.shared.executor import SharedObject
+from cross.transformations import ColumnSelection
+from cross.utils import fingerprint, get_input_columns
+
+from .evaluate_model import ExcludeDatetimeColumns
+
+
+class EvaluationContext:
+    """
+    Scores candidate transformers on a fixed dataset reusing the CV work.
+
+    The CV splits are computed once, and the categorical preprocessing of
+    `build_pipeline` (imputation + ordinal encoding) is fitted once per fold and
+    column. Evaluating a candidate only refits the preprocessing of the columns
+    the candidate touches, producing the same scores as `evaluate_model`.
+
+    In delta mode the preprocessed fold is also cached as a column-major NumPy
+    block. Candidates whose input columns are known are applied to those columns
+    only, and their output is spliced into the cached block, so the work per
+    candidate scales with the changed columns instead of the table width.
+
+    With a `CandidateExecutor`, the (candidate × fold) tasks of `evaluate_many`
+    run on the executor's pool, candidates are raced fold by fold when the
+    executor has a `Racing` policy, and scores are looked up in and stored to
+    the executor's `ScoreCache`. Candidates that do not fit in the executor's
+    current `StageBudget` are not evaluated and get a nan score. Evaluations and
+    fit times are reported to the executor's `SearchProfiler`, if any.
+    """
+
+    def __init__(
+        self, x, y, model, scoring, cv=5, groups=None, delta=True, executor=None
+    ):
+        """
+        Args:
+            x (pd.DataFrame): Feature matrix.
+            y: Target variable.
+            model: Machine learning model with a fit method.
+            scoring (str): Scoring metric for evaluation.
+            cv (Union[int, Callable], optional): Cross-validation strategy. Defaults to 5.
+            groups (Optional): Group labels for cross-validation splitting. Defaults to None.
+            delta (bool, optional): Whether to evaluate candidates by splicing their
+                output columns into the cached fold block. Defaults to True.
+            executor (Optional[CandidateExecutor], optional): Pool used to run the
+                evaluations. Defaults to None (sequential).
+        """
+        self.x = x
+        self.y = y
+        self.model = model
+        self.scoring = scoring
+        self.cv = cv
+        self.groups = groups
+        self.delta = delta
+        self.executor = executor
+
+        self._scorer = check_scoring(model, scoring)
+        splitter = check_cv(cv, y, classifier=is_classifier(model))
+        self.folds = list(splitter.split(x, y, groups))
+        self._columns = ExcludeDatetimeColumns().fit(x).columns_
+
+        self.racing = getattr(executor, "racing", None)
+        self.cache = getattr(executor, "cache", None)
+        self.n_fits = 0
+
+        self._shared = None
+        self._cache_prefix = None
+        self._fold_data = [None] * len(self.folds)
+        self._encoders = [{} for _ in self.folds]
+        self._blocks = [None] * len(self.folds)
+
+    def __getstate__(self):
+        # Workers rebuild the fold frames from `x` and never use the pool
+        state = self.__dict__.copy()
+        state.update(
+            executor=None,
+            cache=None,
+            _shared=None,
+            _fold_data=[None] * len(self.folds),
+        )
+        return state
+
+    def evaluate(self, transformer=None):
+        """
+        Evaluates the model, optionally preceded by a candidate transformer.
+
+        Args:
+            transformer: Optional transformer applied before the preprocessing.
+
+        Returns:
+            float: Mean cross-validated score.
+        """
+        return self.evaluate_many([transformer])[0]
+
+    def evaluate_many(self, transformers, direction=None):
+        """
+        Evaluates several candidates, scheduling all their folds together.
+
+        When racing is enabled and a direction is given, the candidates dominated
+        by the current leader stop being evaluated and get a nan score. Scores
+        found in the cache are not evaluated again.
+
+        Args:
+            transformers (list): Candidate transformers (None for the baseline).
+            direction (str, optional): "maximize" or "minimize", required for
+                racing. Defaults to None.
+
+        Returns:
+            list: Mean cross-validated score of each candidate.
+        """
+        profiler = getattr(self.executor, "profiler", None)
+        if profiler is not None:
+            profiler.record_evaluations(len(transformers))
+
+        if self.cache is None:
+            return self._evaluate_many(transformers, direction)
+
+        keys = [self._cache_key(transformer) for transformer in transformers]
+        cached = self.cache.get_many(keys)
+
+        missing = [index for index, key in enumerate(keys) if key not in cached]
+        scores = self._evaluate_many([transformers[i] for i in missing], direction)
+        computed = dict(zip(missing, scores))
+
+        # Scores of pruned candidates are not final, so they are never stored
+        self.cache.put_many(
+            {keys[i]: score for i, score in computed.items() if np.isfinite(score)}
+        )
+
+        return [
+            cached[key] if key in cached else computed[index]
+            for index, key in enumerate(keys)
+        ]
+
+    def _cache_key(self, transformer):
+        if self._cache_prefix is None:
+            splits = [
+                np.concatenate([[len(train)], train, [len(test)], test])
+                for train, test in self.folds
+            ]
+            self._cache_prefix = fingerprint(
+                self.x,
+                self.y,
+                self.model,
+                self.scoring,
+                np.concatenate(splits),
+            )
+
+        return fingerprint(self._cache_prefix, transformer)
+
+    def _evaluate_many(self, transformers, direction=None):
+        if not transformers:
+            return []
+
+        n_folds = len(self.folds)
+        scores = np.full((len(transformers), n_folds), np.nan)
+        durations = np.zeros(len(transformers))
+        n_fits, task_cpu = 0, 0.0
+
+        # Candidates beyond the budget of the stage are not evaluated
+        n_allowed = len(transformers)
+        budget = getattr(self.executor, "budget", None)
+        if budget is not None:
+            n_allowed = budget.take(n_allowed)
+
+        racing = self.racing if direction and len(transformers) > 1 else None
+        alive = list(range(n_allowed))
+        done = 0
+
+        while alive and done < n_folds:
+            step = n_folds if racing is None else max(racing.min_folds - done, 1)
+            folds = range(done, min(done + step, n_folds))
+
+            tasks = [(index, fold) for fold in folds for index in alive]
+            results = self._run(transformers, tasks)
+            for (index, fold), (score, seconds, cpu) in zip(tasks, results):
+                scores[index, fold] = score
+                durations[index] += seconds
+                task_cpu += cpu
+            n_fits += len(tasks)
+
+            done = folds.stop
+            if racing is not None and done < n_folds:
+                alive = racing.survivors(scores[:, :done], alive, direction)
+
+        profiler = getattr(self.executor, "profiler", None)
+        if profiler is not None:
+            # Tasks run in this process are already part of its CPU time
+            in_workers = self.executor.is_parallel and not self.executor.uses_threads
+            profiler.record_fits(
+                transformers, durations, n_fits, task_cpu if in_workers else 0.0
+            )
+
+        alive = set(alive)
+        return [
+            self._aggregate(scores[index]) if index in alive else np.nan
+            for index in range(len(transformers))
+        ]
+
+    def _run(self, transformers, tasks):
+        self.n_fits += len(tasks)
+
+        if self.executor is not None and self.executor.is_parallel:
+            shared = self._share()
+            return self.executor.map(
+                _score_task, [(shared, transformers[i], fold) for i, fold in tasks]
+            )
+
+        return [self._timed_score_fold(fold, transformers[i]) for i, fold in tasks]
+
+    def _share(self):
+        if self._shared is None:
+            # Build the blocks once here rather than once per worker
+            for fold in range(len(self.folds)):
+                self._get_block(fold)
+            self._shared = self.executor.share(self)
+
+        return self._shared
+
+    def _timed_score_fold(self, fold, transformer=None):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        score = self._score_fold(fold, transformer)
+        return score, time.perf_counter() - wall, time.thread_time() - cpu
+
+    def _score_fold(self, fold, transformer=None):
+        try:
+            if isinstance(transformer, ColumnSelection):
+                return self._score_selection(fold, transformer.features)
+
+            if not self.delta:
+                return self._score_full(fold, transformer)
+
+            if transformer is None:
+                block = self._get_block(fold)
+                return self._fit_and_score(fold, *block.views())
+
+            columns = get_input_columns(transformer)
+
+            if columns is None or not set(columns).issubset(self._columns):
+                return self._score_full(fold, transformer)
+
+            return self._score_delta(fold, transformer, columns)
+
+        except Exception as e:
+            warnings.warn(f"Fold {fold} failed: {e!r}", UserWarning)
+            return np.nan
+
+    def _score_full(self, fold, transformer=None):
+        x_train, x_test = self._get_fold_data(fold)
+        touched = None
+
+        if transformer is not None:
+            x_train, x_test, fitted = self._apply_transformer(
+                fold, transformer, x_train, x_test
+            )
+            touched = getattr(fitted, "tracked_columns", None)
+
+        _, _, train, test = _preprocess(x_train, x_test, self._encoders[fold], touched)
+        return self._fit_and_score(fold, train, test)
+
+    def _score_selection(self, fold, features):
+        missing = [column for column in features if column not in self._columns]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+
+        block = self._get_block(fold)
+        positions = [
+            block.index[column]
+            for kind in ["numeric", "categorical"]
+            for column in features
+            if block.kinds.get(column) == kind
+        ]
+
+        return self._fit_and_score(
+            fold, block.train[:, positions], block.test[:, positions]
+        )
+
+    def _score_delta(self, fold, transformer, columns):
+        x_train, x_test = self._get_fold_data(fold, columns)
+        block = self._get_block(fold)
+
+        out_train, out_test, fitted = self._apply_transformer(
+            fold, transformer, x_train, x_test
+        )
+        numeric, categorical, train, test = _preprocess(out_train, out_test)
+
+        output_kinds = {column: "numeric" for column in numeric}
+        output_kinds.update({column: "categorical" for column in categorical})
+        output_index = {column: i for i, column in enumerate(numeric + categorical)}
+
+        removed = [
+            column
+            for column in dict.fromkeys([*columns, *out_train.columns])
+            if column in block.index and column not in output_kinds
+        ]
+        modified = [column for column in output_kinds if column in block.index]
+        added = [column for column in output_kinds if column not in block.index]
+
+        # The columns follow the order the transformer gives them on the whole
+        # table, e.g. replaced columns move last, as in `build_pipeline`
+        kinds = {c: k for c, k in block.kinds.items() if c not in removed}
+        kinds.update(output_kinds)
+        final_columns = [
+            column for column in self._output_order(fold, fitted) if column in kinds
+        ]
+        layout = [
+            column
+            for kind in ["numeric", "categorical"]
+            for column in final_columns
+            if kinds[column] == kind
+        ]
+
+        can_splice = (
+            not removed
+            and all(output_kinds[c] == block.kinds[c] for c in modified)
+            and np.can_cast(train.dtype, block.dtype, casting="safe")
+            and layout == block.columns + added
+        )
+
+        # Thread workers share the blocks, so they cannot be modified in place
+        if can_splice and not (self.executor and self.executor.uses_threads):
+            block = self._get_block(fold, writable=True)
+
+            with block.splice(
+                [block.index[c] for c in modified],
+                [output_index[c] for c in modified],
+                [output_index[c] for c in added],
+                train,
+                test,
+            ) as views:
+                return self._fit_and_score(fold, *views)
+
+        # Assemble a new block following the column order `build_pipeline` produces
+        sources = []
+        for column in layout:
+            if column in output_index:
+                sources.append((train, test, output_index[column]))
+            else:
+                sources.append((block.train, block.test, block.index[column]))
+
+        dtype = np.result_type(block.dtype, train.dtype)
+        new_train = _assemble([(s[0], s[2]) for s in sources], len(train), dtype)
+        new_test = _assemble([(s[1], s[2]) for s in sources], len(test), dtype)
+        return self._fit_and_score(fold, new_train, new_test)
+
+    def _apply_transformer(self, fold, transformer, x_train, x_test):
+        y_train, _ = self._get_targets(fold)
+
+        transformer = clone(transformer)
+        if hasattr(transformer, "track_columns"):
+            transformer.set_params(track_columns=True)
+
+        x_train = transformer.fit_transform(x_train, y_train)
+        x_test = transformer.transform(x_test)
+
+        return x_train, x_test, transformer
+
+    def _output_order(self, fold, transformer):
+        # Columns of the fitted transformer's output on a row of the whole table
+        x_train, _ = self._get_fold_data(fold)
+        return list(transformer.transform(x_train.iloc[:1]).columns)
+
+    def _fit_and_score(self, fold, x_train, x_test):
+        y_train, y_test = self._get_targets(fold)
+
+        model = clone(self.model).fit(x_train, y_train)
+        return self._scorer(model, x_test, y_test)
+
+    def _get_targets(self, fold):
+        train, test = self.folds[fold]
+        return _take(self.y, train), _take(self.y, test)
+
+    def _get_fold_data(self, fold, columns=None):
+        train, test = self.folds[fold]
+
+        # Subsets are cheap to slice and are not cached
+        if columns is not None:
+            x = self.x[list(columns)]
+            return x.iloc[train], x.iloc[test]
+
+        if self._fold_data[fold] is None:
+            x = self.x[self._columns]
+            self._fold_data[fold] = (x.iloc[train], x.iloc[test])
+
+        return self._fold_data[fold]
+
+    def _get_block(self, fold, writable=False):
+        if self._blocks[fold] is None:
+            x_train, x_test = self._get_fold_data(fold)
+            numeric, categorical, train, test = _preprocess(
+                x_train, x_test, self._encoders[fold], touched=()
+            )
+            self._blocks[fold] = _FoldBlock(numeric, categorical, train, test)
+
+        block = self._blocks[fold]
+
+        # Blocks memory-mapped in a worker are copied one fold at a time
+        if writable and not block.writable:
+            for other in self._blocks:
+                if other is not None and other is not block:
+                    other.release()
+            block.own()
+
+        return block
+
+    def _aggregate(self, scores):
+        scores = np.asarray(scores, dtype=float)
+        if np.isnan(scores).all():
+            raise ValueError(
+                f"All the {len(scores)} fits failed while evaluating the model."
+            )
+        return np.mean(scores)
+
+
+def _score_task(context, transformer, fold):
+    if isinstance(context, SharedObject):
+        context = context.load()
+    return context._timed_score_fold(fold, transformer)
+
+
+class _FoldBlock:
+    """Preprocessed train/test matrices of one fold, stored column-major."""
+
+    def __init__(self, numeric, categorical, train, test):
+        self.columns = numeric + categorical
+        self.index = {column: i for i, column in enumerate(self.columns)}
+        self.kinds = {column: "numeric" for column in numeric}
+        self.kinds.update({column: "categorical" for column in categorical})
+        self.width = len(self.columns)
+        self.dtype = train.dtype
+
+        self.train = np.asfortranarray(train)
+        self.test = np.asfortranarray(test)
+        self._shared = None
+        self._cache_prefix = None
+
+    @property
+    def writable(self):
+        return self.train.flags.writeable and self.test.flags.writeable
+
+    def own(self):
+        self._shared = (self.train, self.test)
+        self.train = np.array(self.train, order="F")
+        self.test = np.array(self.test, order="F")
+
+    def release(self):
+        if self._shared is not None:
+            self.train, self.test = self._shared
+            self._shared = None
+        self._cache_prefix = None
+
+    def views(self, width=None):
+        width = self.width if width is None else width
+        return self.train[:, :width], self.test[:, :width]
+
+    def splice(self, positions, sources, appended, train, test):
+        return _Splice(self, positions, sources, appended, train, test)
+
+    def reserve(self, n_columns):
+        capacity = self.train.shape[1]
+        if self.width + n_columns <= capacity:
+            return
+
+        capacity = self.width + max(n_columns, capacity - self.width, 8)
+        self.train = _grow(self.train, capacity)
+        self.test = _grow(self.test, capacity)
+
+
+class _Splice:
+    """Writes candidate columns into a fold block and restores it on exit."""
+
+    def __init__(self, block, positions, sources, appended, train, test):
+        self.block = block
+        self.positions = positions
+        self.sources = sources
+        self.appended = appended
+        self.train = train
+        self.test = test
+
+    def __enter__(self):
+        block = self.block
+        self._saved = (
+            block.train[:, self.positions].copy(),
+            block.test[:, self.positions].copy(),
+        )
+
+        block.train[:, self.positions] = self.train[:, self.sources]
+        block.test[:, self.positions] = self.test[:, self.sources]
+
+        width = block.width + len(self.appended)
+        if self.appended:
+            block.reserve(len(self.appended))
+            block.train[:, block.width : width] = self.train[:, self.appended]
+            block.test[:, block.width : width] = self.test[:, self.appended]
+
+        return block.views(width)
+
+    def __exit__(self, *exc_info):
+        self.block.train[:, self.positions] = self._saved[0]
+        self.block.test[:, self.positions] = self._saved[1]
+        return False
+
+
+def _preprocess(x_train, x_test, encoders=None, touched=None):
+    numeric = x_train.select_dtypes(include="number").columns.tolist()
+    categorical = x_train.select_dtypes(include=["object", "category"]).columns
+    categorical = categorical.tolist()
+
+    train_parts, test_parts = [], []
+
+    # The imputer drops the columns without observed values in the train fold
+    observed = x_train[numeric].notna().any().to_numpy()
+    numeric = [column for column, keep in zip(numeric, observed) if keep]
+
+    # Constant imputation is stateless, so the numeric block is never cached.
+    # Folds are cast to float64 first, as check_array does, since the same
+    # column may be integer in one fold and float with missing values in the
+    # other, e.g. counts of categories missing from the train fold
+    if numeric:
+        imputer = SimpleImputer(strategy="constant", fill_value=0)
+        train_parts.append(imputer.fit_transform(x_train[numeric].astype(np.float64)))
+        test_parts.append(imputer.transform(x_test[numeric].astype(np.float64)))
+
+    for column in categorical:
+        is_touched = encoders is None or touched is None or column in touched
+        encoder = None if is_touched else encoders.get(column)
+
+        if encoder is None:
+            encoder = _categorical_pipeline().fit(x_train[[column]])
+            if encoders is not None and not is_touched:
+                encoders[column] = encoder
+
+        train_parts.append(encoder.transform(x_train[[column]]))
+        test_parts.append(encoder.transform(x_test[[column]]))
+
+    if not train_parts:
+        empty = np.empty((len(x_train), 0)), np.empty((len(x_test), 0))
+        return numeric, categorical, *empty
+
+    return numeric, categorical, np.hstack(train_parts), np.hstack(test_parts)
+
+
+def _categorical_pipeline():
+    return Pipeline(
+        [
+            ("imputer", SimpleImputer(strategy="constant", fill_value="missing")),
+            (
+                "label_encoder",
+                OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1),
+            ),
+        ]
+    )
+
+
+def _assemble(sources, n_rows, dtype):
+    result = np.empty((n_rows, len(sources)), dtype=dtype, order="F")
+    for i, (matrix, position) in enumerate(sources):
+        result[:, i] = matrix[:, position]
+    return result
+
+
+def _grow(matrix, capacity):
+    grown = np.empty((matrix.shape[0], capacity), dtype=matrix.dtype, order="F")
+    grown[:, : matrix.shape[1]] = matrix
+    return grown
+
+
+def _take(y, indices):
+    return y.iloc[indices] if hasattr(y, "iloc") else y[indices]
@@ -0,0 +1,79 @@
+import warnings
+
+import numpy as np
+from scipy.stats import t
+
+
+class Racing:
+    """
+    Fold-by-fold elimination of candidates during the parameter search.
+
+    Candidates are scored on the first `min_folds` folds and then one fold at a
+    time. After each round, a candidate is dropped when a paired one-sided
+    t-test on the completed folds says it is worse than the current leader
+    with the given confidence. Lower confidences prune more aggressively.
+    """
+
+    def __init__(self, min_folds: int = 2, confidence: float = 0.9):
+        """
+        Args:
+            min_folds (int, optional): Folds scored before any candidate is dropped. Defaults to 2.
+            confidence (float, optional): Confidence required to drop a candidate,
+                between 0 and 1. Defaults to 0.9.
+        """
+        if min_folds < 1:
+            raise ValueError("min_folds must be at least 1")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        self.min_folds = min_folds
+        self.confidence = confidence
+
+    def __repr__(self):
+        return f"Racing(min_folds={self.min_folds}, confidence={self.confidence})"
+
+    def survivors(self, scores: np.ndarray, alive: list, direction: str) -> list:
+        """
+        Selects the candidates that keep racing.
+
+        Args:
+            scores (np.ndarray): Candidate × completed folds scores, nan for failed folds.
+            alive (list): Indices of the candidates still racing.
+            direction (str): "maximize" or "minimize".
+
+        Returns:
+            list: Indices of the candidates that are not dominated by the leader.
+        """
+        sign = 1 if direction == "maximize" else -1
+        scores = sign * scores
+
+        with warnings.catch_warnings():
+            # Candidates whose folds all failed have no mean
+            warnings.simplefilter("ignore", RuntimeWarning)
+            means = np.nanmean(scores[alive], axis=1)
+
+        if np.isnan(means).all():
+            return alive
+
+        leader = alive[int(np.nanargmax(means))]
+        return [
+            index
+            for index in alive
+            if index == leader or not self._dominated(scores[leader], scores[index])
+        ]
+
+    def _dominated(self, leader: np.ndarray, candidate: np.ndarray) -> bool:
+        if np.isnan(candidate).all():
+            return True
+
+        diff = (leader - candidate)[~np.isnan(leader) & ~np.isnan(candidate)]
+        if len(diff) < 2:
+            return False
+
+        mean = diff.mean()
+        std = diff.std(ddof=1)
+        if std == 0:
+            return mean > 0
+
+        bound = mean - t.ppf(self.confidence, len(diff) - 1) * std / np.sqrt(len(diff))
+        return bound > 0
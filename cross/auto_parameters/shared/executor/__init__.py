@@ -0,0 +1 @@
+from .candidate_executor import CandidateExecutor, SharedObject
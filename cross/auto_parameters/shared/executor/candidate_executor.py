@@ -0,0 +1,149 @@
+import os
+import shutil
+import tempfile
+from collections import OrderedDict, deque
+from uuid import uuid4
+
+import joblib
+from joblib import Parallel, delayed
+
+
+class CandidateExecutor:
+    """
+    Persistent worker pool that runs (candidate × fold) evaluation tasks.
+
+    A single executor is shared by all the parameter selectors of an
+    `auto_transform` run, so every candidate of a column is scheduled at once
+    on the same pool instead of starting a new dispatch per candidate. Objects
+    needed by the workers are dumped once and memory-mapped by each worker.
+    """
+
+    MAX_SHARED_FILES = 4
+
+    def __init__(self, n_jobs: int = -1, backend: str = None, racing=None, cache=None):
+        """
+        Args:
+            n_jobs (int, optional): Number of workers, -1 for all cores. Defaults to -1.
+            backend (str, optional): Joblib backend, e.g. "loky" or "threading".
+                Defaults to None (joblib default).
+            racing (Optional[Racing], optional): Policy used to drop losing candidates
+                before all their folds are scored. Defaults to None (no racing).
+            cache (Optional[ScoreCache], optional): Persistent cache of the scores.
+                Defaults to None (no cache).
+        """
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.racing = racing
+        self.cache = cache
+        self.budget = None
+        self.profiler = None
+        self.dtype_policy = None
+
+        self._parallel = None
+        self._folder = None
+        self._shared_files = deque()
+
+    @property
+    def uses_threads(self) -> bool:
+        return self.backend == "threading"
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the budget of the current stage has run out."""
+        return self.budget is not None and self.budget.exhausted
+
+    @property
+    def is_parallel(self) -> bool:
+        return self._parallel is not None and joblib.effective_n_jobs(self.n_jobs) > 1
+
+    def __enter__(self):
+        self._parallel = Parallel(n_jobs=self.n_jobs, backend=self.backend)
+        self._parallel.__enter__()
+        self._folder = tempfile.mkdtemp(prefix="cross_executor_")
+        return self
+
+    def __exit__(self, *exc_info):
+        self._parallel.__exit__(*exc_info)
+        self._parallel = None
+
+        shutil.rmtree(self._folder, ignore_errors=True)
+        self._folder = None
+        self._shared_files.clear()
+        return False
+
+    def __getstate__(self):
+        # The pool itself cannot be sent to other processes
+        state = self.__dict__.copy()
+        state.update(
+            _parallel=None,
+            _folder=None,
+            _shared_files=deque(),
+            cache=None,
+            budget=None,
+            profiler=None,
+        )
+        return state
+
+    def map(self, func, tasks) -> list:
+        """
+        Runs `func(*task)` for every task, in parallel when the pool is active.
+
+        Args:
+            func (Callable): Function to run.
+            tasks (Iterable[tuple]): Positional arguments of each call.
+
+        Returns:
+            list: Results in the order of the tasks.
+        """
+        if not self.is_parallel:
+            return [func(*task) for task in tasks]
+
+        return self._parallel(delayed(func)(*task) for task in tasks)
+
+    def share(self, obj):
+        """
+        Makes an object available to the workers without pickling it per task.
+
+        Args:
+            obj: Object to share.
+
+        Returns:
+            The object itself for thread workers, otherwise a `SharedObject`.
+        """
+        if self.uses_threads or not self.is_parallel:
+            return obj
+
+        path = os.path.join(self._folder, f"{uuid4().hex}.joblib")
+        joblib.dump(obj, path)
+
+        # Workers keep what they already mapped, so old files can be unlinked
+        self._shared_files.append(path)
+        while len(self._shared_files) > self.MAX_SHARED_FILES:
+            os.remove(self._shared_files.popleft())
+
+        return SharedObject(path)
+
+
+class SharedObject:
+    """Reference to an object dumped by `CandidateExecutor.share`."""
+
+    MAX_LOADED = 2
+    _loaded = OrderedDict()
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self):
+        """Loads the object, memory-mapping its arrays, once per worker."""
+        loaded = SharedObject._loaded
+
+        if self.path in loaded:
+            loaded.move_to_end(self.path)
+            return loaded[self.path]
+
+        obj = joblib.load(self.path, mmap_mode="r")
+        loaded[self.path] = obj
+        while len(loaded) > self.MAX_LOADED:
+            loaded.popitem(last=False)
+
+        return obj
@@ -2,9 +2,10 @@ from typing import Callable, Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
-from sklearn.model_selection import cross_val_score
 
+from cross.auto_parameters.shared.evaluate_model import EvaluationContext
 from cross.auto_parameters.shared.feature_selector.shared import feature_importance
+from cross.transformations import ColumnSelection
 
 
 class RecursiveFeatureAddition:
@@ -18,6 +19,7 @@ class RecursiveFeatureAddition:
         early_stopping: int = 3,
         target_score: bool = True,
         verbose: bool = False,
+        executor=None,
     ):
         """
         Initializes the RecursiveFeatureAddition class.
@@ -31,6 +33,7 @@ class RecursiveFeatureAddition:
             early_stopping (int, optional): Maximum number of non-improving additions. Defaults to 3.
             target_score (bool, optional): Whether to use the full-feature score as a stopping criterion. Defaults to True.
             verbose (bool, optional): Whether to print progress messages. Defaults to False.
+            executor (Optional[CandidateExecutor], optional): Pool used to run the evaluations. Defaults to None.
         """
         self.model = model
         self.scoring = scoring
@@ -40,6 +43,7 @@ class RecursiveFeatureAddition:
         self.early_stopping = early_stopping
         self.target_score = target_score
         self.verbose = verbose
+        self.executor = executor
 
         self.scores_history = []
         self.target_score_value = None
@@ -58,16 +62,10 @@ class RecursiveFeatureAddition:
         """
         X = X.copy()
 
-        scores = cross_val_score(
-            self.model,
-            X,
-            y,
-            scoring=self.scoring,
-            cv=self.cv,
-            groups=self.groups,
-            n_jobs=-1,
+        context = EvaluationContext(
+            X, y, self.model, self.scoring, self.cv, self.groups, executor=self.executor
         )
-        self.target_score_value = np.mean(scores)
+        self.target_score_value = context.evaluate()
         if self.verbose:
             print(f"Target score: {self.target_score_value}")
 
@@ -75,13 +73,13 @@ class RecursiveFeatureAddition:
         feature_importances = feature_importance(self.model, X, y)
         feature_indices = np.argsort(feature_importances)[::-1]
 
-        selected_features_idx = self._evaluate_features(X, y, feature_indices)
+        selected_features_idx = self._evaluate_features(X, context, feature_indices)
         self.selected_features_names = [X.columns[i] for i in selected_features_idx]
 
         return self.selected_features_names
 
     def _evaluate_features(
-        self, X: np.ndarray, y: np.ndarray, feature_indices: np.ndarray
+        self, X: np.ndarray, context: EvaluationContext, feature_indices: np.ndarray
     ) -> list:
         best_score = float("-inf") if self.direction == "maximize" else float("inf")
         selected_features_idx = []
@@ -90,16 +88,8 @@ class RecursiveFeatureAddition:
         for i, idx in enumerate(feature_indices):
             current_features_idx = selected_features_idx + [idx]
 
-            scores = cross_val_score(
-                self.model,
-                X.iloc[:, current_features_idx],
-                y,
-                scoring=self.scoring,
-                cv=self.cv,
-                groups=self.groups,
-                n_jobs=-1,
-            )
-            score = np.mean(scores)
+            features = [X.columns[j] for j in current_features_idx]
+            score = context.evaluate(ColumnSelection(features))
 
             if self._is_score_improved(score, best_score, self.direction):
                 self.scores_history.append(score)
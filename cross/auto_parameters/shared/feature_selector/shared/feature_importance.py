@@ -1,3 +1,4 @@
+import numpy as np
 from sklearn.inspection import permutation_importance
 
 
@@ -6,7 +7,8 @@ def feature_importance(model, x, y):
         feature_importances = model.feature_importances_
 
     elif hasattr(model, "coef_"):
-        feature_importances = model.coef_
+        # Coefficient magnitudes, averaged over the classes of linear classifiers
+        feature_importances = np.abs(np.atleast_2d(model.coef_)).mean(axis=0)
 
     else:
         result = permutation_importance(model, x, y, n_repeats=5, random_state=42)
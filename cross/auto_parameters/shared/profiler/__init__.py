@@ -0,0 +1 @@
+from .search_profiler import SearchProfiler
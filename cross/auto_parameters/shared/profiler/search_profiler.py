@@ -0,0 +1,161 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class SearchProfiler:
+    """
+    Records where the time of an `auto_transform` search goes.
+
+    For each stage it records the wall time, the CPU time (including the
+    evaluation tasks run by worker processes), the number of candidate
+    evaluations, the number of model fits, the peak resident memory of the
+    process and the slowest candidates with their parameters.
+    """
+
+    def __init__(self, n_slowest: int = 5):
+        """
+        Args:
+            n_slowest (int, optional): Number of slowest candidates kept per stage. Defaults to 5.
+        """
+        self.n_slowest = n_slowest
+        self.stages = []
+
+        self._current = None
+        self._worker_cpu = 0.0
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Profiles the code run inside the context as one stage.
+
+        Args:
+            name (str): Name of the stage.
+        """
+        record = {
+            "stage": name,
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "evaluations": 0,
+            "fits": 0,
+            "peak_rss_mb": None,
+            "slowest_candidates": [],
+        }
+        self._current = record
+        self._worker_cpu = 0.0
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_time"] = time.perf_counter() - wall
+            record["cpu_time"] = time.process_time() - cpu + self._worker_cpu
+            record["peak_rss_mb"] = _peak_rss_mb()
+
+            self._current = None
+            self.stages.append(record)
+
+    def record_evaluations(self, n_evaluations: int):
+        """Counts candidates evaluated in the current stage, cached or not."""
+        if self._current is not None:
+            self._current["evaluations"] += n_evaluations
+
+    def record_fits(
+        self,
+        transformers: list,
+        durations: List[float],
+        n_fits: int,
+        worker_cpu: float = 0.0,
+    ):
+        """
+        Records the model fits run for a batch of candidates.
+
+        Args:
+            transformers (list): Candidate transformers (None for the baseline).
+            durations (List[float]): Time spent on the folds of each candidate.
+            n_fits (int): Number of model fits run.
+            worker_cpu (float, optional): CPU time spent by worker processes,
+                which the stage cannot measure itself. Defaults to 0.0.
+        """
+        if self._current is None:
+            return
+
+        self._current["fits"] += n_fits
+        self._worker_cpu += worker_cpu
+
+        slowest = self._current["slowest_candidates"]
+        for transformer, duration in zip(transformers, durations):
+            if duration > 0:
+                slowest.append({**_describe(transformer), "time": duration})
+
+        slowest.sort(key=lambda candidate: candidate["time"], reverse=True)
+        del slowest[self.n_slowest :]
+
+    def to_dict(self) -> dict:
+        """
+        Returns the profile of every stage and the totals of the run.
+
+        Returns:
+            dict: Stage records under "stages" and their sums under "total".
+        """
+        total = {
+            key: sum(stage[key] for stage in self.stages)
+            for key in ["wall_time", "cpu_time", "evaluations", "fits"]
+        }
+        peaks = [s["peak_rss_mb"] for s in self.stages if s["peak_rss_mb"]]
+        total["peak_rss_mb"] = max(peaks) if peaks else None
+
+        return {"stages": [dict(stage) for stage in self.stages], "total": total}
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Serializes the profile as JSON.
+
+        Args:
+            path (Optional[str], optional): File where the JSON is written. Defaults to None.
+
+        Returns:
+            str: JSON document.
+        """
+        document = json.dumps(self.to_dict(), indent=2, default=str)
+
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(document)
+
+        return document
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the profile as a DataFrame with one row per stage.
+
+        Returns:
+            pd.DataFrame: Stage records.
+        """
+        return pd.DataFrame(self.stages)
+
+
+def _describe(transformer) -> dict:
+    if transformer is None:
+        return {"name": "baseline", "params": {}}
+
+    return {"name": type(transformer).__name__, "params": transformer.get_params()}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
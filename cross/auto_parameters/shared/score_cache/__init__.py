@@ -0,0 +1 @@
+from .score_cache import ScoreCache
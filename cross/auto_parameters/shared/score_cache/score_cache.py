@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable
+
+
+class ScoreCache:
+    """
+    On-disk cache of cross-validated scores, shared between runs.
+
+    Scores are stored in a SQLite database keyed by a fingerprint of the data,
+    the model, the scoring, the CV splits and the candidate transformer, so an
+    identical evaluation in a later `auto_transform` run is not fitted again.
+    When the cache grows beyond `max_entries`, the least recently used scores
+    are evicted.
+    """
+
+    FILENAME = "scores.sqlite"
+
+    def __init__(self, directory: str, max_entries: int = 100_000):
+        """
+        Args:
+            directory (str): Folder where the cache database is stored.
+            max_entries (int, optional): Maximum number of cached scores. Defaults to 100000.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.path = os.path.join(directory, self.FILENAME)
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS scores "
+            "(key TEXT PRIMARY KEY, score REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS scores_last_access ON scores (last_access)"
+        )
+        self._connection.commit()
+
+    def __getstate__(self):
+        raise TypeError("ScoreCache cannot be sent to other processes")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, float]:
+        """
+        Looks up several scores, marking the found ones as recently used.
+
+        Args:
+            keys (Iterable[str]): Evaluation keys.
+
+        Returns:
+            Dict[str, float]: Cached scores of the keys found.
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, score FROM scores WHERE key IN ({placeholders})", chunk
+            )
+            found.update(rows.fetchall())
+
+        if found:
+            now = time.time()
+            self._connection.executemany(
+                "UPDATE scores SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found],
+            )
+            self._connection.commit()
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, scores: Dict[str, float]):
+        """
+        Stores several scores and evicts the least recently used ones if needed.
+
+        Args:
+            scores (Dict[str, float]): Scores by evaluation key.
+        """
+        if not scores:
+            return
+
+        now = time.time()
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO scores (key, score, last_access) VALUES (?, ?, ?)",
+            [(key, float(score), now) for key, score in scores.items()],
+        )
+        self._evict()
+        self._connection.commit()
+
+    def stats(self) -> dict:
+        """
+        Returns the hit/miss statistics of this session.
+
+        Returns:
+            dict: Hits, misses, hit rate and number of stored entries.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def clear(self):
+        """Removes every cached score."""
+        self._connection.execute("DELETE FROM scores")
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def _evict(self):
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                "DELETE FROM scores WHERE key IN "
+                "(SELECT key FROM scores ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
@@ -1 +1,3 @@
 from .is_score_improved import is_score_improved
+from .subsample import subsample
+from .selection_score import selection_score
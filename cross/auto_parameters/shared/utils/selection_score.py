@@ -0,0 +1,33 @@
+from typing import Optional
+
+import numpy as np
+
+
+def selection_score(
+    context, base_score: float, column_scores: list, transformer
+) -> Optional[float]:
+    """
+    Score of the data with the transformations selected column by column.
+
+    Without a selection the data is unchanged, and a selection of a single
+    column was already scored as a candidate, so neither is evaluated again.
+    A selection of several columns is evaluated once on the cached folds of
+    the context.
+
+    Args:
+        context (EvaluationContext): Context the candidates were scored with.
+        base_score (float): Score of the data without transformation.
+        column_scores (list): Best score of each selected column.
+        transformer: Transformer applying the whole selection.
+
+    Returns:
+        Optional[float]: Score, or None if the budget left it unevaluated.
+    """
+    if not column_scores:
+        score = base_score
+    elif len(column_scores) == 1:
+        score = column_scores[0]
+    else:
+        score = context.evaluate(transformer)
+
+    return score if np.isfinite(score) else None
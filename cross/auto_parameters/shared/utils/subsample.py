@@ -0,0 +1,73 @@
+from typing import Optional, Union
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+
+def subsample(
+    X,
+    y,
+    size: Union[int, float],
+    stratify: bool = False,
+    groups: Optional[np.ndarray] = None,
+    random_state: int = 42,
+):
+    """
+    Draws a row subsample used to search the transformation parameters.
+
+    Args:
+        X (pd.DataFrame): Feature matrix.
+        y (pd.Series): Target variable.
+        size (Union[int, float]): Number of rows, or fraction of rows if it is a float in (0, 1).
+        stratify (bool, optional): Whether to keep the class proportions of `y`. Defaults to False.
+        groups (Optional[np.ndarray], optional): Group labels. When given, whole groups are sampled. Defaults to None.
+        random_state (int, optional): Seed of the sampling. Defaults to 42.
+
+    Returns:
+        tuple: Sampled `X`, `y` and `groups` (None if no groups were given).
+    """
+    n_rows = len(X)
+
+    if isinstance(size, float):
+        if not 0 < size < 1:
+            raise ValueError("A float search sample must be between 0 and 1")
+        size = int(round(size * n_rows))
+
+    if size < 1:
+        raise ValueError("The search sample must contain at least one row")
+
+    if size >= n_rows:
+        return X, y, groups
+
+    rng = np.random.default_rng(random_state)
+
+    if groups is not None:
+        groups = np.asarray(groups)
+        labels, counts = np.unique(groups, return_counts=True)
+
+        # Add whole groups in random order until the sample size is reached
+        order = rng.permutation(len(labels))
+        rows_before = np.cumsum(counts[order]) - counts[order]
+        selected = labels[order[rows_before < size]]
+        indices = np.flatnonzero(np.isin(groups, selected))
+
+    elif stratify:
+        try:
+            indices, _ = train_test_split(
+                np.arange(n_rows),
+                train_size=size,
+                stratify=y,
+                random_state=random_state,
+            )
+        except ValueError:
+            # Classes with a single row cannot be stratified
+            indices = rng.choice(n_rows, size, replace=False)
+
+    else:
+        indices = rng.choice(n_rows, size, replace=False)
+
+    indices = np.sort(indices)
+    sampled_y = y.iloc[indices] if hasattr(y, "iloc") else y[indices]
+    sampled_groups = groups[indices] if groups is not None else None
+
+    return X.iloc[indices], sampled_y, sampled_groups
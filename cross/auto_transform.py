@@ -1,15 +1,32 @@
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Callable, List, Optional, Union
+from typing import Callable, List, Optional, Tuple, Union
 
+import joblib
 import numpy as np
+from sklearn.base import is_classifier
 
 import cross.auto_parameters as pc
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import (
+    Budget,
+    CandidateExecutor,
+    EvaluationContext,
+    Racing,
+    ScoreCache,
+    SearchProfiler,
+    evaluate_model,
+)
+from cross.auto_parameters.shared.utils import is_score_improved, subsample
+from cross.cross_transformer import CrossTransformer
 from cross.transformations import ColumnSelection
 from cross.transformations.utils import dtypes
-from cross.utils import get_transformer
+from cross.transformations.utils.dtype_policy import check_dtype_policy
+from cross.utils import Checkpoint, fingerprint, get_transformer
 from cross.utils.verbose import VerboseLogger
 
+# Number of parameter selectors run by auto_transform, used to split the budget
+SEARCH_STAGES = 15
+
 
 def auto_transform(
     X: np.ndarray,
@@ -20,7 +37,17 @@ def auto_transform(
     cv: Union[int, Callable] = None,
     groups: Optional[np.ndarray] = None,
     verbose: bool = True,
-) -> List[dict]:
+    n_jobs: int = -1,
+    racing: Union[bool, Racing] = False,
+    search_sample: Optional[Union[int, float]] = None,
+    return_report: bool = False,
+    checkpoint_dir: Optional[str] = None,
+    score_cache: Optional[Union[str, ScoreCache]] = None,
+    max_time: Optional[float] = None,
+    max_evaluations: Optional[int] = None,
+    profile: bool = False,
+    dtype_policy: Optional[str] = None,
+) -> Union[List[dict], Tuple[List[dict], dict]]:
     """Automatically applies a series of data transformations to improve model performance.
 
     Args:
@@ -32,11 +59,22 @@ def auto_transform(
         cv (Union[int, Callable], optional): Cross-validation strategy. Defaults to None.
         groups (Optional[np.ndarray], optional): Group labels for cross-validation splitting. Defaults to None.
         verbose (bool, optional): Whether to print progress messages. Defaults to True.
+        n_jobs (int, optional): Number of workers used to evaluate the candidates, -1 for all cores. Defaults to -1.
+        racing (Union[bool, Racing], optional): Whether to drop losing candidates fold by fold. A `Racing` instance sets how aggressive the pruning is. Defaults to False.
+        search_sample (Optional[Union[int, float]], optional): Number or fraction of rows used to search the parameters. The selected transformations are then confirmed on the full data. Defaults to None (all rows).
+        return_report (bool, optional): Whether to also return a report of the search. Defaults to False.
+        checkpoint_dir (Optional[str], optional): Folder where the progress is saved after each stage. A rerun with the same inputs and folder replays the completed stages. Defaults to None.
+        score_cache (Optional[Union[str, ScoreCache]], optional): Folder or `ScoreCache` where the scores are stored, so identical evaluations in later runs are not fitted again. Defaults to None.
+        max_time (Optional[float], optional): Maximum search time in seconds, spread across the stages. Defaults to None.
+        max_evaluations (Optional[int], optional): Maximum number of candidate evaluations, spread across the stages. Defaults to None.
+        profile (bool, optional): Whether to add a `SearchProfiler` with the time, CPU, fits, memory and slowest candidates of each stage to the report. Defaults to False.
+        dtype_policy (Optional[str], optional): Dtype policy of the transformations applied between stages, "compact" for float32 and small integer outputs. Pass the same policy to the `CrossTransformer` built from the result. Defaults to None (float64 and int64).
 
     Returns:
-        List[dict]: A list of applied transformations.
+        Union[List[dict], Tuple[List[dict], dict]]: A list of applied transformations, and the search report if `return_report` is True.
     """
 
+    check_dtype_policy(dtype_policy)
     logger = VerboseLogger(verbose)
 
     logger.header("Starting automated transformation search")
@@ -44,6 +82,149 @@ def auto_transform(
     logger.config(f"Model: {model.__class__.__name__}")
     logger.config(f"Scoring metric: '{scoring}' with direction '{direction}'")
 
+    if racing is True:
+        racing = Racing()
+    racing = racing or None
+
+    X_search, y_search, groups_search = X, y, groups
+    if search_sample is not None:
+        X_search, y_search, groups_search = subsample(
+            X, y, search_sample, stratify=is_classifier(model), groups=groups
+        )
+        logger.config(f"Search sample: {len(X_search)} of {len(X)} rows")
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = Checkpoint(
+            checkpoint_dir,
+            fingerprint(
+                X,
+                y,
+                groups,
+                model,
+                scoring,
+                direction,
+                cv,
+                search_sample,
+                racing,
+                max_time,
+                max_evaluations,
+                dtype_policy,
+            ),
+        )
+        if checkpoint.resumed:
+            logger.config(
+                f"Resuming from checkpoint: {len(checkpoint.stages)} stage(s) completed"
+            )
+
+    budget = None
+    if max_time is not None or max_evaluations is not None:
+        budget = Budget(max_time, max_evaluations, n_stages=SEARCH_STAGES)
+        logger.config(f"Budget: max_time={max_time}, max_evaluations={max_evaluations}")
+
+    if isinstance(score_cache, str):
+        score_cache = ScoreCache(score_cache)
+
+    report = {}
+
+    profiler = SearchProfiler() if profile else None
+
+    with CandidateExecutor(n_jobs, racing=racing, cache=score_cache) as executor:
+        executor.profiler = profiler
+        executor.dtype_policy = dtype_policy
+        transformations = _search_transformations(
+            X_search,
+            y_search,
+            model,
+            scoring,
+            direction,
+            cv,
+            groups_search,
+            logger,
+            executor,
+            checkpoint,
+            budget,
+        )
+
+    if budget is not None:
+        report["budget"] = budget.report()
+
+    if profiler is not None:
+        report["profile"] = profiler
+        total = profiler.to_dict()["total"]
+        logger.note(f"Profile: {total['fits']} model fits in {total['wall_time']:.1f}s")
+
+    if score_cache is not None:
+        report["score_cache"] = score_cache.stats()
+        logger.note(
+            f"Score cache: {score_cache.hits} hit(s), {score_cache.misses} miss(es)"
+        )
+
+    if len(X_search) < len(X):
+        report["search_sample"] = _confirm_on_full_data(
+            transformations,
+            (X_search, y_search, groups_search),
+            (X, y, groups),
+            model,
+            scoring,
+            direction,
+            cv,
+            logger,
+            dtype_policy,
+        )
+
+    if return_report:
+        return transformations, report
+
+    return transformations
+
+
+def _confirm_on_full_data(
+    transformations, sample, full, model, scoring, direction, cv, logger, dtype_policy
+) -> dict:
+    logger.task_start("Confirming the selected transformations on the full data")
+
+    transformer = CrossTransformer(transformations, dtype_policy=dtype_policy)
+    X_sample, y_sample, groups_sample = sample
+    X, y, groups = full
+
+    sample_score = evaluate_model(
+        X_sample, y_sample, model, scoring, cv, groups_sample, transformer
+    )
+    full_score = evaluate_model(X, y, model, scoring, cv, groups, transformer)
+    baseline_score = evaluate_model(X, y, model, scoring, cv, groups)
+
+    logger.baseline(f"Full data baseline score: {baseline_score:.4f}")
+    logger.task_result(
+        f"Score on the search sample: {sample_score:.4f}, on the full data: "
+        f"{full_score:.4f} (difference {full_score - sample_score:+.4f})"
+    )
+
+    if not is_score_improved(full_score, baseline_score, direction):
+        logger.warn("The selected transformations do not improve the full data score")
+
+    return {
+        "n_rows": len(X_sample),
+        "sample_score": float(sample_score),
+        "full_score": float(full_score),
+        "baseline_score": float(baseline_score),
+        "difference": float(full_score - sample_score),
+    }
+
+
+def _search_transformations(
+    X,
+    y,
+    model,
+    scoring,
+    direction,
+    cv,
+    groups,
+    logger,
+    executor,
+    checkpoint=None,
+    budget=None,
+) -> List[dict]:
     X, y = X.copy(), y.copy()
     initial_columns = set(X.columns)
     initial_num_columns = dtypes.numerical_columns(X)
@@ -52,22 +233,60 @@ def auto_transform(
     exclude_from_selection, exclude_from_dimred = set(), set()
 
     def apply_wrapper(
-        transform_calc, X, y, transformations, tracked_columns, subset=None
+        transform_calc,
+        X,
+        y,
+        transformations,
+        tracked_columns,
+        subset=None,
+        exclude=(),
     ):
-        X_t, new_transforms, new_tracks = execute_transformation(
-            transform_calc, X, y, model, scoring, direction, cv, groups, logger, subset
+        name = type(transform_calc).__name__
+        stage = checkpoint.stage(name) if checkpoint else None
+        stage_budget = budget.stage(name) if budget else None
+
+        replay = None
+        if stage and checkpoint.is_completed(stage):
+            logger.note(f"Replaying stage '{stage}' from checkpoint")
+            replay = checkpoint.result(stage)
+
+        X_t, new_transforms, new_tracks = _run_stage(
+            transform_calc,
+            X,
+            y,
+            model,
+            scoring,
+            direction,
+            cv,
+            groups,
+            logger,
+            executor,
+            subset,
+            replay,
+            stage_budget,
         )
+
         transformations.extend(new_transforms)
         tracked_columns.extend(new_tracks)
         new_columns = set(X_t.columns) - set(X.columns)
+        for excluded in exclude:
+            excluded.update(new_columns)
+
+        if stage and not checkpoint.is_completed(stage):
+            checkpoint.complete(stage, new_transforms)
+
         return X_t, transformations, tracked_columns, new_columns
 
     # Apply Missing and Outlier handling
     transformer = pc.MissingValuesIndicatorParameterSelector()
-    X, transformations, tracked_columns, new_columns = apply_wrapper(
-        transformer, X, y, transformations, tracked_columns
+    X, transformations, tracked_columns, _ = apply_wrapper(
+        transformer,
+        X,
+        y,
+        transformations,
+        tracked_columns,
+        exclude=[exclude_from_dimred],
     )
-    exclude_from_dimred.update(new_columns)
 
     transformer = pc.MissingValuesHandlerParameterSelector()
     X, transformations, tracked_columns, _ = apply_wrapper(
@@ -81,51 +300,76 @@ def auto_transform(
 
     # Feature Engineering
     transformer = pc.SplineTransformationParameterSelector()
-    X, transformations, tracked_columns, new_columns = apply_wrapper(
-        transformer, X, y, transformations, tracked_columns, subset=initial_num_columns
+    X, transformations, tracked_columns, _ = apply_wrapper(
+        transformer,
+        X,
+        y,
+        transformations,
+        tracked_columns,
+        subset=initial_num_columns,
+        exclude=[exclude_from_selection, exclude_from_dimred],
     )
-    exclude_from_selection.update(new_columns)
-    exclude_from_dimred.update(new_columns)
 
     transformer = pc.NumericalBinningParameterSelector()
-    X, transformations, tracked_columns, new_columns = apply_wrapper(
-        transformer, X, y, transformations, tracked_columns, subset=initial_num_columns
+    X, transformations, tracked_columns, _ = apply_wrapper(
+        transformer,
+        X,
+        y,
+        transformations,
+        tracked_columns,
+        subset=initial_num_columns,
+        exclude=[exclude_from_dimred],
     )
-    exclude_from_dimred.update(new_columns)
 
     # Distribution Transformations (choose best)
-    transformations_1, transformations_2 = [], []
-    tracked_columns_1, tracked_columns_2 = [], []
-
-    ## Option 1: NonLinear + Normalization
-    transformer = pc.NonLinearTransformationParameterSelector()
-    X_1, transformations_1, tracked_columns_1, _ = apply_wrapper(
-        transformer, X, y, transformations_1, tracked_columns_1
-    )
-
-    transformer = pc.NormalizationParameterSelector()
-    X_1, transformations_1, tracked_columns_1, _ = apply_wrapper(
-        transformer, X_1, y, transformations_1, tracked_columns_1
-    )
+    branches = [
+        ## Option 1: NonLinear + Normalization
+        [
+            pc.NonLinearTransformationParameterSelector(),
+            pc.NormalizationParameterSelector(),
+        ],
+        ## Option 2: Quantile Transformation
+        [pc.QuantileTransformationParameterSelector()],
+    ]
 
-    ## Option 2: Quantile Transformation
-    transformer = pc.QuantileTransformationParameterSelector()
-    X_2, transformations_2, tracked_columns_2, _ = apply_wrapper(
-        transformer, X, y, transformations_2, tracked_columns_2
+    stages = [
+        [checkpoint.stage(type(s).__name__) if checkpoint else None for s in branch]
+        for branch in branches
+    ]
+    replays = []
+    for branch_stages in stages:
+        replays.append([])
+        for stage in branch_stages:
+            replay = None
+            if stage and checkpoint.is_completed(stage):
+                logger.note(f"Replaying stage '{stage}' from checkpoint")
+                replay = checkpoint.result(stage)
+            replays[-1].append(replay)
+
+    results = _search_branches(
+        branches,
+        replays,
+        X,
+        y,
+        model,
+        scoring,
+        direction,
+        cv,
+        groups,
+        logger,
+        executor,
+        budget,
     )
 
-    ## Choose best transformation approach
-    score_1 = evaluate_model(X_1, y, model, scoring, cv, groups)
-    score_2 = evaluate_model(X_2, y, model, scoring, cv, groups)
+    for branch_stages, (_, stage_transforms, _, _) in zip(stages, results):
+        for stage, new_transforms in zip(branch_stages, stage_transforms):
+            if stage and not checkpoint.is_completed(stage):
+                checkpoint.complete(stage, new_transforms)
 
-    if score_1 > score_2:
-        X = X_1
-        transformations.extend(transformations_1)
-        tracked_columns.extend(tracked_columns_1)
-    else:
-        X = X_2
-        transformations.extend(transformations_2)
-        tracked_columns.extend(tracked_columns_2)
+    ## Choose best transformation approach, with the scores of each branch
+    X, best_stages, best_tracked_columns, _ = results[_best_branch(results, direction)]
+    transformations.extend(t for stage in best_stages for t in stage)
+    tracked_columns.extend(best_tracked_columns)
 
     # Apply Mathematical Operations
     transformer = pc.MathematicalOperationsParameterSelector()
@@ -147,23 +391,26 @@ def auto_transform(
 
     if datetime_columns:
         transformer = pc.CyclicalFeaturesTransformerParameterSelector()
-        X, transformations, tracked_columns, new_columns = apply_wrapper(
+        X, transformations, tracked_columns, _ = apply_wrapper(
             transformer,
             X,
             y,
             transformations,
             tracked_columns,
             subset=list(datetime_columns),
+            exclude=[exclude_from_dimred],
         )
-        exclude_from_dimred.update(new_columns)
 
     # Categorical Encoding
     transformer = pc.CategoricalEncodingParameterSelector()
-    X, transformations, tracked_columns, new_columns = apply_wrapper(
-        transformer, X, y, transformations, tracked_columns
+    X, transformations, tracked_columns, _ = apply_wrapper(
+        transformer,
+        X,
+        y,
+        transformations,
+        tracked_columns,
+        exclude=[exclude_from_selection, exclude_from_dimred],
     )
-    exclude_from_selection.update(new_columns)
-    exclude_from_dimred.update(new_columns)
 
     # Dimensionality Reduction
     candidate_columns = dtypes.numerical_columns(X)
@@ -208,6 +455,283 @@ def date_time() -> str:
     return datetime.now().strftime("%Y/%m/%d %H:%M:%S")
 
 
+def _run_stage(
+    transform_calc,
+    X,
+    y,
+    model,
+    scoring,
+    direction,
+    cv,
+    groups,
+    logger,
+    executor,
+    subset=None,
+    replay=None,
+    stage_budget=None,
+):
+    name = type(transform_calc).__name__
+    profiler = executor.profiler
+
+    with profiler.stage(name) if profiler else nullcontext():
+        if replay is not None:
+            return replay_transformations(replay, X, y, executor.dtype_policy)
+
+        executor.budget = stage_budget
+        try:
+            X_t, new_transforms, new_tracks = execute_transformation(
+                transform_calc,
+                X,
+                y,
+                model,
+                scoring,
+                direction,
+                cv,
+                groups,
+                logger,
+                subset,
+                executor,
+                executor.dtype_policy,
+            )
+        finally:
+            executor.budget = None
+
+    if stage_budget and stage_budget.truncated:
+        logger.warn(f"Budget exhausted: '{name}' was cut short")
+
+    return X_t, new_transforms, new_tracks
+
+
+def _search_branch(
+    selectors,
+    replays,
+    X,
+    y,
+    model,
+    scoring,
+    direction,
+    cv,
+    groups,
+    logger,
+    executor,
+    budget=None,
+):
+    """
+    Runs a chain of parameter selectors and scores the data it produces.
+
+    The score is the one the last selector reports for its selection, which
+    it evaluates at most once on its own cached folds. When the last stage was
+    replayed, or its selector does not report a score, its transformations are
+    evaluated the same way, fitted on each training fold.
+
+    Returns:
+        tuple: Transformed data, transformations of each stage, tracked columns and score.
+    """
+    stage_transforms, tracked_columns = [], []
+    X_last = X
+
+    for selector, replay in zip(selectors, replays):
+        X_last = X
+        stage_budget = budget.stage(type(selector).__name__) if budget else None
+        X, new_transforms, new_tracks = _run_stage(
+            selector,
+            X,
+            y,
+            model,
+            scoring,
+            direction,
+            cv,
+            groups,
+            logger,
+            executor,
+            replay=replay,
+            stage_budget=stage_budget,
+        )
+        stage_transforms.append(new_transforms)
+        tracked_columns.extend(new_tracks)
+
+    score = None
+    if replays[-1] is None:
+        score = getattr(selectors[-1], "best_score", None)
+    if score is None:
+        transformer = CrossTransformer(
+            [get_transformer(t["name"], t["params"]) for t in stage_transforms[-1]]
+        )
+        score = EvaluationContext(
+            X_last, y, model, scoring, cv, groups, executor=executor
+        ).evaluate(transformer if stage_transforms[-1] else None)
+
+    return X, stage_transforms, tracked_columns, score
+
+
+def _search_branch_worker(
+    selectors,
+    replays,
+    X,
+    y,
+    model,
+    scoring,
+    direction,
+    cv,
+    groups,
+    verbose,
+    n_jobs,
+    racing,
+    cache,
+    budget,
+    profiler,
+    dtype_policy,
+):
+    # The logger and the score cache cannot be sent to a worker process, so the
+    # messages are returned to the parent and the cache is opened again
+    logger = VerboseLogger(enabled=verbose)
+    logger.begin_capture()
+    cache = ScoreCache(*cache) if cache else None
+
+    with CandidateExecutor(
+        n_jobs, backend="loky", racing=racing, cache=cache
+    ) as executor:
+        executor.profiler = profiler
+        executor.dtype_policy = dtype_policy
+        result = _search_branch(
+            selectors,
+            replays,
+            X,
+            y,
+            model,
+            scoring,
+            direction,
+            cv,
+            groups,
+            logger,
+            executor,
+            budget,
+        )
+
+    cache_stats = None
+    if cache is not None:
+        cache_stats = (cache.hits, cache.misses)
+        cache.close()
+
+    return result, logger.end_capture(), cache_stats, budget, profiler
+
+
+def _search_branches(
+    branches,
+    replays,
+    X,
+    y,
+    model,
+    scoring,
+    direction,
+    cv,
+    groups,
+    logger,
+    executor,
+    budget=None,
+):
+    """
+    Searches independent chains of parameter selectors on the same data.
+
+    With a process pool, each branch runs in its own worker with an equal share
+    of the workers for its candidates, and its messages are printed once it
+    finishes. Otherwise the branches run one after the other.
+    """
+    if not executor.is_parallel or executor.uses_threads or len(branches) < 2:
+        return [
+            _search_branch(
+                selectors,
+                branch_replays,
+                X,
+                y,
+                model,
+                scoring,
+                direction,
+                cv,
+                groups,
+                logger,
+                executor,
+                budget,
+            )
+            for selectors, branch_replays in zip(branches, replays)
+        ]
+
+    n_jobs = max(joblib.effective_n_jobs(executor.n_jobs) // len(branches), 1)
+    cache = executor.cache
+    cache_config = (cache.directory, cache.max_entries) if cache is not None else None
+    profiler = executor.profiler
+
+    outputs = executor.map(
+        _search_branch_worker,
+        [
+            (
+                selectors,
+                branch_replays,
+                X,
+                y,
+                model,
+                scoring,
+                direction,
+                cv,
+                groups,
+                logger.enabled,
+                n_jobs,
+                executor.racing,
+                cache_config,
+                budget,
+                SearchProfiler(profiler.n_slowest) if profiler else None,
+                executor.dtype_policy,
+            )
+            for selectors, branch_replays in zip(branches, replays)
+        ],
+    )
+
+    results = []
+    for result, output, cache_stats, _, branch_profiler in outputs:
+        logger.write(output)
+        results.append(result)
+
+        if branch_profiler is not None:
+            profiler.stages.extend(branch_profiler.stages)
+
+        if cache_stats is not None:
+            cache.hits += cache_stats[0]
+            cache.misses += cache_stats[1]
+
+    if budget is not None:
+        budget.merge([output[3] for output in outputs])
+
+    return results
+
+
+def _best_branch(results, direction) -> int:
+    """
+    Index of the branch with the best score.
+
+    An earlier branch is only chosen if it improves on the later ones, and a
+    branch whose score is nan, e.g. because the model failed on its data, only
+    if every other branch failed as well.
+
+    Args:
+        results (list): Results of `_search_branches`, the score last.
+        direction (str): Whether to maximize or minimize the score.
+
+    Returns:
+        int: Index of the chosen branch.
+    """
+    best = len(results) - 1
+    for i in reversed(range(best)):
+        score = results[i][-1]
+        if np.isnan(score):
+            continue
+
+        best_score = results[best][-1]
+        if np.isnan(best_score) or is_score_improved(score, best_score, direction):
+            best = i
+
+    return best
+
+
 def execute_transformation(
     calculator,
     X,
@@ -219,20 +743,33 @@ def execute_transformation(
     groups,
     logger,
     subset=None,
+    executor=None,
+    dtype_policy=None,
 ):
     X_subset = X.loc[:, subset] if subset else X
 
     transformation = calculator.select_best_parameters(
-        X_subset, y, model, scoring, direction, cv, groups, logger
+        X_subset, y, model, scoring, direction, cv, groups, logger, executor=executor
     )
     if not transformation:
         return X, [], []
 
-    transformer = get_transformer(
-        transformation["name"], {**transformation["params"], "track_columns": True}
-    )
-    X_transformed = transformer.fit_transform(X, y)
-    return X_transformed, [transformation], [transformer.tracked_columns]
+    return replay_transformations([transformation], X, y, dtype_policy)
+
+
+def replay_transformations(transformations, X, y, dtype_policy=None):
+    tracked_columns = []
+
+    for transformation in transformations:
+        transformer = get_transformer(
+            transformation["name"], {**transformation["params"], "track_columns": True}
+        )
+        if hasattr(transformer, "dtype_policy"):
+            transformer.dtype_policy = dtype_policy
+        X = transformer.fit_transform(X, y)
+        tracked_columns.append(transformer.tracked_columns)
+
+    return X, list(transformations), tracked_columns
 
 
 def filter_transformations(
@@ -1,11 +1,44 @@
-from sklearn.base import BaseEstimator, TransformerMixin
+import os
 
-from cross.utils import get_transformer
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin, clone
+
+from cross.transformations import ColumnSelection
+from cross.transformations.utils.dtype_policy import check_dtype_policy
+from cross.utils import (
+    from_arrow,
+    get_input_columns,
+    get_transformer,
+    is_arrow_table,
+    load_state,
+    read_chunks,
+    save_state,
+    to_arrow,
+    to_sparse_matrix,
+    write_parquet,
+)
 
 
 class CrossTransformer(BaseEstimator, TransformerMixin):
-    def __init__(self, transformations=None):
+    def __init__(
+        self,
+        transformations=None,
+        copy=True,
+        dtype_policy=None,
+        sparse_output=False,
+        arrow_output=False,
+    ):
         self.transformations = transformations
+        self.copy = copy
+        self.dtype_policy = dtype_policy
+        self.sparse_output = sparse_output
+        self.arrow_output = arrow_output
+        self._input_dtypes = None
+        self._output_dtypes = None
+        self._steps = None
+        self._plan = None
 
         if isinstance(transformations, list):
             if all(isinstance(t, dict) for t in transformations):
@@ -21,32 +54,510 @@ class CrossTransformer(BaseEstimator, TransformerMixin):
         return initialized_transformers
 
     def get_params(self, deep=True):
-        return {"transformations": self.transformations}
+        return {
+            "transformations": self.transformations,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+            "sparse_output": self.sparse_output,
+            "arrow_output": self.arrow_output,
+        }
 
     def set_params(self, **params):
         for key, value in params.items():
             setattr(self, key, value)
 
+        self._plan = None
         return self
 
+    def _own_steps(self, keep_fitted=False):
+        # The steps are clones of the transformations, which are left as given.
+        # They work in place on the frame copied at entry, if any, so the data
+        # is copied at most once per call, and follow the dtype policy and
+        # output mode
+        check_dtype_policy(self.dtype_policy)
+
+        if self.sparse_output and self.arrow_output:
+            raise ValueError("sparse_output and arrow_output cannot be combined")
+
+        if not keep_fitted or self._steps is None:
+            self._steps = [clone(transformer) for transformer in self.transformations]
+
+        self._configure_steps()
+
+    def _configure_steps(self):
+        for transformer in self._steps:
+            if hasattr(transformer, "copy"):
+                transformer.copy = False
+            if hasattr(transformer, "dtype_policy"):
+                transformer.dtype_policy = self.dtype_policy
+            if hasattr(transformer, "sparse_output"):
+                transformer.sparse_output = self.sparse_output
+
     def fit(self, X, y=None):
-        X = X.copy()
-        for transformer in self.transformations:
+        X = from_arrow(X)
+        self._input_dtypes = X.dtypes
+        self._plan = None
+        self._own_steps()
+
+        step_columns = [list(X.columns)]
+        if self.copy:
+            X = X.copy()
+        for transformer in self._steps:
             transformer.fit(X, y)
             X = transformer.transform(X)
+            step_columns.append(list(X.columns))
 
+        self._output_dtypes = X.dtypes
+        self.required_input_columns_ = self._required_columns(step_columns)
         return self
 
-    def transform(self, X, y=None):
-        X = X.copy()
-        for transformer in self.transformations:
+    def _required_columns(self, step_columns):
+        # Walks the steps backwards from the output columns, keeping the
+        # columns each step reads and the ones it passes on to later steps
+        required = set(step_columns[-1])
+
+        for transformer, columns in zip(
+            reversed(self._steps), reversed(step_columns[:-1])
+        ):
+            reads = get_input_columns(transformer)
+
+            if isinstance(transformer, ColumnSelection):
+                required = set(transformer.features)
+            elif reads is None:
+                required = set(columns)
+            else:
+                required = (required & set(columns)) | set(reads)
+
+        return [column for column in step_columns[0] if column in required]
+
+    def _project(self, X):
+        # Only the columns the steps need are copied, the rest are never read
+        columns = getattr(self, "required_input_columns_", None)
+        if columns is not None and list(X.columns) != columns:
+            return X[columns]
+
+        return X.copy() if self.copy else X
+
+    def partial_fit(self, source, chunksize=100_000, **read_kwargs):
+        """
+        Fits the transformations on a table chunk by chunk.
+
+        The steps are fitted one after the other: each step is updated with
+        every chunk, transformed by the steps before it, before the next step
+        starts, so the source is read once per step. Calling it with single
+        DataFrames updates every step with each of them instead.
+
+        Every transformation must support `partial_fit`.
+
+        Args:
+            source: DataFrame or `pyarrow.Table`, list of chunks, function
+                returning an iterable of chunks, or path to a CSV or Parquet
+                file.
+            chunksize (int, optional): Rows per chunk read from a file.
+                Defaults to 100_000.
+            **read_kwargs: Extra arguments for `pd.read_csv` or
+                `pyarrow.parquet.ParquetFile.iter_batches`.
+
+        Returns:
+            CrossTransformer: The fitted transformer.
+
+        Raises:
+            ValueError: If the source can only be read once, or a
+                transformation does not support `partial_fit`.
+        """
+        if isinstance(source, pd.DataFrame) or is_arrow_table(source):
+            source = [source]
+
+        elif not isinstance(source, (str, os.PathLike, list, tuple)) and not callable(
+            source
+        ):
+            raise ValueError(
+                "The source is read once per step: pass a path, a list of chunks "
+                "or a function returning the chunks"
+            )
+
+        def chunks():
+            return read_chunks(
+                source() if callable(source) else source, chunksize, **read_kwargs
+            )
+
+        self._plan = None
+        self._own_steps(keep_fitted=True)
+
+        for i, transformer in enumerate(self._steps):
+            if not hasattr(transformer, "partial_fit"):
+                raise ValueError(
+                    f"{type(transformer).__name__} does not support partial_fit"
+                )
+
+            for chunk in chunks():
+                chunk = from_arrow(chunk)
+                if self._input_dtypes is None:
+                    self._input_dtypes = chunk.dtypes
+
+                chunk = self._align_dtypes(chunk)
+                for fitted in self._steps[:i]:
+                    chunk = fitted.transform(chunk)
+
+                transformer.partial_fit(chunk)
+
+        sample = self._align_dtypes(from_arrow(next(iter(chunks()))).head(1))
+        step_columns = [list(sample.columns)]
+        for transformer in self._steps:
+            sample = transformer.transform(sample)
+            step_columns.append(list(sample.columns))
+
+        self._output_dtypes = sample.dtypes
+        self.required_input_columns_ = self._required_columns(step_columns)
+        return self
+
+    def compile(self):
+        """
+        Compiles the fitted transformations into a NumPy execution plan.
+
+        Columns are resolved once and later calls to `transform` run every
+        step on a single preallocated buffer instead of copying the DataFrame
+        at each step. Numeric output columns are computed as float64, and cast
+        to the dtypes of the steps under a `dtype_policy`. The plan is
+        discarded when the transformer is fitted again.
+
+        Returns:
+            CrossTransformer: The compiled transformer.
+
+        Raises:
+            ValueError: If the transformer is not fitted, has `sparse_output`,
+                or a transformation cannot be compiled.
+        """
+        if self._input_dtypes is None:
+            raise ValueError("CrossTransformer must be fitted before compiling")
+
+        if self.sparse_output:
+            raise ValueError("The execution plan only computes dense outputs")
+
+        # Imported on first use, as most pipelines are never compiled
+        from cross.execution_plan import ExecutionPlan
+
+        dtypes = self._input_dtypes
+        columns = getattr(self, "required_input_columns_", None)
+        if columns is not None:
+            dtypes = dtypes[columns]
+
+        self._plan = ExecutionPlan(self._steps, dtypes)
+        return self
+
+    def transform_records(self, records, as_dict=False):
+        """
+        Transforms rows given as dictionaries with the compiled plan.
+
+        Meant for online inference on single rows or micro-batches: no
+        DataFrame is built and every step uses the statistics precomputed
+        when compiling. Missing keys are treated as missing values.
+
+        Args:
+            records (List[dict]): Dictionaries mapping input columns to values.
+            as_dict (bool, optional): Whether to return each row as a dictionary
+                instead of a NumPy array. Defaults to False.
+
+        Returns:
+            Union[np.ndarray, List[dict]]: Transformed rows.
+
+        Raises:
+            ValueError: If the transformer is not compiled.
+        """
+        if self._plan is None:
+            raise ValueError("CrossTransformer must be compiled with compile()")
+
+        return self._plan.transform_records(records, as_dict=as_dict)
+
+    def transform_one(self, record, as_dict=False):
+        """
+        Transforms a single row given as a dictionary with the compiled plan.
+
+        Args:
+            record (dict): Mapping of input columns to values.
+            as_dict (bool, optional): Whether to return the row as a dictionary
+                instead of a NumPy array. Defaults to False.
+
+        Returns:
+            Union[np.ndarray, dict]: Transformed row.
+
+        Raises:
+            ValueError: If the transformer is not compiled.
+        """
+        return self.transform_records([record], as_dict=as_dict)[0]
+
+    def transform(self, X, y=None, as_frame=True, n_jobs=None):
+        """
+        Applies the fitted transformations to X.
+
+        With `n_jobs`, the rows are split into one block per thread. A compiled
+        transformer writes every block into a preallocated output; otherwise
+        the transformed blocks are concatenated. Either way the result is the
+        same as transforming all rows at once.
+
+        The required input columns are copied once before the first step, and
+        the steps then work in place on that copy. With `copy=False` and no
+        column to drop, X itself is modified instead.
+
+        With `sparse_output=True`, one-hot-like encodings and spline bases are
+        columns of `pd.SparseDtype`, and without `as_frame` the result is a
+        SciPy CSR matrix, so the sparse columns are never densified.
+
+        With `dtype_policy="compact"`, continuous outputs are float32,
+        missing value indicators uint8, and bins, date parts and categorical
+        codes the smallest integer dtype holding their fitted range. Codes
+        with missing values, e.g. parts of missing dates, are float32.
+
+        X may have `pd.ArrowDtype` columns or be a `pyarrow.Table`, which is
+        wrapped without copying. The steps read numeric Arrow columns through
+        NumPy views of their buffers, and columns they do not modify stay
+        Arrow-backed. With `arrow_output=True` the result is a `pyarrow.Table`.
+
+        Args:
+            X (pd.DataFrame): Data with the columns seen when fitting, or a
+                `pyarrow.Table` with them.
+            y: Ignored.
+            as_frame (bool, optional): Whether to return a DataFrame instead of
+                a NumPy array. Defaults to True.
+            n_jobs (int, optional): Number of threads, -1 for all cores.
+                Defaults to None (one thread).
+
+        Returns:
+            Union[pd.DataFrame, np.ndarray, sparse.csr_matrix, pyarrow.Table]:
+            Transformed data.
+
+        Raises:
+            ValueError: If the transformer is not fitted.
+        """
+        if self._steps is None:
+            raise ValueError("CrossTransformer must be fitted before transforming")
+
+        X = from_arrow(X)
+
+        if self._plan is not None:
+            if self.dtype_policy is None and not as_frame:
+                return self._plan.transform(X, as_frame=False, n_jobs=n_jobs)
+
+            X = self._plan.transform(X, n_jobs=n_jobs)
+            if self.dtype_policy is not None:
+                X = self._cast_output(X)
+
+            return self._output(X, as_frame)
+
+        n_blocks = min(joblib.effective_n_jobs(n_jobs), len(X))
+        if n_blocks > 1:
+            bounds = np.linspace(0, len(X), n_blocks + 1).astype(int)
+            blocks = joblib.Parallel(n_jobs=n_blocks, backend="threading")(
+                joblib.delayed(self._transform)(X.iloc[start:stop])
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            )
+            X = pd.concat(blocks)
+        else:
+            X = self._transform(X)
+
+        return self._output(X, as_frame)
+
+    def _output(self, X, as_frame):
+        if not as_frame:
+            return to_sparse_matrix(X) if self.sparse_output else X.to_numpy()
+
+        return to_arrow(X) if self.arrow_output else X
+
+    def _transform(self, X):
+        X = self._project(X)
+        for transformer in self._steps:
             X = transformer.transform(X)
 
         return X
 
+    def _cast_output(self, X):
+        # The plan computes every number as float64, they are cast to the
+        # dtypes the steps returned when fitting
+        dtypes = {}
+        for column, dtype in self._output_dtypes.items():
+            if dtype.kind not in "biuf" or X[column].dtype == dtype:
+                continue
+
+            if dtype.kind in "biu" and X[column].isna().any():
+                dtype = np.dtype(np.float32)
+            dtypes[column] = dtype
+
+        return X.astype(dtypes) if dtypes else X
+
+    def _align_dtypes(self, X):
+        # Chunks read from files may infer other dtypes than the fitted data,
+        # e.g. integers in a chunk of a float column or dates left as strings
+        X = X.copy(deep=False)
+
+        for column, dtype in self._input_dtypes.items():
+            if column in X.columns and X[column].dtype != dtype:
+                try:
+                    X[column] = X[column].astype(dtype)
+                except (TypeError, ValueError):
+                    pass
+
+        return X
+
+    def transform_stream(self, source, chunksize=100_000, output=None, **read_kwargs):
+        """
+        Transforms a table chunk by chunk, so it never has to fit in memory.
+
+        Rows are transformed independently, so the chunks match the same rows
+        of a full-table transform. Peak memory is bounded by the chunk size.
+        Only the columns in `required_input_columns_` are read from files.
+
+        Args:
+            source: Iterable of DataFrame or Arrow record batch chunks, or path
+                to a CSV or Parquet file read in chunks.
+            chunksize (int, optional): Rows per chunk read from a file.
+                Defaults to 100_000.
+            output (optional): Path of a Parquet file where the transformed
+                chunks are written instead of being returned.
+            **read_kwargs: Extra arguments for `pd.read_csv` or
+                `pyarrow.parquet.ParquetFile.iter_batches`.
+
+        Returns:
+            Optional[Iterator[pd.DataFrame]]: Transformed chunks, as Arrow
+            tables with `arrow_output`, or None when they are written to
+            `output`.
+
+        Raises:
+            ValueError: If the transformer is not fitted.
+        """
+        if self._input_dtypes is None:
+            raise ValueError("CrossTransformer must be fitted before transforming")
+
+        columns = getattr(self, "required_input_columns_", None)
+        chunks = (
+            self.transform(self._align_dtypes(from_arrow(chunk)))
+            for chunk in read_chunks(source, chunksize, columns=columns, **read_kwargs)
+        )
+
+        if output is None:
+            return chunks
+
+        write_parquet(chunks, output)
+        return None
+
     def fit_transform(self, X, y=None):
-        X = X.copy()
-        for transformer in self.transformations:
+        X = from_arrow(X)
+        self._input_dtypes = X.dtypes
+        self._plan = None
+        self._own_steps()
+
+        step_columns = [list(X.columns)]
+        if self.copy:
+            X = X.copy()
+        for transformer in self._steps:
             X = transformer.fit_transform(X, y)
+            step_columns.append(list(X.columns))
 
-        return X
+        self._output_dtypes = X.dtypes
+        self.required_input_columns_ = self._required_columns(step_columns)
+        return to_arrow(X) if self.arrow_output else X
+
+    def save(self, path):
+        """
+        Saves the fitted transformer in a compact, versioned format.
+
+        The folder holds a JSON file with the transformations, their parameters
+        and fitted state, and a binary store with every fitted array, which
+        `load` can memory-map. Unlike pickle, loading only rebuilds an
+        allowlist of classes and functions: the estimators of the
+        transformations and the helpers their fitted state is rebuilt with.
+
+        Args:
+            path: Folder where the transformer is written.
+
+        Raises:
+            ValueError: If the transformer is not fitted.
+        """
+        if self._steps is None:
+            raise ValueError("CrossTransformer must be fitted before saving")
+
+        # The parameters are those of the given transformations, the fitted
+        # state that of the steps cloned from them
+        transformations = []
+        for given, transformer in zip(self.transformations, self._steps):
+            params = given.get_params()
+            state = {k: v for k, v in vars(transformer).items() if k not in params}
+            transformations.append(
+                {"name": type(transformer).__name__, "params": params, "state": state}
+            )
+
+        save_state(
+            {
+                "transformations": transformations,
+                "input_dtypes": self._input_dtypes,
+                "output_dtypes": self._output_dtypes,
+                "required_input_columns": getattr(
+                    self, "required_input_columns_", None
+                ),
+                "copy": self.copy,
+                "dtype_policy": self.dtype_policy,
+                "sparse_output": self.sparse_output,
+                "arrow_output": self.arrow_output,
+                "compiled": self._plan is not None,
+            },
+            path,
+        )
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Loads a transformer written by `save`.
+
+        Args:
+            path: Folder written by `save`.
+            mmap (bool, optional): Whether to memory-map the fitted arrays, for
+                a near-instant load. Defaults to True.
+
+        Returns:
+            CrossTransformer: The fitted transformer, compiled if it was saved
+            compiled.
+        """
+        document = load_state(path, mmap=mmap)
+
+        transformations, steps = [], []
+        for transformation in document["transformations"]:
+            name, params = transformation["name"], transformation["params"]
+            step = get_transformer(name, params)
+            vars(step).update(transformation["state"])
+            transformations.append(get_transformer(name, params))
+            steps.append(step)
+
+        transformer = cls(
+            transformations,
+            copy=document["copy"],
+            dtype_policy=document["dtype_policy"],
+            sparse_output=document["sparse_output"],
+            arrow_output=document["arrow_output"],
+        )
+        transformer._steps = steps
+        transformer._configure_steps()
+        transformer._input_dtypes = document["input_dtypes"]
+        transformer._output_dtypes = document["output_dtypes"]
+        if document["required_input_columns"] is not None:
+            transformer.required_input_columns_ = document["required_input_columns"]
+
+        if document["compiled"]:
+            transformer.compile()
+
+        return transformer
+
+    def __getstate__(self):
+        # Compiled kernels are not picklable, the plan is rebuilt on load
+        state = dict(super().__getstate__())
+        state["_plan"] = state.get("_plan") is not None
+        return state
+
+    def __setstate__(self, state):
+        compiled = state.pop("_plan", False)
+        # Transformers pickled before the steps were cloned fitted their
+        # transformations themselves
+        state.setdefault("_steps", state.get("transformations"))
+        super().__setstate__(state)
+
+        self._plan = None
+        if compiled:
+            self.compile()
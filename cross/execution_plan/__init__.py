@@ -0,0 +1 @@
+from .execution_plan import ExecutionPlan
@@ -0,0 +1,235 @@
+import joblib
+import numpy as np
+import pandas as pd
+
+from cross.transformations.utils.arrow import numeric_values
+
+from .kernels import COMPILERS
+from .layout import DATETIME, NUMBER, Layout
+
+
+class ExecutionPlan:
+    """
+    Runs a list of fitted transformers as NumPy operations on one buffer.
+
+    Every column is resolved to a position once, when the plan is built. At
+    transform time the numeric columns are copied into a single preallocated
+    2-D float64 buffer and every step updates it in place; categorical and
+    datetime columns are kept as 1-D arrays. The result is only wrapped in a
+    DataFrame at the end, if requested.
+
+    Rows are transformed independently, so large inputs can be split into
+    row blocks that run on a pool of threads; most kernels are NumPy
+    operations that release the GIL.
+
+    Numeric output columns are float64, whatever their dtype in the input.
+
+    Args:
+        transformations (list): Fitted transformers from `cross.transformations`.
+        dtypes (pd.Series): Dtypes of the input columns, indexed by column name.
+
+    Raises:
+        ValueError: If a transformer or a column cannot be compiled.
+    """
+
+    def __init__(self, transformations, dtypes: pd.Series):
+        layout = Layout(dtypes)
+        self._inputs = layout.entries()
+        self._kernels = []
+
+        for transformer in transformations:
+            compile_step = COMPILERS.get(type(transformer))
+            if compile_step is None:
+                raise ValueError(
+                    f"Transformer {type(transformer).__name__} cannot be compiled"
+                )
+
+            self._kernels.extend(compile_step(transformer, layout))
+
+        self._outputs = layout.entries()
+        self._output_slots = [ref for _, _, ref in self._outputs]
+        self._numeric_output = all(kind == NUMBER for _, kind, _ in self._outputs)
+        self._number_slots = [ref for _, kind, ref in self._outputs if kind == NUMBER]
+        self._n_slots = layout.n_slots
+
+    @property
+    def input_columns(self) -> list:
+        return [column for column, _, _ in self._inputs]
+
+    @property
+    def output_columns(self) -> list:
+        return [column for column, _, _ in self._outputs]
+
+    def _load(self, X: pd.DataFrame, rows: slice = slice(None)):
+        n_rows = len(X.index[rows])
+        buffer = np.empty((n_rows, self._n_slots), dtype=np.float64, order="F")
+        arrays = {}
+
+        for column, kind, ref in self._inputs:
+            # Only the columns and rows of the plan are read
+            values = X[column].iloc[rows]
+
+            if kind == NUMBER:
+                # Arrow-backed columns are read from a view of their buffers
+                values = numeric_values(values)
+                buffer[:, ref] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+            elif kind == DATETIME:
+                if getattr(values.dt, "tz", None) is not None:
+                    values = values.dt.tz_localize(None)
+                arrays[ref] = values.to_numpy()
+
+            else:
+                # Copied, as the steps modify these arrays in place. Nulls of
+                # Arrow-backed columns are read as NaN, like NumPy-backed ones
+                arrays[ref] = np.array(
+                    values.to_numpy(dtype=object, na_value=np.nan), copy=True
+                )
+
+        return buffer, arrays
+
+    def _load_records(self, records: list):
+        buffer = np.empty((len(records), self._n_slots), dtype=np.float64, order="F")
+        arrays = {}
+
+        for column, kind, ref in self._inputs:
+            values = [record.get(column) for record in records]
+
+            if kind == NUMBER:
+                buffer[:, ref] = np.array(values, dtype=np.float64)
+
+            elif kind == DATETIME:
+                arrays[ref] = np.array(values, dtype="datetime64[ns]")
+
+            else:
+                arrays[ref] = np.empty(len(values), dtype=object)
+                arrays[ref][:] = values
+                # Missing values are read as NaN, like those of a DataFrame
+                arrays[ref][pd.isna(arrays[ref])] = np.nan
+
+        return buffer, arrays
+
+    def _run(self, buffer: np.ndarray, arrays: dict) -> np.ndarray:
+        for kernel in self._kernels:
+            kernel(buffer, arrays)
+
+        if self._numeric_output:
+            return buffer[:, self._output_slots]
+
+        values = np.empty((len(buffer), len(self._outputs)), dtype=object)
+        for i, (_, kind, ref) in enumerate(self._outputs):
+            values[:, i] = buffer[:, ref] if kind == NUMBER else arrays[ref]
+
+        return values
+
+    def _allocate(self, X: pd.DataFrame):
+        numbers = np.empty(
+            (len(X), len(self._number_slots)), dtype=np.float64, order="F"
+        )
+        arrays = {}
+
+        for column, kind, ref in self._outputs:
+            if kind == DATETIME:
+                # Datetime outputs are input columns passed through, Arrow-backed
+                # ones are loaded as their NumPy equivalent
+                dtype = X[ref].dtype
+                dtype = getattr(dtype, "numpy_dtype", dtype)
+                arrays[column] = np.empty(len(X), dtype=dtype.base)
+            elif kind != NUMBER:
+                arrays[column] = np.empty(len(X), dtype=object)
+
+        return numbers, arrays
+
+    def _run_block(self, X: pd.DataFrame, rows: slice, numbers, outputs: dict):
+        buffer, arrays = self._load(X, rows)
+        for kernel in self._kernels:
+            kernel(buffer, arrays)
+
+        numbers[rows] = buffer[:, self._number_slots]
+        for column, kind, ref in self._outputs:
+            if kind != NUMBER:
+                outputs[column][rows] = arrays[ref]
+
+    def transform(self, X: pd.DataFrame, as_frame: bool = True, n_jobs=None):
+        """
+        Applies the compiled transformations to X.
+
+        Args:
+            X (pd.DataFrame): Data with the input columns of the plan. Other
+                columns are not read.
+            as_frame (bool, optional): Whether to return a DataFrame instead of
+                a NumPy array. Defaults to True.
+            n_jobs (int, optional): Number of threads transforming blocks of
+                rows, -1 for all cores. Defaults to None (one thread).
+
+        Returns:
+            Union[pd.DataFrame, np.ndarray]: Transformed data.
+        """
+        missing = [column for column in self.input_columns if column not in X]
+        if missing:
+            raise ValueError(
+                f"X is missing columns the plan was compiled for: {missing}"
+            )
+
+        # Every block writes its rows into the preallocated outputs, so the
+        # result is the same whatever the number of blocks, without concatenating
+        numbers, arrays = self._allocate(X)
+        n_blocks = max(min(joblib.effective_n_jobs(n_jobs), len(X)), 1)
+        bounds = np.linspace(0, len(X), n_blocks + 1).astype(int)
+        blocks = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+        if n_blocks == 1:
+            self._run_block(X, blocks[0], numbers, arrays)
+        else:
+            joblib.Parallel(n_jobs=n_blocks, backend="threading")(
+                joblib.delayed(self._run_block)(X, rows, numbers, arrays)
+                for rows in blocks
+            )
+
+        if self._numeric_output:
+            if not as_frame:
+                return numbers
+
+            return pd.DataFrame(
+                numbers, columns=self.output_columns, index=X.index, copy=False
+            )
+
+        columns, j = {}, 0
+        for column, kind, _ in self._outputs:
+            if kind == NUMBER:
+                columns[column] = numbers[:, j]
+                j += 1
+            else:
+                columns[column] = arrays[column]
+
+        if not as_frame:
+            values = np.empty((len(X), len(columns)), dtype=object)
+            for i, column_values in enumerate(columns.values()):
+                values[:, i] = column_values
+            return values
+
+        return pd.DataFrame(columns, columns=self.output_columns, index=X.index)
+
+    def transform_records(self, records: list, as_dict: bool = False):
+        """
+        Applies the compiled transformations to rows given as dictionaries.
+
+        No DataFrame is built, which keeps the latency of single rows and
+        micro-batches low. Missing keys are treated as missing values.
+
+        Args:
+            records (list): Dictionaries mapping input columns to values.
+            as_dict (bool, optional): Whether to return each row as a dictionary
+                instead of a NumPy array. Defaults to False.
+
+        Returns:
+            Union[np.ndarray, List[dict]]: Transformed rows.
+        """
+        buffer, arrays = self._load_records(records)
+        values = self._run(buffer, arrays)
+
+        if not as_dict:
+            return values
+
+        columns = self.output_columns
+        return [dict(zip(columns, row)) for row in values.tolist()]
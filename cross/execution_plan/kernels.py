@@ -0,0 +1,611 @@
+import copy
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+from sklearn.decomposition import PCA, TruncatedSVD
+
+from cross.transformations import (
+    CategoricalEncoding,
+    ColumnSelection,
+    CyclicalFeaturesTransformer,
+    DateTimeTransformer,
+    DimensionalityReduction,
+    MathematicalOperations,
+    MissingValuesHandler,
+    MissingValuesIndicator,
+    NonLinearTransformation,
+    Normalization,
+    NumericalBinning,
+    OutliersHandler,
+    QuantileTransformation,
+    ScaleTransformation,
+    SplineTransformation,
+)
+
+from .layout import DATETIME, NUMBER, OBJECT
+
+# Each compile function receives a fitted transformer and the layout of the
+# columns before it, updates the layout with its output columns and returns
+# kernels that run the step in place: kernel(buffer, arrays)
+
+
+def _without_feature_names(estimator):
+    """Copy of a fitted estimator that accepts arrays without a warning."""
+    estimator = copy.copy(estimator)
+    if hasattr(estimator, "feature_names_in_"):
+        del estimator.feature_names_in_
+
+    return estimator
+
+
+def _column_values(buffer, arrays, kind, ref):
+    return buffer[:, ref] if kind == NUMBER else arrays[ref]
+
+
+# Below this number of rows, dictionary lookups are faster than an Index
+SMALL_BATCH = 64
+
+
+def _positions(values, categories, lookup):
+    """Positions of values among the fitted categories, -1 when unseen."""
+    if len(values) <= SMALL_BATCH:
+        return np.fromiter((lookup.get(v, -1) for v in values), np.intp, len(values))
+
+    return categories.get_indexer(values)
+
+
+def _encoder_categories(encoder):
+    """Categories seen by a category_encoders encoder, if it exposes them."""
+    ordinal_encoder = getattr(encoder, "ordinal_encoder", None)
+    if ordinal_encoder is None:
+        return None
+
+    categories = ordinal_encoder.mapping[0]["mapping"].index
+    return categories[~categories.isna()]
+
+
+def _categorical_encoding(transformer, layout):
+    kernels = []
+
+    for column, transformation in transformer.transformation_options.items():
+        kind, ref = layout.source(column)
+        encoder = transformer._encoders[column]
+
+        def fill_unknown(buffer, arrays, kind=kind, ref=ref, column=column):
+            values = _column_values(buffer, arrays, kind, ref).astype(object)
+            values[pd.isna(values)] = "Unknown"
+            arrays[column] = values
+
+        kernels.append(fill_unknown)
+
+        if transformation in ["count", "label", "ordinal"]:
+            if transformation == "count":
+                mapping, default = pd.Series(encoder), 0
+            else:
+                # Categories unseen by the ordinal encoders are encoded as -1
+                mapping, default = pd.Series(encoder.mapping[0]["mapping"]), -1
+
+            categories = mapping.index
+            lookup = {category: i for i, category in enumerate(categories)}
+            # The last code is used for unseen categories (position -1)
+            codes = np.append(mapping.to_numpy(dtype=np.float64), default)
+            slot = layout.write_number(column)
+
+            def encode(
+                buffer,
+                arrays,
+                column=column,
+                categories=categories,
+                lookup=lookup,
+                codes=codes,
+                slot=slot,
+            ):
+                positions = _positions(arrays[column], categories, lookup)
+                buffer[:, slot] = codes[positions]
+
+            kernels.append(encode)
+
+        else:
+            encoder = _without_feature_names(encoder)
+            columns = list(encoder.get_feature_names_out([column]))
+            if transformation in ["hashing"]:
+                columns = [c.replace("col_", f"{column}_") for c in columns]
+
+            layout.drop([column])
+            slots = [layout.write_number(c) for c in columns]
+
+            # The encoding of every seen category is precomputed, the encoder is
+            # only called for the rows with unseen categories
+            categories = _encoder_categories(encoder)
+            if categories is None:
+                categories, table = pd.Index([]), np.empty((0, len(slots)))
+            else:
+                frame = pd.DataFrame({column: np.asarray(categories, dtype=object)})
+                table = np.asarray(encoder.transform(frame), dtype=float)
+
+            lookup = {category: i for i, category in enumerate(categories)}
+
+            def encode(
+                buffer,
+                arrays,
+                column=column,
+                encoder=encoder,
+                slots=slots,
+                categories=categories,
+                lookup=lookup,
+                table=table,
+            ):
+                values = arrays[column]
+                positions = _positions(values, categories, lookup)
+                unseen = positions < 0
+
+                encoded = np.empty((len(values), len(slots)))
+                encoded[~unseen] = table[positions[~unseen]]
+                if unseen.any():
+                    frame = pd.DataFrame({column: values[unseen]})
+                    encoded[unseen] = np.asarray(encoder.transform(frame), dtype=float)
+
+                buffer[:, slots] = encoded
+
+            kernels.append(encode)
+
+    return kernels
+
+
+def _column_selection(transformer, layout):
+    layout.select(transformer.features)
+    return []
+
+
+def _cyclical_features(transformer, layout):
+    kernels = []
+
+    for column, period in transformer.transformation_options.items():
+        source = layout.number(column)
+        sin_slot = layout.write_number(f"{column}_sin")
+        cos_slot = layout.write_number(f"{column}_cos")
+
+        def kernel(buffer, arrays, source=source, sin=sin_slot, cos=cos_slot, p=period):
+            angle = 2 * np.pi * buffer[:, source] / p
+            buffer[:, sin] = np.sin(angle)
+            buffer[:, cos] = np.cos(angle)
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _datetime_parts(values):
+    """Year, month, day, weekday, hour, minute and second of datetime64 values."""
+    days = values.astype("datetime64[D]")
+    months = values.astype("datetime64[M]")
+    seconds = (values - days).astype("timedelta64[s]").astype(np.int64)
+
+    parts = np.column_stack(
+        [
+            values.astype("datetime64[Y]").astype(np.int64) + 1970,
+            months.astype(np.int64) % 12 + 1,
+            (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+            # 1970-01-01 was a Thursday, weekday 3 with Monday as 0
+            (days.astype(np.int64) + 3) % 7,
+            seconds // 3600,
+            seconds % 3600 // 60,
+            seconds % 60,
+        ]
+    ).astype(np.float64)
+
+    parts[np.isnat(values)] = np.nan
+    return parts
+
+
+def _datetime(transformer, layout):
+    kernels = []
+    parts = ["year", "month", "day", "weekday", "hour", "minute", "second"]
+
+    for column in transformer.features:
+        if layout.kind(column) != DATETIME:
+            raise ValueError(f"Column '{column}' is not a datetime column")
+
+        slots = [layout.write_number(f"{column}_{part}") for part in parts]
+
+        def kernel(buffer, arrays, column=column, slots=slots):
+            buffer[:, slots] = _datetime_parts(arrays[column])
+
+        kernels.append(kernel)
+
+    layout.drop(transformer.features)
+    return kernels
+
+
+def _dimensionality_reduction(transformer, layout):
+    sources = [layout.number(column) for column in transformer.features]
+    reducer = _without_feature_names(transformer._reducer)
+    n_components = len(reducer.get_feature_names_out())
+
+    layout.drop(transformer.features)
+    slots = [
+        layout.write_number(f"{transformer.method}_{i + 1}")
+        for i in range(n_components)
+    ]
+
+    if isinstance(reducer, (PCA, TruncatedSVD)) and not getattr(reducer, "whiten", 0):
+        # Linear projections, computed as in scikit-learn
+        projection = reducer.components_.T
+        offset = reducer.mean_ @ projection if isinstance(reducer, PCA) else 0.0
+
+        def kernel(buffer, arrays):
+            reduced = buffer[:, sources] @ projection
+            reduced -= offset
+            buffer[:, slots] = reduced
+
+    else:
+
+        def kernel(buffer, arrays):
+            buffer[:, slots] = reducer.transform(buffer[:, sources])
+
+    return [kernel]
+
+
+def _mathematical_operations(transformer, layout):
+    operations = {
+        "add": np.add,
+        "subtract": np.subtract,
+        "multiply": np.multiply,
+        "divide": np.divide,
+        "modulus": np.mod,
+        "hypotenuse": np.hypot,
+        "mean": lambda a, b: (a + b) / 2,
+    }
+    kernels = []
+
+    for col1, col2, operation in transformer.operations_options:
+        first, second = layout.number(col1), layout.number(col2)
+        slot = layout.write_number(f"{col1}__{operation}__{col2}")
+        function = operations[operation]
+
+        def kernel(buffer, arrays, a=first, b=second, slot=slot, function=function):
+            with np.errstate(all="ignore"):
+                values = function(buffer[:, a], buffer[:, b])
+
+            values[~np.isfinite(values)] = 0
+            buffer[:, slot] = values
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _missing_values_handler(transformer, layout):
+    kernels = []
+
+    for column, action in transformer.transformation_options.items():
+        kind, ref = layout.source(column)
+
+        if action == "fill_0" and kind == NUMBER:
+
+            def kernel(buffer, arrays, slot=ref):
+                values = buffer[:, slot]
+                values[np.isnan(values)] = 0
+
+        elif action == "fill_0" and kind == OBJECT:
+
+            def kernel(buffer, arrays, column=ref):
+                values = arrays[column]
+                values[pd.isna(values)] = "Unknown"
+
+        elif action in ["mean", "median", "most_frequent"] and kind == NUMBER:
+            statistic = transformer._imputers[column].statistics_[0]
+
+            def kernel(buffer, arrays, slot=ref, statistic=statistic):
+                values = buffer[:, slot]
+                values[np.isnan(values)] = statistic
+
+        elif action == "most_frequent":
+            statistic = transformer._imputers[column].statistics_[0]
+
+            # Same definition of missing as scikit-learn's SimpleImputer
+            def kernel(buffer, arrays, column=ref, statistic=statistic):
+                values = arrays[column]
+                values[values != values] = statistic
+
+        elif action in ["mean", "median", "knn"]:
+            imputer = _without_feature_names(transformer._imputers[column])
+
+            def kernel(buffer, arrays, kind=kind, ref=ref, imputer=imputer):
+                values = _column_values(buffer, arrays, kind, ref)
+                imputed = imputer.transform(values.reshape(-1, 1)).ravel()
+                if kind == NUMBER:
+                    buffer[:, ref] = imputed
+                else:
+                    arrays[ref] = imputed
+
+        elif action == "fill_0":
+            raise ValueError(f"Column '{column}' cannot be filled with 0")
+
+        else:
+            continue
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _missing_values_indicator(transformer, layout):
+    sources = [layout.source(column) for column in transformer.features]
+    slots = [
+        layout.write_number(f"{column}__is_missing") for column in transformer.features
+    ]
+
+    def kernel(buffer, arrays):
+        for (kind, ref), slot in zip(sources, slots):
+            values = _column_values(buffer, arrays, kind, ref)
+            # Same definition of missing as scikit-learn's MissingIndicator
+            buffer[:, slot] = np.isnat(values) if kind == DATETIME else values != values
+
+    return [kernel]
+
+
+def _yeo_johnson(values, lmbda):
+    # Same formula as scikit-learn's PowerTransformer
+    out = np.empty_like(values)
+    positive = values >= 0
+
+    if abs(lmbda) < np.spacing(1.0):
+        out[positive] = np.log1p(values[positive])
+    else:
+        out[positive] = (np.power(values[positive] + 1, lmbda) - 1) / lmbda
+
+    if abs(lmbda - 2) > np.spacing(1.0):
+        out[~positive] = -(np.power(-values[~positive] + 1, 2 - lmbda) - 1) / (
+            2 - lmbda
+        )
+    else:
+        out[~positive] = -np.log1p(-values[~positive])
+
+    return out
+
+
+def _non_linear_transformation(transformer, layout):
+    kernels = []
+
+    for column, transformation in transformer.transformation_options.items():
+        slot = layout.number(column)
+
+        if transformation == "log":
+
+            def kernel(buffer, arrays, slot=slot):
+                np.log1p(buffer[:, slot], out=buffer[:, slot])
+
+        elif transformation == "exponential":
+
+            def kernel(buffer, arrays, slot=slot):
+                np.exp(buffer[:, slot], out=buffer[:, slot])
+
+        elif transformation == "yeo_johnson":
+            lmbda = transformer._transformers[column].lambdas_[0]
+
+            def kernel(buffer, arrays, slot=slot, lmbda=lmbda):
+                with np.errstate(invalid="ignore"):
+                    buffer[:, slot] = _yeo_johnson(buffer[:, slot], lmbda)
+
+        else:
+            continue
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _normalization(transformer, layout):
+    kernels = []
+
+    for column in transformer._transformers:
+        slot = layout.number(column)
+
+        # A single value normalized by its own l1 or l2 norm is its sign
+        def kernel(buffer, arrays, slot=slot):
+            np.sign(buffer[:, slot], out=buffer[:, slot])
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _numerical_binning(transformer, layout):
+    entries = layout.entries()
+
+    def fill_0(buffer, arrays):
+        for _, kind, ref in entries:
+            if kind == NUMBER:
+                values = buffer[:, ref]
+                values[np.isnan(values)] = 0
+            elif kind == OBJECT:
+                values = arrays[ref]
+                values[pd.isna(values)] = 0
+
+    kernels = [fill_0]
+
+    for column, (strategy, n_bins) in transformer.transformation_options.items():
+        source = layout.number(column)
+        edges = transformer._binners[column].bin_edges_[0][1:-1]
+        slot = layout.write_number(f"{column}__{strategy}_{n_bins}")
+
+        # Same binning as scikit-learn's KBinsDiscretizer
+        def kernel(buffer, arrays, source=source, slot=slot, edges=edges):
+            buffer[:, slot] = np.searchsorted(edges, buffer[:, source], side="right")
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _outliers_handler(transformer, layout):
+    kernels = []
+
+    for column, (action, method) in transformer.transformation_options.items():
+        slot = layout.number(column)
+        lower_bound, upper_bound = 0, 0
+
+        if method in ["iqr", "zscore"]:
+            lower_bound = transformer._bounds[column]["lower_bound"]
+            upper_bound = transformer._bounds[column]["upper_bound"]
+
+        if action == "cap":
+
+            def kernel(buffer, arrays, slot=slot, lower=lower_bound, upper=upper_bound):
+                np.clip(buffer[:, slot], lower, upper, out=buffer[:, slot])
+
+        elif action == "median" and method in ["iforest", "lof"]:
+            handler = transformer._handlers[column]
+            statistic = transformer._statistics[column]
+
+            def kernel(buffer, arrays, slot=slot, handler=handler, statistic=statistic):
+                values = buffer[:, slot]
+                rows = np.flatnonzero(~np.isnan(values))
+                outliers = handler.predict(values[rows].reshape(-1, 1)) == -1
+                values[rows[outliers]] = statistic
+
+        elif action == "median":
+            statistic = transformer._statistics[column]
+
+            def kernel(
+                buffer,
+                arrays,
+                slot=slot,
+                lower=lower_bound,
+                upper=upper_bound,
+                statistic=statistic,
+            ):
+                values = buffer[:, slot]
+                values[(values < lower) | (values > upper)] = statistic
+
+        else:
+            continue
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+# Distance to the extreme quantiles below which values are mapped to them, and
+# clipping of the normal output, as in scikit-learn's QuantileTransformer
+BOUNDS_THRESHOLD = 1e-7
+NORMAL_CLIP = (
+    ndtri(BOUNDS_THRESHOLD - np.spacing(1)),
+    ndtri(1 - (BOUNDS_THRESHOLD - np.spacing(1))),
+)
+
+
+def _quantiles(values, quantiles, references, normal):
+    # Same mapping as scikit-learn's QuantileTransformer
+    with np.errstate(invalid="ignore"):
+        if normal:
+            lower = values - BOUNDS_THRESHOLD < quantiles[0]
+            upper = values + BOUNDS_THRESHOLD > quantiles[-1]
+        else:
+            lower = values == quantiles[0]
+            upper = values == quantiles[-1]
+
+    out = values.copy()
+    finite = ~np.isnan(values)
+    out[finite] = 0.5 * (
+        np.interp(values[finite], quantiles, references)
+        - np.interp(-values[finite], -quantiles[::-1], -references[::-1])
+    )
+    out[upper] = 1
+    out[lower] = 0
+
+    if normal:
+        out = np.clip(ndtri(out), *NORMAL_CLIP)
+
+    return out
+
+
+def _quantile_transformation(transformer, layout):
+    kernels = []
+
+    for column, quantiles in transformer._transformers.items():
+        slot = layout.number(column)
+
+        def kernel(
+            buffer,
+            arrays,
+            slot=slot,
+            quantiles=quantiles.quantiles_[:, 0],
+            references=quantiles.references_,
+            normal=quantiles.output_distribution == "normal",
+        ):
+            buffer[:, slot] = _quantiles(buffer[:, slot], quantiles, references, normal)
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _scale_transformation(transformer, layout):
+    kernels = []
+
+    for column, scaler in transformer._transformers.items():
+        slot = layout.number(column)
+
+        if hasattr(scaler, "min_"):
+            # MinMaxScaler multiplies by its scale and adds its minimum
+            multiply, add = scaler.scale_[0], scaler.min_[0]
+
+            def kernel(buffer, arrays, slot=slot, multiply=multiply, add=add):
+                values = buffer[:, slot]
+                values *= multiply
+                values += add
+
+        else:
+            center = getattr(scaler, "mean_", getattr(scaler, "center_", None))
+            subtract = 0.0 if center is None else center[0]
+            divide = scaler.scale_[0]
+
+            def kernel(buffer, arrays, slot=slot, subtract=subtract, divide=divide):
+                values = buffer[:, slot]
+                values -= subtract
+                values /= divide
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+def _spline_transformation(transformer, layout):
+    kernels = []
+
+    for column, splines in transformer._transformers.items():
+        source = layout.number(column)
+        splines = _without_feature_names(splines)
+        slots = [
+            layout.write_number(f"{column}__spline_{i}")
+            for i in range(splines.n_features_out_)
+        ]
+
+        def kernel(buffer, arrays, source=source, slots=slots, splines=splines):
+            buffer[:, slots] = splines.transform(buffer[:, [source]])
+
+        kernels.append(kernel)
+
+    return kernels
+
+
+COMPILERS = {
+    CategoricalEncoding: _categorical_encoding,
+    ColumnSelection: _column_selection,
+    CyclicalFeaturesTransformer: _cyclical_features,
+    DateTimeTransformer: _datetime,
+    DimensionalityReduction: _dimensionality_reduction,
+    MathematicalOperations: _mathematical_operations,
+    MissingValuesHandler: _missing_values_handler,
+    MissingValuesIndicator: _missing_values_indicator,
+    NonLinearTransformation: _non_linear_transformation,
+    Normalization: _normalization,
+    NumericalBinning: _numerical_binning,
+    OutliersHandler: _outliers_handler,
+    QuantileTransformation: _quantile_transformation,
+    ScaleTransformation: _scale_transformation,
+    SplineTransformation: _spline_transformation,
+}
@@ -0,0 +1,95 @@
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+
+NUMBER = "number"
+OBJECT = "object"
+DATETIME = "datetime"
+
+
+def column_kind(dtype) -> str:
+    """Returns how the values of a column with the given dtype are stored."""
+    if is_datetime64_any_dtype(dtype):
+        return DATETIME
+
+    if is_numeric_dtype(dtype):
+        return NUMBER
+
+    return OBJECT
+
+
+class Layout:
+    """
+    Tracks where every column lives while the steps of a plan are compiled.
+
+    Numeric columns are stored in a slot (a column index) of a 2-D float64
+    buffer; categorical and datetime columns are kept as separate 1-D arrays
+    keyed by column name.
+    """
+
+    def __init__(self, dtypes):
+        self.columns = []
+        self.kinds = {}
+        self.slots = {}
+        self.n_slots = 0
+
+        for column, dtype in dtypes.items():
+            kind = column_kind(dtype)
+            if kind == NUMBER:
+                self.write_number(column)
+            else:
+                self.write_array(column, kind)
+
+    def _allocate(self) -> int:
+        self.n_slots += 1
+        return self.n_slots - 1
+
+    def kind(self, column) -> str:
+        if column not in self.kinds:
+            raise ValueError(f"Column '{column}' is not available at this step")
+
+        return self.kinds[column]
+
+    def source(self, column):
+        """Returns the kind of a column and its slot, or its name if not numeric."""
+        kind = self.kind(column)
+        return kind, self.slots[column] if kind == NUMBER else column
+
+    def number(self, column) -> int:
+        """Returns the slot of a numeric column."""
+        if self.kind(column) != NUMBER:
+            raise ValueError(f"Column '{column}' is not numeric")
+
+        return self.slots[column]
+
+    def write_number(self, column) -> int:
+        """Returns the slot a numeric column is written to, adding it if new."""
+        if column not in self.kinds:
+            self.columns.append(column)
+
+        if self.kinds.get(column) != NUMBER:
+            self.slots[column] = self._allocate()
+
+        self.kinds[column] = NUMBER
+        return self.slots[column]
+
+    def write_array(self, column, kind: str = OBJECT):
+        """Returns the key a categorical or datetime column is written to."""
+        if column not in self.kinds:
+            self.columns.append(column)
+
+        self.kinds[column] = kind
+        return column
+
+    def drop(self, columns):
+        for column in columns:
+            self.kind(column)
+            self.columns.remove(column)
+            del self.kinds[column]
+
+    def select(self, columns):
+        kinds = {column: self.kind(column) for column in columns}
+        self.columns = list(columns)
+        self.kinds = kinds
+
+    def entries(self):
+        """Returns the name, kind and slot (or name) of every current column."""
+        return [(column, *self.source(column)) for column in self.columns]
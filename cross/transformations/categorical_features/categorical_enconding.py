@@ -1,23 +1,73 @@
-import category_encoders as ce
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from cross.transformations.utils.arrow import object_frame
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import continuous, integral
+from cross.transformations.utils.running_statistics import FrequencyTable
+
+
+# Encodings whose columns only hold 0 and 1, which can be sparse
+_BINARY_ENCODINGS = ["binary", "dummy", "gray", "hashing", "onehot", "rankhot"]
+
+# Cells of the dense encodings computed at once when building sparse ones
+_SPARSE_CHUNK_CELLS = 2**22
+
+
+def _code_range(encoder):
+    mapping = encoder.mapping[0]["mapping"]
+    if isinstance(mapping, dict):
+        mapping = list(mapping.values())
+
+    # Unknown and missing categories are encoded as -1 and -2
+    codes = np.asarray(mapping, dtype=np.float64)
+    return min(np.nanmin(codes, initial=0), -2), np.nanmax(codes, initial=0)
+
+
+def _sparse_encode(encoder, values, column, n_columns):
+    # Every distinct value is encoded once, and each row takes the sparse
+    # encoding of its value, so the dense encoded matrix is never built
+    codes, uniques = pd.factorize(values[column])
+    chunk = max(_SPARSE_CHUNK_CELLS // max(n_columns, 1), 1)
+
+    tables = [sparse.csr_matrix((0, n_columns), dtype=np.int64)]
+    for start in range(0, len(uniques), chunk):
+        frame = pd.DataFrame({column: uniques[start : start + chunk]})
+        tables.append(sparse.csr_matrix(np.asarray(encoder.transform(frame))))
+
+    return sparse.vstack(tables, format="csr")[codes]
+
 
 class CategoricalEncoding(BaseEstimator, TransformerMixin):
     def __init__(
-        self, transformation_options=None, ordinal_orders=None, track_columns=False
+        self,
+        transformation_options=None,
+        ordinal_orders=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+        sparse_output=False,
     ):
         self.transformation_options = transformation_options or {}
         self.ordinal_orders = ordinal_orders
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
+        self.sparse_output = sparse_output
 
         self.tracked_columns = {}
         self._encoders = {}
+        self._frequencies = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
             "ordinal_orders": self.ordinal_orders,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+            "sparse_output": self.sparse_output,
         }
 
     def set_params(self, **params):
@@ -27,6 +77,7 @@ class CategoricalEncoding(BaseEstimator, TransformerMixin):
 
     def fit(self, X, y=None):
         self._encoders = {}
+        self._frequencies = {}
         X = X.copy()
 
         for column, transformation in self.transformation_options.items():
@@ -35,6 +86,9 @@ class CategoricalEncoding(BaseEstimator, TransformerMixin):
         return self
 
     def _fit_encoder(self, X, y, column, transformation):
+        # Imported on first use, as it is slow to import
+        import category_encoders as ce
+
         encoder_classes = {
             "backward_diff": ce.BackwardDifferenceEncoder,
             "basen": ce.BaseNEncoder,
@@ -75,23 +129,45 @@ class CategoricalEncoding(BaseEstimator, TransformerMixin):
         else:
             encoder_class = encoder_classes.get(transformation)
             self._encoders[column] = (
-                encoder_class().fit(X[[column]], y)
+                encoder_class().fit(object_frame(X, [column]), y)
                 if y is not None
-                else encoder_class().fit(X[[column]])
+                else encoder_class().fit(object_frame(X, [column]))
             )
 
+    def partial_fit(self, X, y=None):
+        for column, transformation in self.transformation_options.items():
+            if transformation != "count":
+                raise ValueError(
+                    f"partial_fit does not support the {transformation} encoding"
+                )
+
+            frequencies = self._frequencies.setdefault(column, FrequencyTable())
+            self._encoders[column] = frequencies.update(X[column]).to_dict()
+
+        return self
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
+
+        block = ColumnBlock(X.index)
+        replaced = []
+
         for column, transformation in self.transformation_options.items():
-            X[column] = X[column].fillna("Unknown")
-            X = self._transform_column(
-                X, column, transformation, self._encoders[column]
-            )
-        return X
+            values = object_frame(X, [column]).fillna("Unknown")
+            if self._transform_column(
+                block, values, column, transformation, self._encoders[column]
+            ):
+                replaced.append(column)
+
+        return block.attach(X, drop=replaced)
 
-    def _transform_column(self, X, column, transformation, transformer):
+    def _transform_column(self, block, values, column, transformation, transformer):
+        # Returns whether the column is replaced by new ones
         if transformation in ["label", "ordinal"]:
-            X[column] = transformer.transform(X[[column]])
+            codes = transformer.transform(values).iloc[:, 0]
+            low, high = _code_range(transformer)
+            block.add(column, integral(codes, low, high, self.dtype_policy))
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
@@ -117,26 +193,43 @@ class CategoricalEncoding(BaseEstimator, TransformerMixin):
             "target",
             "woe",
         ]:
-            encoded_array = transformer.transform(X[[column]])
             columns = transformer.get_feature_names_out([column])
 
             if transformation in ["hashing"]:
                 columns = [c.replace("col_", f"{column}_") for c in columns]
 
-            encoded_df = pd.DataFrame(encoded_array, columns=columns, index=X.index)
-            X = pd.concat([X.drop(columns=[column]), encoded_df], axis=1)
+            if self.sparse_output and transformation in _BINARY_ENCODINGS:
+                encoded_array = _sparse_encode(
+                    transformer, values, column, len(columns)
+                )
+            else:
+                encoded_array = np.asarray(transformer.transform(values))
+
+            if transformation in _BINARY_ENCODINGS:
+                encoded_array = integral(encoded_array, 0, 1, self.dtype_policy)
+            elif transformation == "basen":
+                base = transformer.base
+                encoded_array = integral(encoded_array, 0, base - 1, self.dtype_policy)
+            else:
+                encoded_array = continuous(encoded_array, self.dtype_policy)
+
+            block.extend(columns, encoded_array)
 
             if self.track_columns:
                 for new_column in columns:
                     self.tracked_columns[new_column] = [column]
 
+            return True
+
         elif transformation == "count":
-            X[column] = X[column].map(self._encoders[column]).fillna(0)
+            counts = values[column].map(self._encoders[column]).fillna(0)
+            high = max(self._encoders[column].values(), default=0)
+            block.add(column, integral(counts, 0, high, self.dtype_policy))
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
 
-        return X
+        return False
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
@@ -2,17 +2,32 @@ import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import PowerTransformer
 
+from cross.transformations.utils.arrow import numeric_frame, numeric_values
+from cross.transformations.utils.dtype_policy import continuous
+
 
 class NonLinearTransformation(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+    ):
         self.transformation_options = transformation_options
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._transformers = {}
 
     def get_params(self, deep=True):
-        return {"transformation_options": self.transformation_options}
+        return {
+            "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+        }
 
     def set_params(self, **params):
         for key, value in params.items():
@@ -26,24 +41,38 @@ class NonLinearTransformation(BaseEstimator, TransformerMixin):
         for column, transformation in self.transformation_options.items():
             if transformation == "yeo_johnson":
                 transformer = PowerTransformer(method="yeo-johnson", standardize=False)
-                transformer.fit(X[[column]])
+                transformer.fit(numeric_frame(X, [column]))
                 self._transformers[column] = transformer
 
         return self
 
+    def partial_fit(self, X, y=None):
+        if "yeo_johnson" in self.transformation_options.values():
+            raise ValueError(
+                "partial_fit does not support the yeo_johnson transformation"
+            )
+
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
         for column, transformation in self.transformation_options.items():
             if transformation == "log":
-                X[column] = np.log1p(X[column])
+                values = np.log1p(numeric_values(X[column]))
 
             elif transformation == "exponential":
-                X[column] = np.exp(X[column])
+                values = np.exp(numeric_values(X[column]))
 
             elif transformation == "yeo_johnson":
                 transformer = self._transformers[column]
-                X[column] = transformer.transform(X[[column]])
+                values = transformer.transform(numeric_frame(X, [column]))
+
+            else:
+                continue
+
+            X[column] = continuous(values, self.dtype_policy)
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
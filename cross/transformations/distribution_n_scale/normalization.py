@@ -1,17 +1,32 @@
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import Normalizer
 
+from cross.transformations.utils.arrow import numeric_frame
+from cross.transformations.utils.dtype_policy import continuous
+
 
 class Normalization(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+    ):
         self.transformation_options = transformation_options or {}
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._transformers = {}
 
     def get_params(self, deep=True):
-        return {"transformation_options": self.transformation_options}
+        return {
+            "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+        }
 
     def set_params(self, **params):
         for key, value in params.items():
@@ -25,16 +40,23 @@ class Normalization(BaseEstimator, TransformerMixin):
         for column, transformation in self.transformation_options.items():
             if transformation in ["l1", "l2"]:
                 transformer = Normalizer(norm=transformation)
-                transformer.fit(X[[column]])
+                transformer.fit(numeric_frame(X, [column]))
                 self._transformers[column] = transformer
 
         return self
 
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
         for column, transformer in self._transformers.items():
-            X[column] = transformer.transform(X[[column]])
+            X[column] = continuous(
+                transformer.transform(numeric_frame(X, [column])), self.dtype_policy
+            )
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
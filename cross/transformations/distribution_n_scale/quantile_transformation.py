@@ -1,19 +1,37 @@
+import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import QuantileTransformer
 
+from cross.transformations.utils.arrow import numeric_frame, numeric_values
+from cross.transformations.utils.dtype_policy import continuous
+from cross.transformations.utils.running_statistics import QuantileSketch
+
 
 class QuantileTransformation(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+    ):
         self.transformation_options = transformation_options or {}
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._transformers = {}
         self._n_quantiles = 1000
+        self._n_samples = 0
+        self._sketches = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -24,6 +42,7 @@ class QuantileTransformation(BaseEstimator, TransformerMixin):
 
     def fit(self, X, y=None):
         self._transformers = {}
+        self._sketches = {}
 
         n_samples = X.shape[0]
         self._n_quantiles = min(1000, n_samples)
@@ -33,16 +52,41 @@ class QuantileTransformation(BaseEstimator, TransformerMixin):
                 transformer = QuantileTransformer(
                     n_quantiles=self._n_quantiles, output_distribution=transformation
                 )
-                transformer.fit(X[[column]])
+                transformer.fit(numeric_frame(X, [column]))
+                self._transformers[column] = transformer
+
+        return self
+
+    def partial_fit(self, X, y=None):
+        self._n_samples += X.shape[0]
+        self._n_quantiles = min(1000, self._n_samples)
+
+        for column, transformation in self.transformation_options.items():
+            if transformation in ["uniform", "normal"]:
+                # Quantiles are estimated from a sketch of every chunk seen
+                sketch = self._sketches.setdefault(column, QuantileSketch())
+                sketch.update(numeric_values(X[column]))
+
+                # Missing values count towards the number of quantiles in fit
+                sample = sketch.sample()
+                padding = np.full(max(0, self._n_quantiles - len(sample)), np.nan)
+
+                transformer = QuantileTransformer(
+                    n_quantiles=self._n_quantiles, output_distribution=transformation
+                )
+                transformer.fit(pd.DataFrame({column: np.r_[sample, padding]}))
                 self._transformers[column] = transformer
 
         return self
 
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
         for column, transformer in self._transformers.items():
-            X[column] = transformer.transform(X[[column]])
+            X[column] = continuous(
+                transformer.transform(numeric_frame(X, [column])), self.dtype_policy
+            )
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
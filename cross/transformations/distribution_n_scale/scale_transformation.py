@@ -1,3 +1,4 @@
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import (
     MaxAbsScaler,
@@ -6,22 +7,36 @@ from sklearn.preprocessing import (
     StandardScaler,
 )
 
+from cross.transformations.utils.arrow import numeric_frame, numeric_values
+from cross.transformations.utils.dtype_policy import continuous
+from cross.transformations.utils.running_statistics import QuantileSketch
+
 
 class ScaleTransformation(BaseEstimator, TransformerMixin):
     def __init__(
-        self, transformation_options=None, quantile_range=None, track_columns=False
+        self,
+        transformation_options=None,
+        quantile_range=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
     ):
         self.transformation_options = transformation_options or {}
         self.quantile_range = quantile_range
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._transformers = {}
+        self._sketches = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
             "quantile_range": self.quantile_range,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -30,35 +45,61 @@ class ScaleTransformation(BaseEstimator, TransformerMixin):
 
         return self
 
+    def _scaler(self, column, transformation):
+        if transformation == "min_max":
+            return MinMaxScaler()
+
+        elif transformation == "standard":
+            return StandardScaler()
+
+        elif transformation == "robust":
+            quantile_range = self.quantile_range.get(column, (25.0, 75.0))
+            return RobustScaler(quantile_range=quantile_range)
+
+        elif transformation == "max_abs":
+            return MaxAbsScaler()
+
+        return None
+
     def fit(self, X, y=None):
         self._transformers = {}
+        self._sketches = {}
 
         for column, transformation in self.transformation_options.items():
-            if transformation == "min_max":
-                transformer = MinMaxScaler()
+            transformer = self._scaler(column, transformation)
+
+            if transformer is not None:
+                self._transformers[column] = transformer.fit(numeric_frame(X, [column]))
 
-            elif transformation == "standard":
-                transformer = StandardScaler()
+        return self
 
-            elif transformation == "robust":
-                quantile_range = self.quantile_range.get(column, (25.0, 75.0))
-                transformer = RobustScaler(quantile_range=quantile_range)
+    def partial_fit(self, X, y=None):
+        for column, transformation in self.transformation_options.items():
+            if transformation == "robust":
+                # Quantiles are estimated from a sketch of every chunk seen
+                sketch = self._sketches.setdefault(column, QuantileSketch())
+                sketch.update(numeric_values(X[column]))
 
-            elif transformation == "max_abs":
-                transformer = MaxAbsScaler()
+                transformer = self._scaler(column, transformation)
+                sample = pd.DataFrame({column: sketch.sample()})
+                self._transformers[column] = transformer.fit(sample)
 
-            else:
-                continue
+            elif transformation in ["min_max", "standard", "max_abs"]:
+                if column not in self._transformers:
+                    self._transformers[column] = self._scaler(column, transformation)
 
-            self._transformers[column] = transformer.fit(X[[column]])
+                self._transformers[column].partial_fit(numeric_frame(X, [column]))
 
         return self
 
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
         for column, scaler in self._transformers.items():
-            X[[column]] = scaler.transform(X[[column]])
+            X[column] = continuous(
+                scaler.transform(numeric_frame(X, [column])), self.dtype_policy
+            )
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
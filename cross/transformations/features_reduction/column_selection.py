@@ -2,14 +2,18 @@ from sklearn.base import BaseEstimator, TransformerMixin
 
 
 class ColumnSelection(BaseEstimator, TransformerMixin):
-    def __init__(self, features=None, track_columns=False):
+    def __init__(self, features=None, track_columns=False, copy=True):
         self.features = features
         self.track_columns = track_columns
+        self.copy = copy
 
         self.tracked_columns = {}
 
     def get_params(self, deep=True):
-        return {"features": self.features}
+        return {
+            "features": self.features,
+            "copy": self.copy,
+        }
 
     def set_params(self, **params):
         for key, value in params.items():
@@ -21,10 +25,12 @@ class ColumnSelection(BaseEstimator, TransformerMixin):
         # No fitting required, maintaining compatibility with scikit-learn API
         return self
 
-    def transform(self, X, y=None):
-        X = X.copy()
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
 
-        # Select only the specified columns from X
+    def transform(self, X, y=None):
+        # Selecting the columns already returns a new DataFrame
         X = X[self.features]
 
         if self.track_columns:
@@ -1,18 +1,25 @@
 import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.decomposition import PCA, FactorAnalysis, FastICA, KernelPCA, TruncatedSVD
-from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
-from sklearn.manifold import Isomap, LocallyLinearEmbedding
+
+from cross.transformations.utils.dtype_policy import continuous
 
 
 class DimensionalityReduction(BaseEstimator, TransformerMixin):
     def __init__(
-        self, features=None, method=None, n_components=None, track_columns=False
+        self,
+        features=None,
+        method=None,
+        n_components=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
     ):
         self.features = features
         self.method = method
         self.n_components = n_components
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._reducer = None
@@ -22,6 +29,8 @@ class DimensionalityReduction(BaseEstimator, TransformerMixin):
             "features": self.features,
             "method": self.method,
             "n_components": self.n_components,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -31,6 +40,17 @@ class DimensionalityReduction(BaseEstimator, TransformerMixin):
         return self
 
     def fit(self, X, y=None):
+        # Imported on first use, as they are slow to import
+        from sklearn.decomposition import (
+            PCA,
+            FactorAnalysis,
+            FastICA,
+            KernelPCA,
+            TruncatedSVD,
+        )
+        from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+        from sklearn.manifold import Isomap, LocallyLinearEmbedding
+
         X = X.copy()
         X = X[self.features]
 
@@ -76,7 +96,7 @@ class DimensionalityReduction(BaseEstimator, TransformerMixin):
     def transform(self, X, y=None):
         X_subset = X[self.features]
 
-        reduced_array = self._reducer.transform(X_subset)
+        reduced_array = continuous(self._reducer.transform(X_subset), self.dtype_policy)
         columns = [f"{self.method}_{i + 1}" for i in range(reduced_array.shape[1])]
 
         reduced_df = pd.DataFrame(
@@ -89,6 +109,11 @@ class DimensionalityReduction(BaseEstimator, TransformerMixin):
             for column in columns:
                 self.tracked_columns[column] = list(self.features)
 
+        if not self.copy:
+            X.drop(columns=self.features, inplace=True)
+            X[columns] = reduced_df
+            return X
+
         X = pd.concat([X.drop(columns=self.features), reduced_df], axis=1)
         return X
 
@@ -1,25 +1,40 @@
+import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.impute import KNNImputer, SimpleImputer
 
 from cross.transformations.utils import dtypes
+from cross.transformations.utils.arrow import object_frame
+from cross.transformations.utils.running_statistics import (
+    FrequencyTable,
+    QuantileSketch,
+    RunningMoments,
+)
 
 
 class MissingValuesHandler(BaseEstimator, TransformerMixin):
     def __init__(
-        self, transformation_options=None, n_neighbors=None, track_columns=False
+        self,
+        transformation_options=None,
+        n_neighbors=None,
+        track_columns=False,
+        copy=True,
     ):
         self.transformation_options = transformation_options
         self.n_neighbors = n_neighbors
         self.track_columns = track_columns
+        self.copy = copy
 
         self.tracked_columns = {}
         self._statistics = {}
         self._imputers = {}
+        self._running_statistics = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
             "n_neighbors": self.n_neighbors,
+            "copy": self.copy,
         }
 
     def set_params(self, **params):
@@ -31,22 +46,57 @@ class MissingValuesHandler(BaseEstimator, TransformerMixin):
     def fit(self, X, y=None):
         self._statistics = {}
         self._imputers = {}
+        self._running_statistics = {}
 
         for column, action in self.transformation_options.items():
             if action in ["mean", "median", "most_frequent"]:
                 imputer = SimpleImputer(strategy=action)
-                imputer.fit(X[[column]])
+                imputer.fit(object_frame(X, [column]))
                 self._imputers[column] = imputer
 
             elif action == "knn":
                 imputer = KNNImputer(n_neighbors=self.n_neighbors.get(column, 5))
-                imputer.fit(X[[column]])
+                imputer.fit(object_frame(X, [column]))
                 self._imputers[column] = imputer
 
         return self
 
+    def partial_fit(self, X, y=None):
+        running_classes = {
+            "mean": RunningMoments,
+            "median": QuantileSketch,
+            "most_frequent": FrequencyTable,
+        }
+
+        for column, action in self.transformation_options.items():
+            if action == "knn":
+                raise ValueError("partial_fit does not support knn imputation")
+
+            if action not in running_classes:
+                continue
+
+            statistics = self._running_statistics.setdefault(
+                column, running_classes[action]()
+            )
+            statistics.update(X[column])
+
+            if action == "mean":
+                statistic = statistics.mean if statistics.count else np.nan
+            elif action == "median":
+                statistic = statistics.quantile(0.5)
+            else:
+                statistic = statistics.most_frequent()
+
+            # An imputer fitted on the statistic alone imputes that statistic
+            imputer = SimpleImputer(strategy=action)
+            imputer.fit(pd.DataFrame({column: [statistic]}))
+            self._imputers[column] = imputer
+
+        return self
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
         cat_columns = dtypes.categorical_columns(X)
 
         for column, action in self.transformation_options.items():
@@ -56,7 +106,7 @@ class MissingValuesHandler(BaseEstimator, TransformerMixin):
 
             elif action in ["mean", "median", "most_frequent", "knn"]:
                 imputer = self._imputers[column]
-                X[column] = imputer.transform(X[[column]]).flatten()
+                X[column] = imputer.transform(object_frame(X, [column])).flatten()
 
             if self.track_columns:
                 self.tracked_columns[column] = [column]
@@ -2,17 +2,28 @@ import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.impute import MissingIndicator
 
+from cross.transformations.utils.arrow import object_frame
+from cross.transformations.utils.dtype_policy import indicator_dtype
+
 
 class MissingValuesIndicator(BaseEstimator, TransformerMixin):
-    def __init__(self, features=None, track_columns=False):
+    def __init__(
+        self, features=None, track_columns=False, copy=True, dtype_policy=None
+    ):
         self.features = features
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._indicator = None
 
     def get_params(self, deep=True):
-        return {"features": self.features}
+        return {
+            "features": self.features,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+        }
 
     def set_params(self, **params):
         for key, value in params.items():
@@ -22,17 +33,22 @@ class MissingValuesIndicator(BaseEstimator, TransformerMixin):
 
     def fit(self, X, y=None):
         self._indicator = MissingIndicator(features="all", sparse=False)
-        self._indicator.fit(X[self.features])
+        self._indicator.fit(object_frame(X, self.features))
         return self
 
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
-        transformed_array = self._indicator.transform(X[self.features])
+        transformed_array = self._indicator.transform(object_frame(X, self.features))
         columns = [f"{column}__is_missing" for column in self.features]
 
         encoded_df = pd.DataFrame(
-            transformed_array.astype(int),
+            transformed_array.astype(indicator_dtype(self.dtype_policy)),
             columns=columns,
             index=X.index,
         )
@@ -1,7 +1,11 @@
 import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.ensemble import IsolationForest
-from sklearn.neighbors import LocalOutlierFactor
+
+from cross.transformations.utils.arrow import numeric_frame, numeric_values
+from cross.transformations.utils.running_statistics import (
+    QuantileSketch,
+    RunningMoments,
+)
 
 
 class OutliersHandler(BaseEstimator, TransformerMixin):
@@ -12,17 +16,20 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
         lof_params=None,
         iforest_params=None,
         track_columns=False,
+        copy=True,
     ):
         self.transformation_options = transformation_options
         self.thresholds = thresholds
         self.lof_params = lof_params
         self.iforest_params = iforest_params
         self.track_columns = track_columns
+        self.copy = copy
 
         self.tracked_columns = {}
         self._statistics = {}
         self._bounds = {}
         self._handlers = {}
+        self._running_statistics = {}
 
     def get_params(self, deep=True):
         return {
@@ -30,6 +37,7 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
             "thresholds": self.thresholds,
             "lof_params": self.lof_params,
             "iforest_params": self.iforest_params,
+            "copy": self.copy,
         }
 
     def set_params(self, **params):
@@ -42,6 +50,7 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
         self._statistics = {}
         self._bounds = {}
         self._handlers = {}
+        self._running_statistics = {}
 
         for column, (action, method) in self.transformation_options.items():
             # Specific methods fit
@@ -65,11 +74,17 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
         return self
 
     def _apply_lof(self, df, column):
+        # Imported on first use, as it is slow to import
+        from sklearn.neighbors import LocalOutlierFactor
+
         lof = LocalOutlierFactor(**self.lof_params[column], novelty=True)
         lof.fit(np.array(df[[column]]))
         self._handlers[column] = lof
 
     def _apply_iforest(self, df, column):
+        # Imported on first use, as it is slow to import
+        from sklearn.ensemble import IsolationForest
+
         iforest = IsolationForest(**self.iforest_params[column])
         iforest.fit(np.array(df[[column]]))
         self._handlers[column] = iforest
@@ -78,25 +93,57 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
         if method == "iqr":
             q1 = df[column].quantile(0.25)
             q3 = df[column].quantile(0.75)
-            iqr = q3 - q1
-
-            lower_bound = q1 - self.thresholds[column] * iqr
-            upper_bound = q3 + self.thresholds[column] * iqr
+            return self._threshold_bounds(column, q1, q3, q3 - q1)
 
         elif method == "zscore":
             mean = df[column].mean()
             std = df[column].std()
+            return self._threshold_bounds(column, mean, mean, std)
 
-            lower_bound = mean - self.thresholds[column] * std
-            upper_bound = mean + self.thresholds[column] * std
+        return 0, 0
 
-        else:
-            lower_bound, upper_bound = 0, 0
+    def _threshold_bounds(self, column, low, high, spread):
+        lower_bound = low - self.thresholds[column] * spread
+        upper_bound = high + self.thresholds[column] * spread
 
         return lower_bound, upper_bound
 
+    def partial_fit(self, X, y=None):
+        for column, (action, method) in self.transformation_options.items():
+            if method not in ["iqr", "zscore"]:
+                raise ValueError(f"partial_fit does not support the {method} method")
+
+            moments, sketch = self._running_statistics.setdefault(
+                column, (RunningMoments(), QuantileSketch())
+            )
+            moments.update(numeric_values(X[column]))
+            if method == "iqr" or action == "median":
+                sketch.update(numeric_values(X[column]))
+
+            if method == "iqr":
+                q1, q3 = sketch.quantile([0.25, 0.75])
+                lower_bound, upper_bound = self._threshold_bounds(
+                    column, q1, q3, q3 - q1
+                )
+
+            else:
+                lower_bound, upper_bound = self._threshold_bounds(
+                    column, moments.mean, moments.mean, moments.std()
+                )
+
+            self._bounds[column] = {
+                "lower_bound": lower_bound,
+                "upper_bound": upper_bound,
+            }
+
+            if action == "median":
+                self._statistics[column] = sketch.quantile(0.5)
+
+        return self
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
 
         for column, (action, method) in self.transformation_options.items():
             lower_bound, upper_bound = 0, 0
@@ -105,22 +152,26 @@ class OutliersHandler(BaseEstimator, TransformerMixin):
                 lower_bound = self._bounds[column]["lower_bound"]
                 upper_bound = self._bounds[column]["upper_bound"]
 
+            values = numeric_values(X[column])
+
             if action == "cap":
-                X[column] = np.clip(X[column], lower_bound, upper_bound)
+                X[column] = np.clip(values, lower_bound, upper_bound)
 
             elif action == "median":
                 if method in ["iforest", "lof"]:
                     handler = self._handlers[column]
-                    y_pred = handler.predict(np.array(X[[column]].dropna()))
+                    y_pred = handler.predict(
+                        np.array(numeric_frame(X, [column]).dropna())
+                    )
                     outliers = y_pred == -1
 
                 elif method in ["iqr", "zscore"]:
-                    outliers = (X[column] < lower_bound) | (X[column] > upper_bound)
+                    outliers = (values < lower_bound) | (values > upper_bound)
 
                 X[column] = np.where(
                     outliers,
                     self._statistics[column],
-                    X[column],
+                    values,
                 )
 
             if self.track_columns:
@@ -1,17 +1,27 @@
 import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from cross.transformations.utils.arrow import numeric_values
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import continuous
+
 
 class MathematicalOperations(BaseEstimator, TransformerMixin):
-    def __init__(self, operations_options=None, track_columns=False):
+    def __init__(
+        self, operations_options=None, track_columns=False, copy=True, dtype_policy=None
+    ):
         self.operations_options = operations_options or []
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
 
     def get_params(self, deep=True):
         return {
             "operations_options": self.operations_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -24,43 +34,51 @@ class MathematicalOperations(BaseEstimator, TransformerMixin):
         # No fitting required for this transformer, maintaining compatibility with scikit-learn API
         return self
 
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
+
+        block = ColumnBlock(X.index)
 
         for col1, col2, operation in self.operations_options:
             new_column = f"{col1}__{operation}__{col2}"
+            # Operations can use the columns created by the previous ones
+            a = block[col1] if col1 in block else numeric_values(X[col1])
+            b = block[col2] if col2 in block else numeric_values(X[col2])
 
             if operation == "add":
-                X[new_column] = X[col1] + X[col2]
+                values = a + b
 
             elif operation == "subtract":
-                X[new_column] = X[col1] - X[col2]
+                values = a - b
 
             elif operation == "multiply":
-                X[new_column] = X[col1] * X[col2]
+                values = a * b
 
             elif operation == "divide":
-                X[new_column] = X[col1] / X[col2]
+                values = a / b
 
             elif operation == "modulus":
-                X[new_column] = X[col1] % X[col2]
+                values = a % b
 
             elif operation == "hypotenuse":
-                X[new_column] = np.hypot(X[col1], X[col2])
+                values = np.hypot(a, b)
 
             elif operation == "mean":
-                X[new_column] = (X[col1] + X[col2]) / 2
+                values = (a + b) / 2
 
             # Prevent NaNs
-            X[new_column] = X[new_column].replace([np.inf, -np.inf], np.nan).fillna(0)
-
-            # Prevent fragmentation by explicitly copying the DataFrame
-            X = X.copy()
+            values = values.replace([np.inf, -np.inf], np.nan).fillna(0)
+            block.add(new_column, continuous(values, self.dtype_policy))
 
             if self.track_columns:
                 self.tracked_columns[new_column] = [col1, col2]
 
-        return X
+        return block.attach(X)
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
@@ -1,18 +1,36 @@
+import numpy as np
+import pandas as pd
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import KBinsDiscretizer
 
+from cross.transformations.utils.arrow import numeric_frame, object_values
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import integral
+from cross.transformations.utils.running_statistics import QuantileSketch
+
 
 class NumericalBinning(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+    ):
         self.transformation_options = transformation_options or {}
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
         self._binners = {}
+        self._sketches = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -23,6 +41,7 @@ class NumericalBinning(BaseEstimator, TransformerMixin):
 
     def fit(self, X, y=None):
         self._binners = {}
+        self._sketches = {}
         X = X.copy()
 
         for column, (strategy, n_bins) in self.transformation_options.items():
@@ -31,24 +50,61 @@ class NumericalBinning(BaseEstimator, TransformerMixin):
             binner = KBinsDiscretizer(
                 n_bins=n_bins, encode="ordinal", strategy=strategy
             )
-            binner.fit(X[[column]])
+            binner.fit(numeric_frame(X, [column]))
+            self._binners[column] = binner
+
+        return self
+
+    def partial_fit(self, X, y=None):
+        for column, (strategy, n_bins) in self.transformation_options.items():
+            # Bin edges are estimated from a sketch of every chunk seen
+            sketch = self._sketches.setdefault(column, QuantileSketch())
+            sketch.update(X[column].fillna(0))
+
+            binner = KBinsDiscretizer(
+                n_bins=n_bins, encode="ordinal", strategy=strategy
+            )
+            binner.fit(pd.DataFrame({column: sketch.sample()}))
             self._binners[column] = binner
 
         return self
 
     def transform(self, X, y=None):
-        X = X.copy().fillna(0)
+        # Arrow-backed text, dates and booleans cannot hold the 0 filled in,
+        # so they are filled as objects, like NumPy-backed ones
+        arrow_columns = [
+            column
+            for column, dtype in X.dtypes.items()
+            if isinstance(dtype, pd.ArrowDtype) and dtype.kind not in "iuf"
+        ]
+        if arrow_columns:
+            X = X.copy(deep=False)
+            for column in arrow_columns:
+                X[column] = object_values(X[column])
+
+        # Only NumPy numbers and objects can hold the 0 in place, other columns,
+        # e.g. str or datetime ones, are upcast to objects in a new frame
+        in_place = not self.copy and all(
+            isinstance(dtype, np.dtype) and dtype.kind in "biufO" for dtype in X.dtypes
+        )
+        if in_place:
+            X.fillna(0, inplace=True)
+        else:
+            X = X.fillna(0)
+
+        block = ColumnBlock(X.index)
 
         for column, (strategy, n_bins) in self.transformation_options.items():
             binner_name = f"{column}__{strategy}_{n_bins}"
             binner = self._binners[column]
 
-            X[binner_name] = binner.transform(X[[column]]).flatten()
+            bins = binner.transform(numeric_frame(X, [column])).flatten()
+            block.add(binner_name, integral(bins, 0, n_bins - 1, self.dtype_policy))
 
             if self.track_columns:
                 self.tracked_columns[binner_name] = [column]
 
-        return X
+        return block.attach(X)
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
@@ -1,11 +1,26 @@
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.preprocessing import SplineTransformer
 
+from cross.transformations.utils.arrow import numeric_frame
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import continuous, float_dtype
+
 
 class SplineTransformation(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+        sparse_output=False,
+    ):
         self.transformation_options = transformation_options or {}
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
+        self.sparse_output = sparse_output
 
         self.tracked_columns = {}
         self._transformers = {}
@@ -13,6 +28,9 @@ class SplineTransformation(BaseEstimator, TransformerMixin):
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
+            "sparse_output": self.sparse_output,
         }
 
     def set_params(self, **params):
@@ -26,26 +44,46 @@ class SplineTransformation(BaseEstimator, TransformerMixin):
 
         for column, options in self.transformation_options.items():
             transformer = SplineTransformer(**options)
-            transformer.fit(X[[column]])
+            transformer.fit(numeric_frame(X, [column]))
             self._transformers[column] = transformer
 
         return self
 
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
+
+        new_columns = {
+            column: [
+                f"{column}__spline_{i}" for i in range(transformer.n_features_out_)
+            ]
+            for column, transformer in self._transformers.items()
+        }
+
+        block = ColumnBlock(X.index)
+        if not self.sparse_output:
+            values = block.allocate(
+                sum(new_columns.values(), []), dtype=float_dtype(self.dtype_policy)
+            )
+        start = 0
 
         for column, transformer in self._transformers.items():
-            transformed_values = transformer.transform(X[[column]])
-            num_features = transformed_values.shape[1]
+            bases = transformer.transform(numeric_frame(X, [column]))
+            stop = start + len(new_columns[column])
 
-            for i in range(num_features):
-                new_column = f"{column}__spline_{i}"
-                X[new_column] = transformed_values[:, i]
+            if self.sparse_output:
+                # At most degree + 1 bases are not zero in each row
+                bases = continuous(bases, self.dtype_policy)
+                block.extend(new_columns[column], sparse.csc_matrix(bases))
+            else:
+                values[:, start:stop] = bases
+            start = stop
 
-                if self.track_columns:
+            if self.track_columns:
+                for new_column in new_columns[column]:
                     self.tracked_columns[new_column] = [column]
 
-        return X
+        return block.attach(X)
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
@@ -1,17 +1,31 @@
 import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from cross.transformations.utils.arrow import numeric_values
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import continuous
+
 
 class CyclicalFeaturesTransformer(BaseEstimator, TransformerMixin):
-    def __init__(self, transformation_options=None, track_columns=False):
+    def __init__(
+        self,
+        transformation_options=None,
+        track_columns=False,
+        copy=True,
+        dtype_policy=None,
+    ):
         self.transformation_options = transformation_options or {}
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
 
     def get_params(self, deep=True):
         return {
             "transformation_options": self.transformation_options,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -23,18 +37,26 @@ class CyclicalFeaturesTransformer(BaseEstimator, TransformerMixin):
     def fit(self, X, y=None):
         return self  # No fitting necessary, but required for compatibility
 
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
+
+        block = ColumnBlock(X.index)
 
         for column, period in self.transformation_options.items():
-            X[f"{column}_sin"] = np.sin(2 * np.pi * X[column] / period)
-            X[f"{column}_cos"] = np.cos(2 * np.pi * X[column] / period)
+            angle = 2 * np.pi * numeric_values(X[column]) / period
+            block.add(f"{column}_sin", continuous(np.sin(angle), self.dtype_policy))
+            block.add(f"{column}_cos", continuous(np.cos(angle), self.dtype_policy))
 
             if self.track_columns:
                 self.tracked_columns[f"{column}_sin"] = [column]
                 self.tracked_columns[f"{column}_cos"] = [column]
 
-        return X
+        return block.attach(X)
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
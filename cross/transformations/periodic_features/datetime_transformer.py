@@ -1,16 +1,37 @@
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from cross.transformations.utils.arrow import numeric_values
+from cross.transformations.utils.column_block import ColumnBlock
+from cross.transformations.utils.dtype_policy import integral
+
+# Range of each date part, to store it in the smallest integer dtype
+DATE_PARTS = {
+    "year": (1, 9999),
+    "month": (1, 12),
+    "day": (1, 31),
+    "weekday": (0, 6),
+    "hour": (0, 23),
+    "minute": (0, 59),
+    "second": (0, 59),
+}
+
 
 class DateTimeTransformer(BaseEstimator, TransformerMixin):
-    def __init__(self, features=None, track_columns=False):
+    def __init__(
+        self, features=None, track_columns=False, copy=True, dtype_policy=None
+    ):
         self.features = features or []
         self.track_columns = track_columns
+        self.copy = copy
+        self.dtype_policy = dtype_policy
 
         self.tracked_columns = {}
 
     def get_params(self, deep=True):
         return {
             "features": self.features,
+            "copy": self.copy,
+            "dtype_policy": self.dtype_policy,
         }
 
     def set_params(self, **params):
@@ -22,30 +43,26 @@ class DateTimeTransformer(BaseEstimator, TransformerMixin):
     def fit(self, X, y=None):
         return self  # No fitting necessary, but method required for compatibility
 
+    def partial_fit(self, X, y=None):
+        # Not fitted on the data, so fitting on any chunk is enough
+        return self.fit(X, y)
+
     def transform(self, X, y=None):
-        X = X.copy()
+        if self.copy:
+            X = X.copy()
+
+        block = ColumnBlock(X.index)
 
         for column in self.features:
-            X[f"{column}_year"] = X[column].dt.year
-            X[f"{column}_month"] = X[column].dt.month
-            X[f"{column}_day"] = X[column].dt.day
-            X[f"{column}_weekday"] = X[column].dt.weekday
-            X[f"{column}_hour"] = X[column].dt.hour
-            X[f"{column}_minute"] = X[column].dt.minute
-            X[f"{column}_second"] = X[column].dt.second
-
-            if self.track_columns:
-                self.tracked_columns[f"{column}_year"] = [column]
-                self.tracked_columns[f"{column}_month"] = [column]
-                self.tracked_columns[f"{column}_day"] = [column]
-                self.tracked_columns[f"{column}_weekday"] = [column]
-                self.tracked_columns[f"{column}_hour"] = [column]
-                self.tracked_columns[f"{column}_minute"] = [column]
-                self.tracked_columns[f"{column}_second"] = [column]
-
-        X = X.drop(columns=self.features)
-
-        return X
+            for part, (low, high) in DATE_PARTS.items():
+                new_column = f"{column}_{part}"
+                values = numeric_values(getattr(X[column].dt, part))
+                block.add(new_column, integral(values, low, high, self.dtype_policy))
+
+                if self.track_columns:
+                    self.tracked_columns[new_column] = [column]
+
+        return block.attach(X, drop=self.features)
 
     def fit_transform(self, X, y=None):
         return self.fit(X, y).transform(X, y)
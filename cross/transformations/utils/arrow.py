@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+
+def is_arrow_column(values: pd.Series) -> bool:
+    return isinstance(values.dtype, pd.ArrowDtype)
+
+
+def numpy_view(array) -> np.ndarray:
+    """
+    NumPy values of an Arrow-backed numeric array.
+
+    Integers and floats stored in a single chunk without nulls are viewed
+    without copying, as a read-only array. Other arrays are converted to
+    float64, with NaN for nulls.
+    """
+    chunks = array.__arrow_array__()
+
+    if array.dtype.kind in "iuf" and chunks.num_chunks == 1 and not chunks.null_count:
+        return chunks.chunk(0).to_numpy(zero_copy_only=True)
+
+    return array.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def numeric_values(values: pd.Series) -> pd.Series:
+    """
+    NumPy-backed values of a numeric column, read by the kernels of the steps.
+
+    Arrow-backed columns are viewed as NumPy arrays, so NumPy and scikit-learn
+    run over their buffers instead of converting them, and the results are
+    NumPy-backed. NumPy-backed columns are returned as is.
+    """
+    if not is_arrow_column(values):
+        return values
+
+    return pd.Series(
+        numpy_view(values.array), index=values.index, name=values.name, copy=False
+    )
+
+
+def object_values(values: pd.Series) -> pd.Series:
+    """
+    NumPy-backed values of a column that is not numeric, read by scikit-learn
+    and category_encoders.
+
+    Arrow-backed text, dates and booleans are converted to objects with NaN
+    for nulls, as NumPy-backed columns with missing values hold them. Other
+    columns are returned as is.
+    """
+    if not is_arrow_column(values) or values.dtype.kind in "iuf":
+        return values
+
+    return pd.Series(
+        values.to_numpy(dtype=object, na_value=np.nan),
+        index=values.index,
+        name=values.name,
+        copy=False,
+    )
+
+
+def numeric_frame(X: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """`X[columns]`, with Arrow-backed columns viewed as in `numeric_values`."""
+    frame = X[columns]
+    if not any(isinstance(dtype, pd.ArrowDtype) for dtype in frame.dtypes):
+        return frame
+
+    return pd.DataFrame(
+        {column: numeric_values(frame[column]) for column in columns},
+        index=frame.index,
+        copy=False,
+    )
+
+
+def object_frame(X: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """
+    `X[columns]`, with numeric Arrow-backed columns viewed as in
+    `numeric_values` and the others converted as in `object_values`.
+    """
+    frame = X[columns]
+    if not any(isinstance(dtype, pd.ArrowDtype) for dtype in frame.dtypes):
+        return frame
+
+    return pd.DataFrame(
+        {
+            column: numeric_values(frame[column])
+            if frame[column].dtype.kind in "iuf"
+            else object_values(frame[column])
+            for column in columns
+        },
+        index=frame.index,
+        copy=False,
+    )
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class ColumnBlock:
+    """
+    Columns created by a transformation, attached to the data at once.
+
+    Inserting columns one at a time copies or fragments the DataFrame on every
+    insertion, which is quadratic in the number of new columns. Instead, the
+    columns are written here, groups of them into arrays allocated once, and
+    `attach` joins them to the data with a single concat.
+
+    Groups given as SciPy sparse matrices become columns of `pd.SparseDtype`
+    with 0 as fill value, so they are never densified.
+
+    Args:
+        index (pd.Index): Index of the data the columns are added to.
+    """
+
+    def __init__(self, index: pd.Index):
+        self.index = index
+
+        # Groups of columns in insertion order: 2D arrays or sparse matrices,
+        # or dicts of 1D arrays
+        self._groups = []
+        self._locations = {}
+
+    def allocate(self, names: list, dtype=np.float64) -> np.ndarray:
+        """Adds columns and returns their values, uninitialized, to be filled."""
+        values = np.empty((len(self.index), len(names)), dtype=dtype, order="F")
+        return self.extend(names, values)
+
+    def extend(self, names: list, values):
+        """Adds the columns of a 2D array or SciPy sparse matrix."""
+        if sparse.issparse(values):
+            values = sparse.csc_matrix(values)
+        else:
+            values = np.asarray(values)
+
+        self._groups.append((list(names), values))
+
+        for position, name in enumerate(names):
+            self._locations[name] = (len(self._groups) - 1, position)
+
+        return values
+
+    def add(self, name, values):
+        """Adds a column from a 1D array or Series aligned with the data."""
+        if isinstance(values, pd.Series):
+            values = values.array
+
+        if not self._groups or not isinstance(self._groups[-1], dict):
+            self._groups.append({})
+
+        self._groups[-1][name] = values
+        self._locations[name] = (len(self._groups) - 1, None)
+
+    def __contains__(self, name) -> bool:
+        return name in self._locations
+
+    def __getitem__(self, name) -> pd.Series:
+        index, position = self._locations[name]
+        group = self._groups[index]
+
+        if position is None:
+            values = group[name]
+        elif sparse.issparse(group[1]):
+            values = _sparse_column(group[1], position)
+        else:
+            values = group[1][:, position]
+
+        return pd.Series(values, index=self.index, name=name, copy=False)
+
+    def _frames(self) -> list:
+        frames = []
+
+        for group in self._groups:
+            if isinstance(group, dict):
+                frame = pd.DataFrame(group, index=self.index, copy=False)
+            elif sparse.issparse(group[1]):
+                names, values = group
+                columns = {
+                    name: _sparse_column(values, position)
+                    for position, name in enumerate(names)
+                }
+                frame = pd.DataFrame(columns, index=self.index, copy=False)
+            else:
+                names, values = group
+                frame = pd.DataFrame(
+                    values, index=self.index, columns=names, copy=False
+                )
+
+            frames.append(frame)
+
+        return frames
+
+    def attach(self, X: pd.DataFrame, drop=None) -> pd.DataFrame:
+        """
+        Appends the columns to the data.
+
+        Args:
+            X (pd.DataFrame): Data the columns are added to.
+            drop (list, optional): Columns of `X` removed from the result.
+
+        Returns:
+            pd.DataFrame: `X` without the dropped columns, followed by the new
+            ones. New columns already in `X` replace them in place.
+        """
+        if drop:
+            X = X.drop(columns=drop)
+
+        if not self._groups:
+            return X
+
+        frames = self._frames()
+        new = pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
+        if new.columns.has_duplicates:
+            # A column added several times keeps its first position and last values
+            last = new.loc[:, ~new.columns.duplicated(keep="last")]
+            new = last[new.columns.unique()]
+
+        existing = new.columns.intersection(X.columns)
+        if len(existing):
+            X = X.copy(deep=False)
+            for name in existing:
+                X[name] = new[name]
+            new = new.drop(columns=existing)
+
+        return pd.concat([X, new], axis=1)
+
+
+def _sparse_column(matrix, position: int) -> pd.arrays.SparseArray:
+    # Built column by column, as DataFrame.sparse.from_spmatrix gives float
+    # columns NaN as fill value
+    return pd.arrays.SparseArray.from_spmatrix(matrix[:, position : position + 1])
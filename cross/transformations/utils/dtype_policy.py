@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+# None keeps the dtypes of pandas and scikit-learn (float64 and int64)
+DTYPE_POLICIES = [None, "compact"]
+
+# Candidates for integer codes, from the smallest
+_INTEGER_DTYPES = [np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32]
+
+
+def check_dtype_policy(dtype_policy):
+    if dtype_policy not in DTYPE_POLICIES:
+        raise ValueError(
+            f"Invalid dtype_policy '{dtype_policy}', expected one of {DTYPE_POLICIES}"
+        )
+
+
+def float_dtype(dtype_policy) -> np.dtype:
+    """float32 under the compact policy, float64 otherwise."""
+    return np.dtype(np.float32 if dtype_policy == "compact" else np.float64)
+
+
+def integer_dtype(low, high) -> np.dtype:
+    """Smallest integer dtype holding every value between `low` and `high`."""
+    for dtype in _INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+
+def continuous(values, dtype_policy):
+    """
+    Casts continuous values, e.g. scaled features or spline bases, to the float
+    dtype of the policy. Values that are not floats are returned unchanged.
+    """
+    if dtype_policy != "compact" or np.dtype(values.dtype).kind != "f":
+        return values
+
+    return values.astype(np.float32)
+
+
+def integral(values, low, high, dtype_policy):
+    """
+    Casts integer codes between `low` and `high`, e.g. bins or date parts, to the
+    smallest integer dtype under the compact policy. Codes with missing values
+    are cast as continuous values.
+    """
+    if dtype_policy != "compact":
+        return values
+
+    if np.dtype(values.dtype).kind == "f" and pd.isna(values).any():
+        return values.astype(np.float32)
+
+    return values.astype(integer_dtype(low, high))
+
+
+def indicator_dtype(dtype_policy) -> np.dtype:
+    """
+    uint8 under the compact policy, int64 otherwise. Indicators stay numbers,
+    so they are selected with the other numeric columns.
+    """
+    return np.dtype(np.uint8 if dtype_policy == "compact" else np.int64)
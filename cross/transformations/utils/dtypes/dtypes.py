@@ -2,16 +2,29 @@ import numpy as np
 import pandas as pd
 
 
+def _select(data: pd.DataFrame, include, arrow_kinds: str) -> list:
+    # select_dtypes only matches Arrow-backed columns as numbers, the others
+    # are matched by the kind of their values
+    selected = set(data.select_dtypes(include=include).columns)
+    selected.update(
+        column
+        for column, dtype in data.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and dtype.kind in arrow_kinds
+    )
+
+    return [column for column in data.columns if column in selected]
+
+
 def bool_columns(data: pd.DataFrame) -> list:
-    return data.select_dtypes(include=["bool"]).columns.tolist()
+    return _select(data, ["bool"], "b")
 
 
 def categorical_columns(data: pd.DataFrame) -> list:
-    return data.select_dtypes(include=["object", "category"]).columns.tolist()
+    return _select(data, ["object", "category"], "OSU")
 
 
 def datetime_columns(data: pd.DataFrame) -> list:
-    return data.select_dtypes(include=["datetime64[ns]", "datetime64"]).columns.tolist()
+    return _select(data, ["datetime64[ns]", "datetime64"], "M")
 
 
 def numerical_columns(data: pd.DataFrame) -> list:
@@ -19,6 +32,4 @@ def numerical_columns(data: pd.DataFrame) -> list:
 
 
 def timedelta_columns(data: pd.DataFrame) -> list:
-    return data.select_dtypes(
-        include=["timedelta64[ns]", "timedelta64"]
-    ).columns.tolist()
+    return _select(data, ["timedelta64[ns]", "timedelta64"], "m")
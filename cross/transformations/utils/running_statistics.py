@@ -0,0 +1,178 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+def _values(values) -> np.ndarray:
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return values[~np.isnan(values)]
+
+
+class RunningMoments:
+    """
+    Exact count, mean and variance of a stream of values, ignoring NaNs.
+
+    Batches are combined with the parallel algorithm of Chan et al., so the
+    moments of several streams can also be merged.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values):
+        values = _values(values)
+        if len(values):
+            batch = RunningMoments()
+            batch.count = len(values)
+            batch.mean = values.mean()
+            batch.m2 = ((values - batch.mean) ** 2).sum()
+            self.merge(batch)
+
+        return self
+
+    def merge(self, other: "RunningMoments"):
+        count = self.count + other.count
+        if count == 0:
+            return self
+
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta**2 * self.count * other.count / count
+        self.count = count
+        return self
+
+    def std(self, ddof: int = 1) -> float:
+        if self.count <= ddof:
+            return np.nan
+
+        return np.sqrt(self.m2 / (self.count - ddof))
+
+
+class QuantileSketch:
+    """
+    Mergeable summary of a stream of values to estimate their quantiles.
+
+    All values are kept while there are at most `capacity` of them, so the
+    quantiles are exact. Beyond that, sorted values are compressed into
+    `capacity` buckets of equal weight, each kept as its weighted mean, which
+    bounds the rank error by about 1 / capacity. NaNs are counted apart.
+
+    Args:
+        capacity (int, optional): Number of values kept. Defaults to 100_000.
+    """
+
+    def __init__(self, capacity: int = 100_000):
+        self.capacity = capacity
+        self.exact = True
+        self.n_missing = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+        self._values = np.empty(0)
+        self._weights = np.empty(0)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        finite = _values(values)
+        self.n_missing += len(values) - len(finite)
+
+        return self._add(finite, np.ones(len(finite)), exact=True)
+
+    def merge(self, other: "QuantileSketch"):
+        self.n_missing += other.n_missing
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        return self._add(other._values, other._weights, exact=other.exact)
+
+    def _add(self, values, weights, exact: bool):
+        if len(values):
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+
+        self._values = np.concatenate([self._values, values])
+        self._weights = np.concatenate([self._weights, weights])
+        self.exact = self.exact and exact
+
+        if len(self._values) > self.capacity:
+            self._compress()
+
+        return self
+
+    def _compress(self):
+        order = np.argsort(self._values, kind="stable")
+        values, weights = self._values[order], self._weights[order]
+
+        total = weights.sum()
+        start = np.cumsum(weights) - weights
+        buckets = np.minimum(start * self.capacity // total, self.capacity - 1)
+        buckets = buckets.astype(np.intp)
+
+        bucket_weights = np.bincount(buckets, weights=weights)
+        bucket_sums = np.bincount(buckets, weights=values * weights)
+        kept = bucket_weights > 0
+
+        self._values = bucket_sums[kept] / bucket_weights[kept]
+        self._weights = bucket_weights[kept]
+        self.exact = False
+
+    @property
+    def count(self) -> float:
+        return self._weights.sum()
+
+    def sample(self) -> np.ndarray:
+        """
+        Returns values distributed as the stream: the values themselves while
+        the sketch is exact, or `capacity` evenly spaced quantiles otherwise.
+        """
+        if self.exact:
+            return self._values.copy()
+
+        order = np.argsort(self._values, kind="stable")
+        values, weights = self._values[order], self._weights[order]
+        cumulative = np.cumsum(weights)
+        positions = (cumulative - weights / 2) / cumulative[-1]
+
+        return np.interp(
+            np.linspace(0, 1, self.capacity),
+            np.r_[0, positions, 1],
+            np.r_[self.min, values, self.max],
+        )
+
+    def quantile(self, q):
+        """Linearly interpolated quantiles, as `np.quantile` and pandas."""
+        sample = self.sample()
+        if len(sample) == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        return np.quantile(sample, q)
+
+
+class FrequencyTable:
+    """Mergeable counts of the non-missing values of a stream."""
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def update(self, values):
+        self.counts.update(pd.Series(values).value_counts().to_dict())
+        return self
+
+    def merge(self, other: "FrequencyTable"):
+        self.counts.update(other.counts)
+        return self
+
+    def to_dict(self) -> dict:
+        """Counts sorted from the most to the least frequent value."""
+        return dict(self.counts.most_common())
+
+    def most_frequent(self):
+        """Most frequent value, the smallest one on ties, as scikit-learn."""
+        if not self.counts:
+            return np.nan
+
+        top = max(self.counts.values())
+        return min(value for value, count in self.counts.items() if count == top)
@@ -1 +1,8 @@
+from .arrow import from_arrow, is_arrow_table, to_arrow
+from .checkpoint import Checkpoint
+from .fingerprint import fingerprint
 from .get_transformer import get_transformer
+from .input_columns import get_input_columns
+from .persistence import load_state, save_state
+from .sparse import is_sparse_column, to_sparse_matrix
+from .streaming import read_chunks, write_parquet
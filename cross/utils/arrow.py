@@ -0,0 +1,58 @@
+import sys
+
+import pandas as pd
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Arrow input and output requires pyarrow: pip install pyarrow"
+        ) from e
+
+    return pa
+
+
+def is_arrow_table(X) -> bool:
+    # A table can only exist if pyarrow was already imported by the caller
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(X, (pa.Table, pa.RecordBatch))
+
+
+def from_arrow(X):
+    """
+    Wraps a `pyarrow.Table` or `pyarrow.RecordBatch` in a DataFrame of
+    `pd.ArrowDtype` columns, which share the buffers of the table. Other
+    inputs are returned as is.
+
+    Args:
+        X: Arrow table or record batch, or DataFrame.
+
+    Returns:
+        pd.DataFrame: Data with a default index.
+    """
+    if not is_arrow_table(X):
+        return X
+
+    return X.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def to_arrow(X: pd.DataFrame):
+    """
+    Converts a DataFrame to a `pyarrow.Table`, without its index.
+
+    Arrow-backed columns are passed as they are, and numeric NumPy-backed
+    columns without missing values are wrapped without copying.
+
+    Args:
+        X (pd.DataFrame): Data without sparse columns.
+
+    Returns:
+        pyarrow.Table: Table with the columns of X.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _import_pyarrow()
+    return pa.Table.from_pandas(X, preserve_index=False)
@@ -0,0 +1,90 @@
+import os
+import pickle
+from typing import List
+
+
+class Checkpoint:
+    """
+    Persists the progress of `auto_transform` after each stage.
+
+    Each stage stores the transformations it selected. A rerun with the same
+    inputs replays the completed stages instead of searching them again, which
+    rebuilds the data and the search state from those transformations. When
+    the fingerprint of the inputs changes, the stored stages are discarded.
+    """
+
+    FILENAME = "auto_transform_checkpoint.pkl"
+
+    def __init__(self, directory: str, fingerprint: str):
+        """
+        Args:
+            directory (str): Folder where the checkpoint file is stored.
+            fingerprint (str): Hash of the inputs of the run.
+        """
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.path = os.path.join(directory, self.FILENAME)
+
+        self.stages = {}
+        self.resumed = False
+        self._counter = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def stage(self, name: str) -> str:
+        """
+        Returns the key of the next stage of the run.
+
+        Args:
+            name (str): Name of the stage, e.g. the parameter selector class.
+
+        Returns:
+            str: Key that identifies the stage by position and name.
+        """
+        key = f"{self._counter:02d}_{name}"
+        self._counter += 1
+        return key
+
+    def is_completed(self, key: str) -> bool:
+        return key in self.stages
+
+    def result(self, key: str) -> List[dict]:
+        """Returns the transformations selected by a completed stage."""
+        return self.stages[key]
+
+    def complete(self, key: str, transformations: List[dict]):
+        """
+        Records a finished stage and writes the checkpoint to disk.
+
+        Args:
+            key (str): Key of the stage.
+            transformations (List[dict]): Transformations selected by the stage.
+        """
+        self.stages[key] = transformations
+        self._save()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            content = pickle.load(f)
+
+        if content.get("fingerprint") != self.fingerprint:
+            return
+
+        self.stages = content["stages"]
+        self.resumed = bool(self.stages)
+
+    def _save(self):
+        content = {
+            "fingerprint": self.fingerprint,
+            "stages": self.stages,
+        }
+
+        # Write to a temporary file first so a crash never leaves it truncated
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(content, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,50 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+def fingerprint(*objects) -> str:
+    """
+    Computes a stable hash of data and configuration objects.
+
+    DataFrames, Series and arrays are hashed by content (values, index, column
+    names and dtypes). Estimators are hashed by class and parameters, and any
+    other object by its `repr`.
+
+    Args:
+        *objects: Objects to hash.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+
+    for obj in objects:
+        digest.update(_object_bytes(obj))
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _object_bytes(obj) -> bytes:
+    if isinstance(obj, pd.DataFrame):
+        header = repr(list(zip(obj.columns, obj.dtypes.astype(str))))
+        values = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+        return header.encode() + values.tobytes()
+
+    if isinstance(obj, pd.Series):
+        header = repr((obj.name, str(obj.dtype)))
+        values = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+        return header.encode() + values.tobytes()
+
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return _object_bytes(pd.Series(obj.ravel()))
+        return repr((obj.dtype.str, obj.shape)).encode() + obj.tobytes()
+
+    if hasattr(obj, "get_params"):
+        params = obj.get_params(deep=False)
+        return repr((type(obj).__name__, sorted(params.items(), key=str))).encode()
+
+    return repr(obj).encode()
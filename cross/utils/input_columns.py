@@ -0,0 +1,34 @@
+from cross.transformations import ColumnSelection
+
+
+def get_input_columns(transformer):
+    """
+    Returns the columns a transformer reads, based on its parameters.
+
+    Args:
+        transformer: A transformer from `cross.transformations`.
+
+    Returns:
+        Optional[list]: Column names, or None when they cannot be determined
+        (e.g. `ColumnSelection`, which depends on every column of the input).
+    """
+    if isinstance(transformer, ColumnSelection) or not hasattr(
+        transformer, "get_params"
+    ):
+        return None
+
+    params = transformer.get_params()
+
+    if "operations_options" in params:
+        columns = []
+        for col1, col2, _ in params["operations_options"] or []:
+            columns.extend([col1, col2])
+        return list(dict.fromkeys(columns))
+
+    if "transformation_options" in params:
+        return list(params["transformation_options"] or {})
+
+    if "features" in params and params["features"] is not None:
+        return list(params["features"])
+
+    return None
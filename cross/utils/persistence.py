@@ -0,0 +1,671 @@
+import base64
+import collections
+import copyreg
+import datetime
+import functools
+import json
+import math
+import os
+import types
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+FORMAT_VERSION = 2
+
+# Older versions of the format are still read
+SUPPORTED_VERSIONS = {1, 2}
+DOCUMENT_FILENAME = "pipeline.json"
+ARRAYS_FILENAME = "arrays.bin"
+
+# Arrays are aligned in the store so they can be viewed in place
+ALIGNMENT = 64
+
+_TAGS = {
+    "__array__",
+    "__bytearray__",
+    "__bytes__",
+    "__dict__",
+    "__dtype__",
+    "__global__",
+    "__object__",
+    "__object_array__",
+    "__ref__",
+    "__scalar__",
+    "__slice__",
+    "__tuple__",
+}
+
+
+class _Encoder:
+    """
+    Encodes objects as JSON values, moving arrays to a binary store.
+
+    Containers and primitives map to JSON; NumPy arrays and scalars are
+    referenced by their position in the store; any other object is described
+    by the same reduction pickle uses, so fitted estimators are stored as
+    their constructor and state, without executable code.
+    """
+
+    def __init__(self):
+        self.arrays = []
+        self._array_ids = {}
+        self._memo = {}
+        self._alive = []
+
+        # Classes and functions referenced by the document, by name
+        self.globals = {}
+
+    def encode(self, obj):
+        if obj is None or type(obj) in (bool, int, float, str):
+            return obj
+
+        if type(obj) is list:
+            return [self.encode(item) for item in obj]
+
+        if type(obj) is tuple:
+            return {"__tuple__": [self.encode(item) for item in obj]}
+
+        if type(obj) is slice:
+            return {
+                "__slice__": [
+                    self.encode(obj.start),
+                    self.encode(obj.stop),
+                    self.encode(obj.step),
+                ]
+            }
+
+        if type(obj) is dict:
+            if all(isinstance(key, str) for key in obj) and not (
+                len(obj) == 1 and next(iter(obj)) in _TAGS
+            ):
+                return {key: self.encode(value) for key, value in obj.items()}
+
+            return {
+                "__dict__": [[self.encode(k), self.encode(v)] for k, v in obj.items()]
+            }
+
+        if isinstance(obj, bytes):
+            return {"__bytes__": base64.b64encode(obj).decode("ascii")}
+
+        if type(obj) is bytearray:
+            # Buffers of Arrow arrays, e.g. of pyarrow-backed strings
+            return {"__bytearray__": base64.b64encode(obj).decode("ascii")}
+
+        if isinstance(obj, np.dtype):
+            return {"__dtype__": self.encode(np.lib.format.dtype_to_descr(obj))}
+
+        if isinstance(obj, np.ndarray) and type(obj) in (np.ndarray, np.memmap):
+            if obj.dtype.hasobject:
+                return {
+                    "__object_array__": {
+                        "shape": list(obj.shape),
+                        "items": [self.encode(item) for item in obj.ravel().tolist()],
+                    }
+                }
+
+            return {"__array__": self._store(obj)}
+
+        if isinstance(obj, np.generic):
+            return {"__scalar__": self._store(np.asarray(obj))}
+
+        if isinstance(
+            obj,
+            (type, types.FunctionType, types.BuiltinFunctionType, types.ModuleType),
+        ):
+            return {"__global__": self._global(obj)}
+
+        return self._encode_object(obj)
+
+    def _global(self, obj, name=None) -> str:
+        name = name or _global_name(obj)
+        self.globals[name] = obj
+        return name
+
+    def _store(self, array: np.ndarray) -> int:
+        key = id(array)
+        if key not in self._array_ids:
+            self._array_ids[key] = len(self.arrays)
+            self.arrays.append(array)
+            self._alive.append(array)
+
+        return self._array_ids[key]
+
+    def _encode_object(self, obj):
+        key = id(obj)
+        if key in self._memo:
+            return {"__ref__": self._memo[key]}
+
+        self._memo[key] = len(self._memo)
+        self._alive.append(obj)
+
+        reduced = obj.__reduce_ex__(4)
+        if isinstance(reduced, str):
+            return {"__global__": self._global(obj, f"{obj.__module__}:{reduced}")}
+
+        func, args, state, listitems, dictitems = (tuple(reduced) + (None,) * 5)[:5]
+
+        return {
+            "__object__": {
+                "id": self._memo[key],
+                "func": self._global(func),
+                "args": [self.encode(arg) for arg in args],
+                "state": self.encode(state),
+                "listitems": self.encode(list(listitems or [])),
+                "dictitems": self.encode(list(dictitems or [])),
+            }
+        }
+
+
+# Version 1 rebuilt slices and bytearrays through these built-ins, before they
+# got their own tags
+_VERSION_1_BUILTINS = {"builtins:slice": slice, "builtins:bytearray": bytearray}
+
+
+class _Decoder:
+    def __init__(self, arrays: list, format_version: int = FORMAT_VERSION):
+        self.arrays = arrays
+        self.format_version = format_version
+        self._memo = {}
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+
+        if not isinstance(value, dict):
+            return value
+
+        if len(value) != 1 or next(iter(value)) not in _TAGS:
+            return {key: self.decode(item) for key, item in value.items()}
+
+        tag, content = next(iter(value.items()))
+
+        if tag == "__tuple__":
+            return tuple(self.decode(item) for item in content)
+
+        if tag == "__slice__":
+            return slice(*self.decode(content))
+
+        if tag == "__dict__":
+            return {self.decode(k): self.decode(v) for k, v in content}
+
+        if tag == "__bytes__":
+            return base64.b64decode(content)
+
+        if tag == "__bytearray__":
+            return bytearray(base64.b64decode(content))
+
+        if tag == "__dtype__":
+            return np.lib.format.descr_to_dtype(self.decode(content))
+
+        if tag == "__array__":
+            return self.arrays[content]
+
+        if tag == "__scalar__":
+            return self.arrays[content][()]
+
+        if tag == "__object_array__":
+            items = [self.decode(item) for item in content["items"]]
+            array = np.empty(len(items), dtype=object)
+            array[:] = items
+            return array.reshape(content["shape"])
+
+        if tag == "__global__":
+            return _import_global(content)
+
+        if tag == "__ref__":
+            return self._memo[content]
+
+        return self._decode_object(content)
+
+    def _decode_object(self, content):
+        if self.format_version == 1 and content["func"] in _VERSION_1_BUILTINS:
+            func = _VERSION_1_BUILTINS[content["func"]]
+        else:
+            func = _import_global(content["func"])
+        obj = func(*self.decode(content["args"]))
+        self._memo[content["id"]] = obj
+
+        state = self.decode(content["state"])
+        if state is not None:
+            _set_state(obj, state)
+
+        for item in self.decode(content["listitems"]):
+            obj.append(item)
+        for key, item in self.decode(content["dictitems"]):
+            obj[key] = item
+
+        return obj
+
+
+def _set_state(obj, state):
+    # Same rules as pickle when restoring the state of an object
+    setstate = getattr(obj, "__setstate__", None)
+    if setstate is not None:
+        setstate(state)
+        return
+
+    slotstate = None
+    if isinstance(state, tuple) and len(state) == 2:
+        state, slotstate = state
+
+    if state:
+        obj.__dict__.update(state)
+    for key, value in (slotstate or {}).items():
+        setattr(obj, key, value)
+
+
+def _global_name(obj) -> str:
+    module = getattr(obj, "__module__", None) or getattr(obj, "__name__", None)
+    qualname = getattr(obj, "__qualname__", None)
+
+    if isinstance(obj, types.ModuleType):
+        return f"{obj.__name__}:"
+
+    if module is None or qualname is None or "<" in qualname:
+        raise ValueError(f"Object {obj!r} cannot be saved, it has no importable name")
+
+    return f"{module}:{qualname}"
+
+
+def _standard_library():
+    objects = [
+        copyreg.__newobj__,
+        copyreg.__newobj_ex__,
+        collections.Counter,
+        collections.OrderedDict,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        datetime.timezone,
+    ]
+    return objects, []
+
+
+def _numpy():
+    objects = [
+        *set(np.sctypeDict.values()),
+        np.random.RandomState,
+        np.random.Generator,
+        np.random.SeedSequence,
+        np.random.MT19937,
+        np.random.PCG64,
+        np.random.PCG64DXSM,
+        np.random.Philox,
+        np.random.SFC64,
+    ]
+    return objects, [np.random.RandomState(0), np.random.default_rng(0)]
+
+
+def _pandas():
+    objects = [
+        pd.DataFrame,
+        pd.Series,
+        pd.Index,
+        pd.RangeIndex,
+        pd.MultiIndex,
+        pd.CategoricalIndex,
+        pd.DatetimeIndex,
+        pd.TimedeltaIndex,
+        pd.IntervalIndex,
+        pd.PeriodIndex,
+        pd.Categorical,
+        pd.CategoricalDtype,
+        pd.DatetimeTZDtype,
+        pd.PeriodDtype,
+        pd.IntervalDtype,
+        pd.SparseDtype,
+        pd.StringDtype,
+        pd.ArrowDtype,
+        pd.BooleanDtype,
+        pd.Int8Dtype,
+        pd.Int16Dtype,
+        pd.Int32Dtype,
+        pd.Int64Dtype,
+        pd.UInt8Dtype,
+        pd.UInt16Dtype,
+        pd.UInt32Dtype,
+        pd.UInt64Dtype,
+        pd.Float32Dtype,
+        pd.Float64Dtype,
+        pd.Timestamp,
+        pd.Timedelta,
+    ]
+    samples = [
+        pd.DataFrame(
+            {
+                "number": [0.5],
+                "integer": [1],
+                "text": ["a"],
+                "flag": [True],
+                "date": pd.to_datetime(["2024-01-01"]),
+                "category": pd.Categorical(["a"]),
+            }
+        ),
+        pd.Series([0.5], index=pd.Index(["a"])),
+        pd.RangeIndex(1),
+        pd.MultiIndex.from_tuples([("a", 1)]),
+        pd.Timestamp(0),
+        pd.Timestamp(0, tz="UTC"),
+        pd.Timedelta(0),
+        pd.NaT,
+        pd.NA,
+        pd.array([1, None], dtype="Int64"),
+        pd.array([0.5, None], dtype="Float64"),
+        pd.array([True, None], dtype="boolean"),
+        pd.array(["a", None], dtype="string"),
+        pd.arrays.SparseArray([0.0, 1.0]),
+    ]
+    return objects, samples
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return [], []
+
+    types = [
+        pa.bool_(),
+        pa.int8(),
+        pa.int16(),
+        pa.int32(),
+        pa.int64(),
+        pa.uint8(),
+        pa.uint16(),
+        pa.uint32(),
+        pa.uint64(),
+        pa.float32(),
+        pa.float64(),
+        pa.string(),
+        pa.large_string(),
+        pa.date32(),
+        pa.timestamp("ns"),
+        pa.timestamp("us", tz="UTC"),
+        pa.duration("ns"),
+        pa.dictionary(pa.int32(), pa.string()),
+    ]
+    return [], [pd.ArrowDtype(dtype) for dtype in types]
+
+
+def _scipy():
+    from scipy.interpolate import BSpline
+
+    # B-splines of SplineTransformer keep the array namespace they were built with
+    return [BSpline], [BSpline(np.arange(8.0), np.ones(4), 3)]
+
+
+def _cross():
+    import cross.transformations
+    from cross import CrossTransformer
+    from cross.transformations.utils.running_statistics import (
+        FrequencyTable,
+        QuantileSketch,
+        RunningMoments,
+    )
+
+    objects = [
+        getattr(cross.transformations, name)
+        for name in dir(cross.transformations)
+        if isinstance(getattr(cross.transformations, name), type)
+    ]
+    return [
+        *objects,
+        CrossTransformer,
+        FrequencyTable,
+        QuantileSketch,
+        RunningMoments,
+    ], []
+
+
+def _sklearn():
+    from sklearn.decomposition import (
+        PCA,
+        FactorAnalysis,
+        FastICA,
+        KernelPCA,
+        TruncatedSVD,
+    )
+    from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
+    from sklearn.ensemble import IsolationForest
+    from sklearn.impute import KNNImputer, MissingIndicator, SimpleImputer
+    from sklearn.manifold import Isomap, LocallyLinearEmbedding
+    from sklearn.neighbors import BallTree, KDTree, LocalOutlierFactor, NearestNeighbors
+    from sklearn.preprocessing import (
+        KBinsDiscretizer,
+        KernelCenterer,
+        MaxAbsScaler,
+        MinMaxScaler,
+        Normalizer,
+        PowerTransformer,
+        QuantileTransformer,
+        RobustScaler,
+        SplineTransformer,
+        StandardScaler,
+    )
+    from sklearn.tree import ExtraTreeRegressor
+
+    objects = [
+        SimpleImputer,
+        KNNImputer,
+        MissingIndicator,
+        StandardScaler,
+        MinMaxScaler,
+        RobustScaler,
+        MaxAbsScaler,
+        Normalizer,
+        PowerTransformer,
+        QuantileTransformer,
+        KBinsDiscretizer,
+        SplineTransformer,
+        KernelCenterer,
+        FactorAnalysis,
+        FastICA,
+        KernelPCA,
+        PCA,
+        TruncatedSVD,
+        LinearDiscriminantAnalysis,
+        Isomap,
+        LocallyLinearEmbedding,
+        IsolationForest,
+        LocalOutlierFactor,
+        NearestNeighbors,
+        ExtraTreeRegressor,
+        KDTree,
+        BallTree,
+    ]
+
+    # Fitted trees and neighbor indexes are rebuilt by private helpers
+    points = np.arange(4.0).reshape(-1, 1)
+    samples = [ExtraTreeRegressor(max_depth=1).fit(points, points.ravel())]
+    for metric in ["euclidean", "manhattan", "chebyshev", "minkowski"]:
+        samples.extend([KDTree(points, metric=metric), BallTree(points, metric=metric)])
+
+    return objects, samples
+
+
+def _category_encoders():
+    import category_encoders as ce
+
+    return [getattr(ce, name) for name in ce.__all__], []
+
+
+# Groups of classes and functions rebuilt when loading, from the cheapest to
+# import. Each group also trusts the helpers its samples are rebuilt with.
+_TRUSTED_GROUPS = [
+    _standard_library,
+    _numpy,
+    _pandas,
+    _scipy,
+    _cross,
+    _sklearn,
+    _category_encoders,
+    _pyarrow,
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _trusted_globals(group) -> dict:
+    objects, samples = group()
+
+    encoder = _Encoder()
+    encoder.encode(samples)
+    trusted = {**encoder.globals, **{_global_name(obj): obj for obj in objects}}
+
+    # Built-in callables, e.g. eval or exec, are never rebuilt
+    return {
+        name: obj for name, obj in trusted.items() if not name.startswith("builtins:")
+    }
+
+
+def _import_global(name: str):
+    # Names are looked up in the allowlist, nothing is imported from the document
+    for group in _TRUSTED_GROUPS:
+        trusted = _trusted_globals(group)
+        if name in trusted:
+            return trusted[name]
+
+    raise ValueError(
+        f"Refusing to load '{name}', it is not a trusted class or function"
+    )
+
+
+def _write_arrays(arrays: list, path) -> list:
+    entries, offset = [], 0
+
+    with open(path, "wb") as f:
+        for array in arrays:
+            fortran = array.flags.f_contiguous and not array.flags.c_contiguous
+            data = array.tobytes(order="F" if fortran else "C")
+
+            padding = -offset % ALIGNMENT
+            f.write(b"\0" * padding)
+            offset += padding
+
+            entries.append(
+                {
+                    # Structured dtypes, e.g. of tree nodes, are lists of tuples
+                    "dtype": _Encoder().encode(
+                        np.lib.format.dtype_to_descr(array.dtype)
+                    ),
+                    "shape": list(array.shape),
+                    "fortran_order": bool(fortran),
+                    "offset": offset,
+                }
+            )
+            f.write(data)
+            offset += len(data)
+
+    return entries
+
+
+def _read_arrays(entries: list, path, mmap: bool) -> list:
+    if os.path.getsize(path) == 0:
+        buffer = np.empty(0, dtype=np.uint8)
+    elif mmap:
+        # Copy-on-write, so fitted state stays writable without touching the file
+        buffer = np.memmap(path, dtype=np.uint8, mode="c")
+    else:
+        buffer = np.fromfile(path, dtype=np.uint8)
+
+    arrays, dtypes = [], {}
+    for entry in entries:
+        # Many arrays share a dtype, e.g. the nodes of every tree of a forest
+        key = json.dumps(entry["dtype"])
+        if key not in dtypes:
+            descr = _Decoder([]).decode(entry["dtype"])
+            dtypes[key] = np.lib.format.descr_to_dtype(descr)
+
+        dtype = dtypes[key]
+        shape = tuple(entry["shape"])
+
+        if dtype.itemsize * math.prod(shape) == 0:
+            arrays.append(np.empty(shape, dtype=dtype))
+            continue
+
+        arrays.append(
+            np.ndarray(
+                shape,
+                dtype=dtype,
+                buffer=buffer,
+                offset=entry["offset"],
+                order="F" if entry["fortran_order"] else "C",
+            )
+        )
+
+    return arrays
+
+
+def save_state(document: dict, path):
+    """
+    Writes a document of fitted objects to a folder.
+
+    The document is stored as JSON in `pipeline.json`, and every NumPy array
+    it contains (bounds, quantile tables, components, tree nodes...) is stored
+    uncompressed and aligned in `arrays.bin`, so it can be memory-mapped.
+
+    Args:
+        document (dict): Objects to save, keyed by name.
+        path: Folder where the files are written. It is created if needed.
+    """
+    encoder = _Encoder()
+    content = encoder.encode(document)
+
+    os.makedirs(path, exist_ok=True)
+    entries = _write_arrays(encoder.arrays, os.path.join(path, ARRAYS_FILENAME))
+
+    with open(os.path.join(path, DOCUMENT_FILENAME), "w") as f:
+        json.dump(
+            {
+                "format_version": FORMAT_VERSION,
+                "versions": _library_versions(),
+                "document": content,
+                "arrays": entries,
+            },
+            f,
+        )
+
+
+def load_state(path, mmap: bool = True) -> dict:
+    """
+    Reads a document written by `save_state`.
+
+    Only an allowlist of classes and functions is rebuilt: the estimators and
+    fitted objects of the transformations, from cross, scikit-learn,
+    category_encoders, NumPy, pandas, SciPy and pyarrow, and the helpers
+    pickle rebuilds them with. Built-in functions are never called, except
+    slice and bytearray in version 1 documents.
+
+    Args:
+        path: Folder written by `save_state`.
+        mmap (bool, optional): Whether to memory-map the arrays instead of
+            reading them into memory. Defaults to True.
+
+    Returns:
+        dict: The saved document.
+
+    Raises:
+        ValueError: If the format version is not supported or the document
+            references a class or function outside the allowlist.
+    """
+    with open(os.path.join(path, DOCUMENT_FILENAME)) as f:
+        saved = json.load(f)
+
+    if saved.get("format_version") not in SUPPORTED_VERSIONS:
+        raise ValueError(
+            f"Unsupported format version {saved.get('format_version')}, "
+            f"expected {FORMAT_VERSION}"
+        )
+
+    arrays = _read_arrays(saved["arrays"], os.path.join(path, ARRAYS_FILENAME), mmap)
+    return _Decoder(arrays, saved["format_version"]).decode(saved["document"])
+
+
+def _library_versions() -> dict:
+    return {
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
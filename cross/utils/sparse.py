@@ -0,0 +1,38 @@
+import itertools
+
+import pandas as pd
+from scipy import sparse
+
+
+def is_sparse_column(X: pd.DataFrame, column) -> bool:
+    return isinstance(X[column].dtype, pd.SparseDtype)
+
+
+def to_sparse_matrix(X: pd.DataFrame) -> sparse.csr_matrix:
+    """
+    Converts a DataFrame to a SciPy CSR matrix without densifying its sparse
+    columns.
+
+    Runs of sparse columns, with 0 as fill value, are converted from their
+    stored values only, and runs of dense columns from their values.
+
+    Args:
+        X (pd.DataFrame): Numeric data, with columns of `pd.SparseDtype` or not.
+
+    Returns:
+        sparse.csr_matrix: Matrix with the rows and columns of X.
+    """
+    flags = [isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes]
+    blocks = []
+
+    for is_sparse, group in itertools.groupby(range(len(flags)), flags.__getitem__):
+        frame = X.iloc[:, list(group)]
+        if is_sparse:
+            blocks.append(frame.sparse.to_coo())
+        else:
+            blocks.append(sparse.csr_matrix(frame.to_numpy()))
+
+    if not blocks:
+        return sparse.csr_matrix((len(X), 0))
+
+    return sparse.hstack(blocks, format="csr")
@@ -0,0 +1,149 @@
+import os
+from typing import Iterable, Iterator, Union
+
+import pandas as pd
+
+Source = Union[str, os.PathLike, Iterable[pd.DataFrame]]
+
+
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading and writing Parquet files requires pyarrow: pip install pyarrow"
+        ) from e
+
+    return pa, pq
+
+
+def _read_parquet(path, chunksize: int, **read_kwargs) -> Iterator[pd.DataFrame]:
+    _, pq = _import_parquet()
+    start = 0
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, **read_kwargs):
+        chunk = batch.to_pandas()
+        # Row labels continue across chunks, as when reading the whole file
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+# Arguments of `pd.read_csv` naming columns, which can only name columns read
+_CSV_COLUMN_ARGUMENTS = [
+    "converters",
+    "date_format",
+    "dtype",
+    "na_values",
+    "parse_dates",
+]
+
+
+def _project_csv_kwargs(columns, read_kwargs) -> dict:
+    # Arguments of `pd.read_csv` reading only the given columns. Column
+    # positions and the index refer to the whole file, so it is read whole
+    references = [
+        reference
+        for key in _CSV_COLUMN_ARGUMENTS
+        if isinstance(read_kwargs.get(key), (dict, list, tuple))
+        for reference in read_kwargs[key]
+    ]
+    if read_kwargs.get("index_col") not in (None, False) or not all(
+        isinstance(reference, str) for reference in references
+    ):
+        return read_kwargs
+
+    projected = {}
+    for key in _CSV_COLUMN_ARGUMENTS:
+        value = read_kwargs.get(key)
+        if isinstance(value, dict):
+            projected[key] = {k: v for k, v in value.items() if k in columns}
+        elif isinstance(value, (list, tuple)):
+            projected[key] = [v for v in value if v in columns]
+
+    return {**read_kwargs, **projected, "usecols": columns}
+
+
+def read_chunks(
+    source: Source, chunksize: int = 100_000, columns=None, **read_kwargs
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterates over a table in chunks of rows.
+
+    Args:
+        source: Path to a CSV or Parquet file, or an iterable of DataFrames,
+            which is returned as is.
+        chunksize (int, optional): Rows per chunk read from a file.
+            Defaults to 100_000.
+        columns (list, optional): Columns read from a file, in this order.
+            Defaults to None (all columns).
+        **read_kwargs: Extra arguments for `pd.read_csv` or
+            `pyarrow.parquet.ParquetFile.iter_batches`. Columns named by
+            `parse_dates`, `dtype`, `converters`, `na_values` or
+            `date_format` and not in `columns` are left out of them.
+
+    Returns:
+        Iterator[pd.DataFrame]: Chunks of the table.
+
+    Raises:
+        ValueError: If the file is neither CSV nor Parquet.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        return iter(source)
+
+    extension = os.path.splitext(os.fspath(source))[1].lower()
+
+    if extension in [".csv", ".txt"]:
+        if columns is not None:
+            read_kwargs = _project_csv_kwargs(columns, read_kwargs)
+
+        chunks = pd.read_csv(source, chunksize=chunksize, **read_kwargs)
+        # `usecols` keeps the order of the file
+        return iter(chunks) if columns is None else (c[columns] for c in chunks)
+
+    if extension in [".parquet", ".pq"]:
+        return _read_parquet(source, chunksize, columns=columns, **read_kwargs)
+
+    raise ValueError(f"Unsupported file format: {extension}")
+
+
+def write_parquet(chunks: Iterable[pd.DataFrame], path) -> int:
+    """
+    Writes chunks of a table to one Parquet file as they are produced.
+
+    The schema of the first chunk is used for the whole file.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Chunks with the same columns, as
+            DataFrames or `pyarrow.Table`.
+        path: Path of the Parquet file.
+
+    Returns:
+        int: Number of rows written.
+    """
+    pa, pq = _import_parquet()
+    writer, n_rows = None, 0
+
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, pa.Table):
+                table = chunk if writer is None else chunk.cast(writer.schema)
+            elif writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+            else:
+                table = pa.Table.from_pandas(
+                    chunk, schema=writer.schema, preserve_index=False
+                )
+
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+
+            writer.write_table(table)
+            n_rows += table.num_rows
+
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return n_rows
@@ -72,3 +72,19 @@ class VerboseLogger:
         """Lightweight update, typically within loops."""
         if self.enabled:
             self._console.print(f"    [dim]{message}[/]")
+
+    # --- Output capture ---
+
+    def begin_capture(self):
+        """Buffers the messages instead of printing them."""
+        self._console.begin_capture()
+
+    def end_capture(self) -> str:
+        """Stops buffering and returns the buffered output."""
+        return self._console.end_capture()
+
+    def write(self, output: str):
+        """Prints output captured by another logger, e.g. in a worker process."""
+        if self.enabled and output:
+            self._console.file.write(output)
+            self._console.file.flush()
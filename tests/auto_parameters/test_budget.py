@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.neighbors import KNeighborsClassifier
+
+from cross.auto_parameters.shared import Budget, CandidateExecutor, EvaluationContext
+from cross.transformations import ScaleTransformation
+
+
+@pytest.fixture
+def load_data():
+    data = load_iris()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    return df, pd.Series(data.target)
+
+
+class TestBudget:
+    def test_evaluations_are_shared_across_stages(self):
+        budget = Budget(max_evaluations=10, n_stages=3)
+
+        first = budget.stage("first")
+        assert first.evaluations == 4
+        assert first.take(2) == 2
+
+        # The unused evaluations are passed on to the remaining stages
+        assert budget.stage("second").evaluations == 4
+        assert budget.evaluations == 2
+
+    def test_take_truncates_stage(self):
+        budget = Budget(max_evaluations=3)
+        stage = budget.stage("stage")
+
+        assert stage.take(5) == 3
+        assert stage.exhausted
+        assert stage.take(1) == 0
+        assert budget.report()["truncated_stages"] == ["stage"]
+
+    def test_time_budget(self):
+        stage = Budget(max_time=0).stage("stage")
+
+        assert stage.exhausted
+        assert stage.take(2) == 0
+
+    def test_context_skips_candidates_over_budget(self, load_data):
+        X, y = load_data
+        candidates = [
+            ScaleTransformation(transformation_options={X.columns[0]: scaler})
+            for scaler in ["min_max", "standard", "max_abs"]
+        ]
+
+        executor = CandidateExecutor(n_jobs=1)
+        executor.budget = Budget(max_evaluations=2).stage("stage")
+        context = EvaluationContext(
+            X, y, KNeighborsClassifier(), "accuracy", cv=3, executor=executor
+        )
+        scores = context.evaluate_many(candidates)
+
+        assert np.isfinite(scores[:2]).all()
+        assert np.isnan(scores[2])
+        assert executor.budget.truncated
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from cross.auto_parameters.shared import (
+    CandidateExecutor,
+    EvaluationContext,
+    Racing,
+    evaluate_model,
+)
+from cross.transformations import (
+    CategoricalEncoding,
+    ColumnSelection,
+    DimensionalityReduction,
+    MathematicalOperations,
+    NumericalBinning,
+    OutliersHandler,
+    ScaleTransformation,
+    SplineTransformation,
+)
+
+
+@pytest.fixture
+def load_data():
+    data = load_iris()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+
+    rng = np.random.default_rng(0)
+    df["color"] = rng.choice(["red", "green", "blue"], size=len(df))
+    df.loc[rng.choice(len(df), size=10), "sepal width (cm)"] = np.nan
+    df["size"] = rng.choice(["small", "large"], size=len(df))
+
+    return df, pd.Series(data.target)
+
+
+class TestEvaluationContext:
+    def test_baseline_matches_evaluate_model(self, load_data):
+        x, y = load_data
+        model = KNeighborsClassifier()
+
+        context = EvaluationContext(x, y, model, "accuracy", cv=5)
+
+        assert context.evaluate() == pytest.approx(
+            evaluate_model(x, y, model, "accuracy", cv=5)
+        )
+
+    @pytest.mark.parametrize(
+        "transformer",
+        [
+            ScaleTransformation({"sepal length (cm)": "min_max"}),
+            NumericalBinning({"petal width (cm)": ("uniform", 3)}),
+            CategoricalEncoding({"color": "label"}),
+            CategoricalEncoding({"size": "dummy"}),
+            CategoricalEncoding({"color": "hashing"}),
+            SplineTransformation({"petal length (cm)": {"n_knots": 5, "degree": 3}}),
+            MathematicalOperations([("sepal length (cm)", "petal width (cm)", "add")]),
+            OutliersHandler(
+                {"sepal width (cm)": ("cap", "iqr")}, {"sepal width (cm)": 1.5}
+            ),
+            DimensionalityReduction(
+                ["sepal length (cm)", "petal length (cm)"], "pca", n_components=1
+            ),
+        ],
+    )
+    def test_candidates_match_evaluate_model(self, load_data, transformer):
+        x, y = load_data
+        model = KNeighborsClassifier()
+
+        context = EvaluationContext(x, y, model, "accuracy", cv=5)
+        context.evaluate()
+
+        expected = evaluate_model(x, y, model, "accuracy", 5, None, transformer)
+        assert context.evaluate(transformer) == pytest.approx(expected)
+
+    def test_splits_are_computed_once(self, load_data):
+        x, y = load_data
+        context = EvaluationContext(x, y, KNeighborsClassifier(), "accuracy", cv=3)
+
+        assert len(context.folds) == 3
+
+        context.evaluate(ScaleTransformation({"sepal width (cm)": "standard"}))
+        encoders = context._encoders[0]
+        assert set(encoders) == {"color", "size"}
+
+        context.evaluate(CategoricalEncoding({"color": "count"}))
+        assert context._encoders[0]["size"] is encoders["size"]
+
+    @pytest.mark.parametrize(
+        "transformer",
+        [
+            ScaleTransformation(
+                {"sepal length (cm)": "robust"}, {"sepal length (cm)": (5.0, 95.0)}
+            ),
+            SplineTransformation({"petal length (cm)": {"n_knots": 10, "degree": 4}}),
+            NumericalBinning({"petal width (cm)": ("quantile", 8)}),
+        ],
+    )
+    def test_delta_splices_and_restores_block(self, load_data, transformer):
+        x, y = load_data
+        x = x.select_dtypes("number")
+        model = KNeighborsClassifier()
+
+        context = EvaluationContext(x, y, model, "accuracy", cv=5)
+        base_score = context.evaluate()
+        base_block = context._blocks[0].train[:, : context._blocks[0].width].copy()
+
+        expected = evaluate_model(x, y, model, "accuracy", 5, None, transformer)
+        assert context.evaluate(transformer) == pytest.approx(expected)
+
+        block = context._blocks[0]
+        assert np.array_equal(block.train[:, : block.width], base_block)
+        assert context.evaluate() == pytest.approx(base_score)
+
+    @pytest.mark.parametrize(
+        "encoding", ["target", "count", "label", "basen", "binary", "onehot"]
+    )
+    def test_delta_and_full_modes_agree(self, load_data, encoding):
+        x, y = load_data
+        # Missing categories give integer codes in some folds and floats in others
+        x.loc[[3, 80], "color"] = np.nan
+        model = KNeighborsClassifier()
+        transformer = CategoricalEncoding({"color": encoding})
+
+        delta = EvaluationContext(x, y, model, "accuracy", cv=4)
+        full = EvaluationContext(x, y, model, "accuracy", cv=4, delta=False)
+
+        score = delta.evaluate(transformer)
+        assert not np.isnan(score)
+        assert score == pytest.approx(full.evaluate(transformer))
+
+    @pytest.mark.parametrize("encoding", ["target", "catboost", "count"])
+    def test_delta_keeps_column_order_of_replaced_columns(self, encoding):
+        data = load_iris()
+        y = pd.Series(data.target)
+        rng = np.random.default_rng(0)
+        noisy = np.where(y == 1, "green", "blue")
+        noisy[rng.random(len(y)) > 0.8] = "blue"
+        x = pd.DataFrame(data.data, columns=data.feature_names)
+        # The encoded column moves last, and trees break ties by column order
+        x.insert(0, "color", np.where(y == 0, "red", noisy))
+        model = DecisionTreeClassifier(random_state=0)
+        transformer = CategoricalEncoding({"color": encoding})
+
+        delta = EvaluationContext(x, y, model, "accuracy", cv=4)
+        full = EvaluationContext(x, y, model, "accuracy", cv=4, delta=False)
+        delta.evaluate()
+
+        expected = evaluate_model(x, y, model, "accuracy", 4, None, transformer)
+        assert full.evaluate(transformer) == pytest.approx(expected)
+        assert delta.evaluate(transformer) == pytest.approx(expected)
+
+    def test_column_selection_matches_evaluate_model(self, load_data):
+        x, y = load_data
+        model = KNeighborsClassifier()
+        transformer = ColumnSelection(
+            ["petal width (cm)", "color", "sepal length (cm)"]
+        )
+
+        context = EvaluationContext(x, y, model, "accuracy", cv=5)
+
+        expected = evaluate_model(x, y, model, "accuracy", 5, None, transformer)
+        assert context.evaluate(transformer) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("backend", ["loky", "threading"])
+    def test_executor_matches_sequential(self, load_data, backend):
+        x, y = load_data
+        model = KNeighborsClassifier()
+        transformers = [
+            None,
+            ScaleTransformation({"sepal length (cm)": "min_max"}),
+            NumericalBinning({"petal width (cm)": ("uniform", 3)}),
+            CategoricalEncoding({"color": "dummy"}),
+        ]
+
+        expected = EvaluationContext(x, y, model, "accuracy", cv=3).evaluate_many(
+            transformers
+        )
+
+        with CandidateExecutor(n_jobs=2, backend=backend) as executor:
+            context = EvaluationContext(
+                x, y, model, "accuracy", cv=3, executor=executor
+            )
+            scores = context.evaluate_many(transformers)
+            assert context.evaluate_many(transformers) == pytest.approx(scores)
+
+        assert scores == pytest.approx(expected)
+
+    def test_racing_drops_dominated_candidates(self, load_data):
+        x, y = load_data
+        model = KNeighborsClassifier()
+        transformers = [
+            ColumnSelection(["color"]),
+            ColumnSelection(["petal length (cm)", "petal width (cm)"]),
+            ColumnSelection(["size"]),
+        ]
+
+        full = EvaluationContext(x, y, model, "accuracy", cv=5)
+        expected = full.evaluate_many(transformers, "maximize")
+
+        executor = CandidateExecutor(n_jobs=1, racing=Racing(min_folds=2))
+        context = EvaluationContext(x, y, model, "accuracy", cv=5, executor=executor)
+        scores = context.evaluate_many(transformers, "maximize")
+
+        assert scores[1] == pytest.approx(expected[1])
+        assert np.isnan(scores[0]) and np.isnan(scores[2])
+        assert context.n_fits < full.n_fits
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.neighbors import KNeighborsClassifier
+
+from cross.auto_parameters.shared import (
+    CandidateExecutor,
+    EvaluationContext,
+    ScoreCache,
+)
+from cross.transformations import ScaleTransformation
+
+
+@pytest.fixture
+def load_data():
+    data = load_iris()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    return df, pd.Series(data.target)
+
+
+class TestScoreCache:
+    def test_get_and_put(self, tmp_path):
+        cache = ScoreCache(tmp_path)
+        cache.put_many({"a": 0.5, "b": 0.7})
+
+        assert cache.get_many(["a", "c"]) == {"a": 0.5}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert ScoreCache(tmp_path).get_many(["b"]) == {"b": 0.7}
+
+    def test_least_recently_used_are_evicted(self, tmp_path):
+        cache = ScoreCache(tmp_path, max_entries=2)
+        cache.put_many({"a": 0.1})
+        cache.put_many({"b": 0.2})
+        cache.get_many(["a"])
+        cache.put_many({"c": 0.3})
+
+        assert len(cache) == 2
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_context_reuses_cached_scores(self, load_data, tmp_path):
+        x, y = load_data
+        model = KNeighborsClassifier()
+        transformers = [None, ScaleTransformation({"sepal length (cm)": "min_max"})]
+
+        executor = CandidateExecutor(n_jobs=1, cache=ScoreCache(tmp_path))
+        first = EvaluationContext(x, y, model, "accuracy", cv=3, executor=executor)
+        expected = first.evaluate_many(transformers)
+
+        executor = CandidateExecutor(n_jobs=1, cache=ScoreCache(tmp_path))
+        second = EvaluationContext(x, y, model, "accuracy", cv=3, executor=executor)
+
+        assert second.evaluate_many(transformers) == pytest.approx(expected)
+        assert second.n_fits == 0
+        assert executor.cache.hits == 2
+
+        other = EvaluationContext(x, y, model, "accuracy", cv=4, executor=executor)
+        other.evaluate_many(transformers)
+        assert other.n_fits == 8
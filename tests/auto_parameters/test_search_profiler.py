@@ -0,0 +1,73 @@
+import json
+
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.neighbors import KNeighborsClassifier
+
+from cross.auto_parameters.shared import (
+    CandidateExecutor,
+    EvaluationContext,
+    SearchProfiler,
+)
+from cross.transformations import ScaleTransformation
+
+
+@pytest.fixture
+def load_data():
+    data = load_iris()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    return df, pd.Series(data.target)
+
+
+class TestSearchProfiler:
+    def test_records_stage(self, load_data):
+        X, y = load_data
+        candidates = [
+            ScaleTransformation(transformation_options={X.columns[0]: scaler})
+            for scaler in ["min_max", "standard", "max_abs"]
+        ]
+
+        profiler = SearchProfiler(n_slowest=2)
+        executor = CandidateExecutor(n_jobs=1)
+        executor.profiler = profiler
+        context = EvaluationContext(
+            X, y, KNeighborsClassifier(), "accuracy", cv=3, executor=executor
+        )
+
+        with profiler.stage("scale"):
+            context.evaluate()
+            context.evaluate_many(candidates)
+
+        stage = profiler.stages[0]
+        assert stage["stage"] == "scale"
+        assert stage["evaluations"] == 4
+        assert stage["fits"] == 12
+        assert stage["wall_time"] > 0
+        assert len(stage["slowest_candidates"]) == 2
+
+        slowest = [candidate["time"] for candidate in stage["slowest_candidates"]]
+        assert slowest == sorted(slowest, reverse=True)
+
+    def test_export(self, tmp_path):
+        profiler = SearchProfiler()
+        with profiler.stage("first"):
+            pass
+        with profiler.stage("second"):
+            pass
+
+        df = profiler.to_dataframe()
+        assert list(df["stage"]) == ["first", "second"]
+
+        path = tmp_path / "profile.json"
+        document = json.loads(profiler.to_json(path))
+        assert document == json.loads(path.read_text())
+        assert document["total"]["fits"] == 0
+        assert len(document["stages"]) == 2
+
+    def test_outside_stage_is_ignored(self):
+        profiler = SearchProfiler()
+        profiler.record_evaluations(3)
+        profiler.record_fits([None], [1.0], n_fits=5)
+
+        assert profiler.stages == []
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import load_iris
+
+from cross.auto_parameters.shared.utils import subsample
+
+
+@pytest.fixture
+def load_data():
+    data = load_iris()
+    df = pd.DataFrame(data.data, columns=data.feature_names)
+    return df, pd.Series(data.target)
+
+
+class TestSubsample:
+    def test_fraction_is_stratified(self, load_data):
+        x, y = load_data
+
+        x_sample, y_sample, groups = subsample(x, y, 0.2, stratify=True)
+
+        assert len(x_sample) == 30
+        assert x_sample.index.equals(y_sample.index)
+        assert y_sample.value_counts().tolist() == [10, 10, 10]
+        assert groups is None
+
+    def test_groups_are_kept_whole(self, load_data):
+        x, y = load_data
+        groups = np.arange(len(x)) // 10
+
+        x_sample, _, groups_sample = subsample(x, y, 40, groups=groups)
+
+        assert 40 <= len(x_sample) < 50
+        sampled = np.unique(groups_sample)
+        assert np.isin(groups, sampled).sum() == len(x_sample)
+
+    def test_full_size_returns_input(self, load_data):
+        x, y = load_data
+
+        x_sample, y_sample, _ = subsample(x, y, len(x))
+
+        assert x_sample is x and y_sample is y
+
+    def test_invalid_fraction(self, load_data):
+        x, y = load_data
+
+        with pytest.raises(ValueError):
+            subsample(x, y, 1.5)
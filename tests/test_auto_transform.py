@@ -1,10 +1,18 @@
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.datasets import load_iris
 from sklearn.neighbors import KNeighborsClassifier
 
+import cross.auto_parameters as pc
 from cross import CrossTransformer, auto_transform
-from cross.auto_parameters.shared import evaluate_model
+from cross.auto_parameters.shared import Budget, CandidateExecutor, evaluate_model
+from cross.auto_transform import (
+    _best_branch,
+    _confirm_on_full_data,
+    _search_branches,
+)
+from cross.utils.verbose import VerboseLogger
 
 
 @pytest.fixture
@@ -48,3 +56,132 @@ def test_auto_transform(load_data):
     assert transformed_score >= (baseline_score) - (
         baseline_score * 0.1
     ), "Transformed score should be equal or better than the baseline."
+
+
+def test_search_branches_in_workers(load_data):
+    df = load_data
+    x, y = df.drop(columns="target"), df["target"]
+
+    def search(n_jobs, budget):
+        branches = [
+            [
+                pc.NonLinearTransformationParameterSelector(),
+                pc.NormalizationParameterSelector(),
+            ],
+            [pc.QuantileTransformationParameterSelector()],
+        ]
+        with CandidateExecutor(n_jobs) as executor:
+            return _search_branches(
+                branches,
+                [[None, None], [None]],
+                x,
+                y,
+                KNeighborsClassifier(),
+                "accuracy",
+                "maximize",
+                3,
+                None,
+                VerboseLogger(enabled=False),
+                executor,
+                budget,
+            )
+
+    serial_budget, parallel_budget = (
+        Budget(max_evaluations=100),
+        Budget(max_evaluations=100),
+    )
+    serial = search(1, serial_budget)
+    parallel = search(2, parallel_budget)
+
+    for (_, serial_stages, _, serial_score), (_, stages, _, score) in zip(
+        serial, parallel
+    ):
+        assert stages == serial_stages
+        assert score == pytest.approx(serial_score)
+
+    # The usage of the budget copies sent to the workers is merged back
+    assert parallel_budget.evaluations == serial_budget.evaluations
+
+
+def test_search_branches_reuse_selector_scores(load_data):
+    df = load_data
+    x, y = df.drop(columns="target"), df["target"]
+
+    def search(branches, replays):
+        with CandidateExecutor(1) as executor:
+            return _search_branches(
+                branches,
+                replays,
+                x,
+                y,
+                KNeighborsClassifier(),
+                "accuracy",
+                "maximize",
+                3,
+                None,
+                VerboseLogger(enabled=False),
+                executor,
+            )
+
+    branches = [
+        [
+            pc.NonLinearTransformationParameterSelector(),
+            pc.NormalizationParameterSelector(),
+        ],
+        [pc.QuantileTransformationParameterSelector()],
+    ]
+    searched = search(branches, [[None, None], [None]])
+
+    for branch, (_, _, _, score) in zip(branches, searched):
+        assert score == branch[-1].best_score
+
+    # Replayed branches are scored like the selectors score their selection
+    replayed = search(branches, [stages for _, stages, _, _ in searched])
+    for (_, _, _, searched_score), (_, _, _, score) in zip(searched, replayed):
+        assert score == pytest.approx(searched_score)
+
+
+@pytest.mark.parametrize(
+    "scores, direction, expected",
+    [
+        ([0.9, 0.8], "maximize", 0),
+        ([0.9, 0.8], "minimize", 1),
+        ([0.8, 0.8], "maximize", 1),
+        ([np.nan, 0.8], "maximize", 1),
+        ([0.8, np.nan], "minimize", 0),
+        ([np.nan, np.nan], "maximize", 1),
+    ],
+)
+def test_best_branch(scores, direction, expected):
+    results = [(None, [], [], score) for score in scores]
+
+    assert _best_branch(results, direction) == expected
+
+
+def test_confirm_on_full_data_with_datetime_columns(load_data):
+    df = load_data
+    x, y = df.drop(columns="target"), df["target"]
+    x["date"] = pd.date_range("2024-01-01", periods=len(x), freq="5h")
+    sample = np.arange(0, len(x), 2)
+
+    transformations = [
+        {"name": "DateTimeTransformer", "params": {"features": ["date"]}},
+        {
+            "name": "ColumnSelection",
+            "params": {"features": ["petal length (cm)", "date_hour"]},
+        },
+    ]
+    report = _confirm_on_full_data(
+        transformations,
+        (x.iloc[sample], y.iloc[sample], None),
+        (x, y, None),
+        KNeighborsClassifier(),
+        "accuracy",
+        "maximize",
+        3,
+        VerboseLogger(enabled=False),
+        None,
+    )
+
+    assert np.isfinite(report["sample_score"])
+    assert np.isfinite(report["full_score"])
@@ -0,0 +1,184 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cross import CrossTransformer
+from cross.transformations import (
+    CategoricalEncoding,
+    CyclicalFeaturesTransformer,
+    DateTimeTransformer,
+    DimensionalityReduction,
+    MathematicalOperations,
+    MissingValuesHandler,
+    MissingValuesIndicator,
+    NonLinearTransformation,
+    Normalization,
+    NumericalBinning,
+    OutliersHandler,
+    QuantileTransformation,
+    ScaleTransformation,
+    SplineTransformation,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 200
+
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=n_rows),
+            "b": rng.lognormal(size=n_rows),
+            "c": rng.integers(0, 10, n_rows),
+            "color": rng.choice(["red", "green", "blue"], n_rows),
+            "size": rng.choice(["S", "M", "L"], n_rows),
+            "date": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 10**8, n_rows), unit="s"),
+        }
+    )
+    X.loc[::7, "a"] = np.nan
+    X.loc[::11, "color"] = None
+    y = pd.Series(rng.integers(0, 2, n_rows))
+
+    return X, y
+
+
+@pytest.fixture
+def transformations():
+    return [
+        MissingValuesIndicator(features=["a", "color"]),
+        MissingValuesHandler(transformation_options={"a": "median", "color": "fill_0"}),
+        OutliersHandler(
+            transformation_options={"a": ("cap", "iqr"), "b": ("median", "zscore")},
+            thresholds={"a": 1.5, "b": 2.0},
+        ),
+        NonLinearTransformation(transformation_options={"b": "yeo_johnson", "c": "log"}),
+        Normalization(transformation_options={"c": "l1"}),
+        QuantileTransformation(transformation_options={"b": "normal"}),
+        ScaleTransformation(transformation_options={"a": "standard", "b": "min_max"}),
+        DateTimeTransformer(features=["date"]),
+        CyclicalFeaturesTransformer(transformation_options={"date_month": 12}),
+        CategoricalEncoding(transformation_options={"color": "count", "size": "onehot"}),
+        SplineTransformation(transformation_options={"a": {"n_knots": 4}}),
+        NumericalBinning(transformation_options={"b": ("uniform", 4)}),
+        MathematicalOperations(operations_options=[("a", "b", "divide")]),
+        DimensionalityReduction(
+            features=["a__spline_0", "a__spline_1"], method="pca", n_components=1
+        ),
+    ]
+
+
+def test_compiled_transform_matches_pandas(data, transformations):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y)
+    expected = transformer.transform(X)
+    transformed = transformer.compile().transform(X)
+
+    assert list(transformed.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(transformed, expected.astype(float))
+
+    array = transformer.transform(X, as_frame=False)
+    assert isinstance(array, np.ndarray)
+    np.testing.assert_allclose(array, expected.to_numpy(dtype=float))
+
+
+def test_compiled_transformer_is_picklable(data, transformations):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y).compile()
+    restored = pickle.loads(pickle.dumps(transformer))
+
+    pd.testing.assert_frame_equal(restored.transform(X), transformer.transform(X))
+
+
+def test_compile_requires_fit(transformations):
+    with pytest.raises(ValueError):
+        CrossTransformer(transformations).compile()
+
+
+def test_transform_records_matches_transform(data, transformations):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y).compile()
+    expected = transformer.transform(X)
+    records = X.to_dict("records")
+
+    np.testing.assert_allclose(
+        transformer.transform_records(records), expected.to_numpy(), rtol=1e-10
+    )
+
+    row = transformer.transform_one(records[0], as_dict=True)
+    assert list(row) == list(expected.columns)
+    np.testing.assert_allclose(list(row.values()), expected.iloc[0], rtol=1e-10)
+
+
+def test_transform_records_handles_unseen_and_missing_values(data, transformations):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y)
+    record = X.iloc[0].to_dict()
+    record.update({"a": None, "color": "purple", "size": "XL"})
+    record.pop("b")
+
+    row = pd.DataFrame([record], columns=X.columns).astype(X.dtypes.to_dict())
+    expected = transformer.transform(row)
+
+    transformer.compile()
+    np.testing.assert_allclose(
+        transformer.transform_one(record), expected.iloc[0], rtol=1e-10
+    )
+
+
+@pytest.mark.parametrize("missing", ["none", "key"])
+def test_transform_records_imputes_missing_objects(data, missing):
+    X, y = data
+
+    transformer = CrossTransformer(
+        [
+            MissingValuesIndicator(features=["color"]),
+            MissingValuesHandler(transformation_options={"color": "most_frequent"}),
+            CategoricalEncoding(transformation_options={"color": "count"}),
+        ]
+    ).fit(X, y)
+    record = X.iloc[1].to_dict()
+    if missing == "none":
+        record["color"] = None
+    else:
+        record.pop("color")
+
+    row = pd.DataFrame([record], columns=X.columns).astype(X.dtypes.to_dict())
+    expected = transformer.transform(row)
+
+    transformer.compile()
+    row = transformer.transform_one(record, as_dict=True)
+    assert row["color__is_missing"] == expected["color__is_missing"].iloc[0] == 1
+    assert row["color"] == expected["color"].iloc[0] > 0
+
+
+def test_transform_records_requires_compile(data, transformations):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y)
+    with pytest.raises(ValueError):
+        transformer.transform_one(X.iloc[0].to_dict())
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_parallel_transform_matches_serial(data, transformations, compiled):
+    X, y = data
+
+    transformer = CrossTransformer(transformations).fit(X, y)
+    if compiled:
+        transformer.compile()
+
+    expected = transformer.transform(X)
+    transformed = transformer.transform(X, n_jobs=3)
+
+    pd.testing.assert_frame_equal(transformed, expected, check_exact=True)
+    np.testing.assert_array_equal(
+        transformer.transform(X, as_frame=False, n_jobs=3), expected.to_numpy()
+    )
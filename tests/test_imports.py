@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = {"matplotlib", "rich", "category_encoders"}
+
+
+def _imported(statement):
+    script = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    modules = json.loads(output)
+    return set(modules) | {module.split(".")[0] for module in modules}
+
+
+def test_cross_transformer_does_not_import_heavy_modules():
+    # Heavy modules imported by scikit-learn itself are not ours to avoid
+    baseline = _imported("import sklearn.base, sklearn.impute, sklearn.preprocessing")
+    imported = _imported(
+        "from cross import CrossTransformer\n"
+        "from cross.transformations import MissingValuesHandler, ScaleTransformation"
+    )
+
+    assert not (imported & HEAVY_MODULES) - baseline
+    assert "cross.auto_transform" not in imported
+
+
+def test_auto_transform_is_imported_on_first_use():
+    imported = _imported("from cross import auto_transform\nimport cross.auto_transform")
+    assert "cross.auto_transform" in imported
+
+    script = (
+        "import cross.auto_transform\n"
+        "from cross import auto_transform\n"
+        "assert callable(auto_transform) and auto_transform.__name__ == 'auto_transform'"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
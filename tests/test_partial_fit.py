@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cross import CrossTransformer
+from cross.transformations import (
+    CategoricalEncoding,
+    MathematicalOperations,
+    MissingValuesHandler,
+    NumericalBinning,
+    OutliersHandler,
+    QuantileTransformation,
+    ScaleTransformation,
+)
+from cross.transformations.utils.running_statistics import QuantileSketch
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 1_000
+
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=n_rows),
+            "b": rng.lognormal(size=n_rows),
+            "color": rng.choice(["red", "green", "blue"], n_rows, p=[0.5, 0.3, 0.2]),
+        }
+    )
+    X["a"] = X["a"].mask(rng.uniform(size=n_rows) < 0.1)
+
+    return X
+
+
+def chunks(X, size=300):
+    return [X.iloc[i : i + size] for i in range(0, len(X), size)]
+
+
+@pytest.mark.parametrize(
+    "make_transformer",
+    [
+        lambda: ScaleTransformation(
+            {"a": "standard", "b": "robust"}, quantile_range={"b": (10.0, 90.0)}
+        ),
+        lambda: ScaleTransformation({"a": "min_max", "b": "max_abs"}),
+        lambda: QuantileTransformation({"a": "uniform", "b": "normal"}),
+        lambda: NumericalBinning({"a": ("quantile", 5), "b": ("uniform", 4)}),
+        lambda: MissingValuesHandler({"a": "mean", "b": "median"}),
+        lambda: MissingValuesHandler({"a": "median", "color": "most_frequent"}),
+        lambda: OutliersHandler(
+            {"a": ("cap", "iqr"), "b": ("median", "zscore")},
+            thresholds={"a": 1.5, "b": 2.0},
+        ),
+        lambda: CategoricalEncoding({"color": "count"}),
+    ],
+)
+def test_partial_fit_matches_fit(data, make_transformer):
+    expected = make_transformer().fit(data).transform(data)
+
+    transformer = make_transformer()
+    for chunk in chunks(data):
+        transformer.partial_fit(chunk)
+
+    pd.testing.assert_frame_equal(transformer.transform(data), expected)
+
+
+def test_partial_fit_unsupported_options(data):
+    with pytest.raises(ValueError):
+        MissingValuesHandler({"a": "knn"}, n_neighbors={}).partial_fit(data)
+
+    with pytest.raises(ValueError):
+        CategoricalEncoding({"color": "onehot"}).partial_fit(data)
+
+
+def test_quantile_sketch_merges_compressed_streams():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=50_000)
+
+    sketches = [QuantileSketch(capacity=500).update(v) for v in np.split(values, 5)]
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+
+    assert not sketch.exact
+    assert sketch.count == len(values)
+    assert (sketch.min, sketch.max) == (values.min(), values.max())
+
+    levels = [0.1, 0.25, 0.5, 0.75, 0.9]
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(levels)) / len(values)
+    np.testing.assert_allclose(ranks, levels, atol=0.01)
+
+
+def test_cross_transformer_partial_fit_walks_the_steps(data):
+    def make_transformer():
+        return CrossTransformer(
+            [
+                MissingValuesHandler({"a": "mean"}),
+                MathematicalOperations([("a", "b", "multiply")]),
+                ScaleTransformation({"a__multiply__b": "standard"}),
+                CategoricalEncoding({"color": "count"}),
+            ]
+        )
+
+    expected = make_transformer().fit(data).transform(data)
+    transformer = make_transformer().partial_fit(lambda: iter(chunks(data)))
+
+    pd.testing.assert_frame_equal(transformer.transform(data), expected)
+
+    with pytest.raises(ValueError):
+        make_transformer().partial_fit(iter(chunks(data)))
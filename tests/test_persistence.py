@@ -0,0 +1,198 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cross import CrossTransformer
+from cross.transformations import (
+    CategoricalEncoding,
+    DimensionalityReduction,
+    MissingValuesHandler,
+    OutliersHandler,
+    QuantileTransformation,
+    ScaleTransformation,
+    SplineTransformation,
+)
+from cross.utils import load_state, save_state
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 200
+
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=n_rows),
+            "b": rng.lognormal(size=n_rows),
+            "color": rng.choice(["red", "green", "blue"], n_rows),
+        }
+    )
+    X.loc[::7, "a"] = np.nan
+    y = pd.Series(rng.integers(0, 2, n_rows))
+
+    return X, y
+
+
+@pytest.fixture
+def transformer(data):
+    X, y = data
+
+    return CrossTransformer(
+        [
+            MissingValuesHandler(transformation_options={"a": "median"}),
+            OutliersHandler(
+                transformation_options={"b": ("cap", "iforest")},
+                thresholds={"b": 0.1},
+                iforest_params={"b": {"n_estimators": 10, "random_state": 0}},
+            ),
+            QuantileTransformation(transformation_options={"b": "normal"}),
+            ScaleTransformation(transformation_options={"a": "standard"}),
+            CategoricalEncoding(transformation_options={"color": "target"}),
+            SplineTransformation(transformation_options={"a": {"n_knots": 4}}),
+            DimensionalityReduction(
+                features=["a__spline_0", "a__spline_1"], method="pca", n_components=1
+            ),
+        ]
+    ).fit(X, y)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_saved_transformer_matches_original(data, transformer, tmp_path, mmap):
+    X, _ = data
+
+    transformer.save(tmp_path)
+    loaded = CrossTransformer.load(tmp_path, mmap=mmap)
+
+    assert loaded.get_params()["transformations"][0].get_params() == (
+        transformer.get_params()["transformations"][0].get_params()
+    )
+    pd.testing.assert_frame_equal(loaded.transform(X), transformer.transform(X))
+
+
+def test_compiled_transformer_is_loaded_compiled(data, transformer, tmp_path):
+    X, _ = data
+
+    transformer.compile().save(tmp_path)
+    loaded = CrossTransformer.load(tmp_path)
+
+    assert loaded._plan is not None
+    pd.testing.assert_frame_equal(loaded.transform(X), transformer.transform(X))
+
+
+def test_state_roundtrip(tmp_path):
+    document = {
+        "values": np.arange(6.0).reshape(2, 3, order="F"),
+        "labels": np.array(["a", None], dtype=object),
+        "options": {"a": ("cap", "iqr"), 1: [np.float32(0.5), None]},
+        "dtype": np.dtype("int32"),
+        "rows": slice(1, None),
+        "buffer": bytearray(b"ab"),
+    }
+
+    save_state(document, tmp_path)
+    loaded = load_state(tmp_path)
+
+    np.testing.assert_array_equal(loaded["values"], document["values"])
+    np.testing.assert_array_equal(loaded["labels"], document["labels"])
+    assert loaded["options"] == document["options"]
+    assert type(loaded["options"][1][0]) is np.float32
+    assert loaded["dtype"] == document["dtype"]
+    assert loaded["rows"] == document["rows"]
+    assert type(loaded["buffer"]) is bytearray
+    assert loaded["buffer"] == document["buffer"]
+
+
+def test_untrusted_modules_are_not_loaded(tmp_path):
+    save_state({"path": os.path.join("a", "b")}, tmp_path)
+
+    with open(tmp_path / "pipeline.json") as f:
+        saved = json.load(f)
+    saved["document"]["path"] = {"__global__": "os:system"}
+    with open(tmp_path / "pipeline.json", "w") as f:
+        json.dump(saved, f)
+
+    with pytest.raises(ValueError):
+        load_state(tmp_path)
+
+
+def test_version_1_slices_and_bytearrays(tmp_path):
+    save_state({}, tmp_path)
+
+    with open(tmp_path / "pipeline.json") as f:
+        saved = json.load(f)
+    saved["format_version"] = 1
+    saved["document"] = {
+        "rows": {
+            "__object__": {
+                "id": 0,
+                "func": "builtins:slice",
+                "args": {"__tuple__": [1, None, None]},
+                "state": None,
+                "listitems": [],
+                "dictitems": [],
+            }
+        },
+        "buffer": {
+            "__object__": {
+                "id": 1,
+                "func": "builtins:bytearray",
+                "args": {"__tuple__": [{"__bytes__": "YWI="}]},
+                "state": None,
+                "listitems": [],
+                "dictitems": [],
+            }
+        },
+    }
+    with open(tmp_path / "pipeline.json", "w") as f:
+        json.dump(saved, f)
+
+    loaded = load_state(tmp_path)
+
+    assert loaded["rows"] == slice(1, None)
+    assert type(loaded["buffer"]) is bytearray
+    assert loaded["buffer"] == b"ab"
+
+
+@pytest.mark.parametrize("format_version", [1, 2])
+@pytest.mark.parametrize(
+    "func", ["builtins:exec", "builtins:eval", "numpy:save", "pandas.io.pickle:read_pickle"]
+)
+def test_untrusted_callables_are_not_called(tmp_path, func, format_version):
+    payload = tmp_path / "payload"
+    save_state({"value": 0}, tmp_path)
+
+    with open(tmp_path / "pipeline.json") as f:
+        saved = json.load(f)
+    saved["format_version"] = format_version
+    saved["document"]["value"] = {
+        "__object__": {
+            "id": 0,
+            "func": func,
+            "args": [f"open({str(payload)!r}, 'w').close()"],
+            "state": None,
+            "listitems": [],
+            "dictitems": [],
+        }
+    }
+    with open(tmp_path / "pipeline.json", "w") as f:
+        json.dump(saved, f)
+
+    with pytest.raises(ValueError):
+        CrossTransformer.load(tmp_path)
+    assert not payload.exists()
+
+
+def test_unsupported_format_version(tmp_path):
+    save_state({}, tmp_path)
+
+    with open(tmp_path / "pipeline.json") as f:
+        saved = json.load(f)
+    saved["format_version"] = 999
+    with open(tmp_path / "pipeline.json", "w") as f:
+        json.dump(saved, f)
+
+    with pytest.raises(ValueError):
+        load_state(tmp_path)
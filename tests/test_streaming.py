@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cross import CrossTransformer
+from cross.transformations import (
+    CategoricalEncoding,
+    ColumnSelection,
+    MathematicalOperations,
+    MissingValuesHandler,
+    OutliersHandler,
+    ScaleTransformation,
+)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n_rows = 1_000
+
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(size=n_rows),
+            "b": rng.integers(0, 100, n_rows),
+            "color": rng.choice(["red", "green", "blue"], n_rows),
+        }
+    )
+    X["a"] = X["a"].mask(rng.uniform(size=n_rows) < 0.1)
+
+    return X
+
+
+@pytest.fixture
+def transformer(data):
+    return CrossTransformer(
+        [
+            MissingValuesHandler(transformation_options={"a": "mean"}),
+            OutliersHandler(
+                transformation_options={"a": ("cap", "iqr")}, thresholds={"a": 1.5}
+            ),
+            ScaleTransformation(transformation_options={"b": "standard"}),
+            CategoricalEncoding(transformation_options={"color": "onehot"}),
+            MathematicalOperations(operations_options=[("a", "b", "multiply")]),
+        ]
+    ).fit(data)
+
+
+def test_transform_stream_matches_full_transform(data, transformer):
+    expected = transformer.transform(data)
+
+    chunks = (data.iloc[i : i + 128] for i in range(0, len(data), 128))
+    transformed = pd.concat(transformer.transform_stream(chunks))
+
+    pd.testing.assert_frame_equal(transformed, expected)
+
+
+def test_transform_stream_from_csv(data, transformer, tmp_path):
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+    expected = transformer.transform(data)
+
+    chunks = list(transformer.transform_stream(path, chunksize=300))
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_dtype=False)
+
+
+def test_transform_stream_to_parquet(data, transformer, tmp_path):
+    pytest.importorskip("pyarrow")
+
+    source, output = tmp_path / "data.parquet", tmp_path / "transformed.parquet"
+    data.to_parquet(source, index=False)
+    expected = transformer.transform(data)
+
+    assert transformer.transform_stream(source, chunksize=300, output=output) is None
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(output), expected, check_dtype=False
+    )
+
+
+def test_transform_stream_reads_required_columns(data, tmp_path):
+    transformer = CrossTransformer(
+        [
+            ColumnSelection(features=["a", "color"]),
+            CategoricalEncoding(transformation_options={"color": "count"}),
+        ]
+    ).fit(data)
+    assert transformer.required_input_columns_ == ["a", "color"]
+
+    path = tmp_path / "data.csv"
+    data[["b", "color", "a"]].to_csv(path, index=False)
+
+    chunks = list(transformer.transform_stream(path, chunksize=300))
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), transformer.transform(data), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    "read_kwargs",
+    [
+        {"parse_dates": ["date"], "dtype": {"b": "int32"}},
+        {"converters": {"date": str.strip}, "na_values": {"date": ["?"]}},
+        {"parse_dates": [3]},
+        {"index_col": "date"},
+    ],
+)
+def test_transform_stream_reads_required_columns_with_read_kwargs(
+    data, tmp_path, read_kwargs
+):
+    transformer = CrossTransformer(
+        [
+            ColumnSelection(features=["a", "color"]),
+            CategoricalEncoding(transformation_options={"color": "count"}),
+        ]
+    ).fit(data)
+
+    # The arguments name a column the transformer does not read
+    path = tmp_path / "data.csv"
+    data.assign(date="2024-01-01").to_csv(path, index=False)
+
+    chunks = list(transformer.transform_stream(path, chunksize=300, **read_kwargs))
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True),
+        transformer.transform(data),
+        check_dtype=False,
+    )
@@ -1,18 +1,27 @@
+import numpy as np
 import pandas as pd
 import pytest
+from scipy import sparse
+from sklearn.base import clone
 from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
 
 from cross import CrossTransformer
+from cross.auto_parameters.shared import evaluate_model
 from cross.transformations import (
+    CategoricalEncoding,
     ColumnSelection,
+    DateTimeTransformer,
     MathematicalOperations,
     MissingValuesHandler,
+    MissingValuesIndicator,
     NonLinearTransformation,
     Normalization,
     NumericalBinning,
     OutliersHandler,
     QuantileTransformation,
     ScaleTransformation,
+    SplineTransformation,
 )
 
 
@@ -150,3 +159,260 @@ def test_transformations_are_applied(load_data):
     assert (
         x_test.shape[0] == transformed_x_test.shape[0]
     ), f"Expected {x_test.shape[0]} rows, but got {transformed_x_test.shape[0]}."
+
+
+def test_required_input_columns_are_projected(load_data):
+    df = load_data
+    x, y = df.drop(columns="target"), df["target"]
+
+    transformer = CrossTransformer(
+        [
+            ScaleTransformation(transformation_options={"sepal length (cm)": "standard"}),
+            MathematicalOperations(
+                operations_options=[
+                    ("sepal length (cm)", "petal width (cm)", "multiply")
+                ]
+            ),
+            ColumnSelection(
+                features=[
+                    "sepal length (cm)",
+                    "sepal length (cm)__multiply__petal width (cm)",
+                ]
+            ),
+        ]
+    ).fit(x, y)
+
+    assert transformer.required_input_columns_ == [
+        "sepal length (cm)",
+        "petal width (cm)",
+    ]
+
+    expected = transformer.transform(x)
+    projected = x[transformer.required_input_columns_]
+    pd.testing.assert_frame_equal(transformer.transform(projected), expected)
+
+    wider = x.assign(unused=0.0)
+    pd.testing.assert_frame_equal(transformer.compile().transform(wider), expected)
+
+
+@pytest.mark.parametrize(
+    "transformation",
+    [
+        ScaleTransformation(transformation_options={"sepal length (cm)": "standard"}),
+        NumericalBinning(transformation_options={"sepal width (cm)": ("uniform", 4)}),
+        MathematicalOperations(
+            operations_options=[("petal length (cm)", "petal width (cm)", "add")]
+        ),
+    ],
+)
+def test_transform_without_copy_matches_copy(load_data, transformation):
+    x = load_data.drop(columns="target")
+    original = x.copy()
+
+    expected = transformation.fit(x).transform(x)
+    pd.testing.assert_frame_equal(x, original)
+
+    transformation.set_params(copy=False)
+    pd.testing.assert_frame_equal(transformation.transform(x.copy()), expected)
+
+    transformer = CrossTransformer([transformation], copy=False).fit(x.copy())
+    pd.testing.assert_frame_equal(transformer.transform(x.copy()), expected)
+
+
+def test_binning_without_copy_fills_str_columns(load_data):
+    x = load_data.drop(columns="target")
+    x["color"] = pd.Series(np.where(x.index % 4 == 0, None, "red"), dtype="str")
+
+    def binning():
+        return NumericalBinning(
+            transformation_options={"sepal width (cm)": ("uniform", 4)}
+        )
+
+    expected = binning().fit_transform(x)
+    transformed = CrossTransformer([binning()]).fit_transform(x)
+
+    pd.testing.assert_frame_equal(transformed, expected)
+
+
+def test_cross_transformer_leaves_transformations_unchanged(load_data):
+    x, y = load_data.drop(columns="target"), load_data["target"]
+    spline = SplineTransformation(transformation_options={"petal length (cm)": {}})
+    binning = NumericalBinning(
+        transformation_options={"petal width (cm)": ("uniform", 4)}
+    )
+    params = [spline.get_params(), binning.get_params()]
+
+    transformer = CrossTransformer(
+        [spline, binning], dtype_policy="compact", sparse_output=True
+    ).fit(x, y)
+
+    assert [spline.get_params(), binning.get_params()] == params
+    assert transformer.transform(x)["petal width (cm)__uniform_4"].dtype == np.uint8
+
+
+@pytest.mark.parametrize(
+    "transformation",
+    [
+        CategoricalEncoding(
+            transformation_options={"color": "onehot"},
+            copy=False,
+            dtype_policy="compact",
+            sparse_output=True,
+        ),
+        MissingValuesHandler(
+            transformation_options={"sepal length (cm)": "median"}, copy=False
+        ),
+        MissingValuesIndicator(
+            features=["sepal length (cm)"], copy=False, dtype_policy="compact"
+        ),
+        SplineTransformation(
+            transformation_options={"petal length (cm)": {}},
+            copy=False,
+            dtype_policy="compact",
+            sparse_output=True,
+        ),
+    ],
+)
+def test_clone_keeps_output_settings(transformation):
+    params = transformation.get_params()
+    assert params["copy"] is False
+
+    assert clone(transformation).get_params() == params
+
+    restored = clone(transformation).set_params(copy=True)
+    assert restored.get_params() == {**params, "copy": True}
+
+
+def test_compact_dtype_policy_matches_float64(load_data):
+    x, y = load_data.drop(columns="target"), load_data["target"]
+    x["sepal length (cm)"] = x["sepal length (cm)"].mask(x.index % 7 == 0)
+    x["color"] = np.where(x.index % 3 == 0, "red", "blue")
+    x["date"] = pd.date_range("2024-01-01", periods=len(x), freq="5h")
+
+    def transformations():
+        return [
+            MissingValuesIndicator(features=["sepal length (cm)"]),
+            MissingValuesHandler(
+                transformation_options={"sepal length (cm)": "median"}
+            ),
+            ScaleTransformation(transformation_options={"sepal width (cm)": "standard"}),
+            SplineTransformation(transformation_options={"petal length (cm)": {}}),
+            NumericalBinning(transformation_options={"petal width (cm)": ("uniform", 4)}),
+            CategoricalEncoding(transformation_options={"color": "onehot"}),
+            DateTimeTransformer(features=["date"]),
+        ]
+
+    expected = CrossTransformer(transformations()).fit_transform(x, y)
+    transformer = CrossTransformer(transformations(), dtype_policy="compact")
+    transformed = transformer.fit(x, y).transform(x)
+
+    assert transformed["sepal length (cm)__is_missing"].dtype == np.uint8
+    assert transformed["sepal width (cm)"].dtype == np.float32
+    assert transformed["petal width (cm)__uniform_4"].dtype == np.uint8
+    assert transformed["color_1"].dtype == np.uint8
+    assert transformed["date_year"].dtype == np.uint16
+    assert transformed["date_hour"].dtype == np.uint8
+
+    pd.testing.assert_frame_equal(
+        transformed, expected, check_dtype=False, check_exact=False, rtol=1e-5
+    )
+    pd.testing.assert_frame_equal(transformer.compile().transform(x), transformed)
+
+
+def test_compact_dtype_policy_scores_like_float64(load_data):
+    x, y = load_data[["sepal length (cm)"]], (load_data["target"] == 1).astype(int)
+    x = x.mask(y == 1)
+
+    def transformations():
+        return [
+            MissingValuesIndicator(features=["sepal length (cm)"]),
+            MissingValuesHandler(
+                transformation_options={"sepal length (cm)": "median"}
+            ),
+        ]
+
+    model = LogisticRegression(max_iter=1000)
+    scores = [
+        evaluate_model(
+            x,
+            y,
+            model,
+            "accuracy",
+            cv=3,
+            transformer=CrossTransformer(transformations(), dtype_policy=policy),
+        )
+        for policy in [None, "compact"]
+    ]
+
+    assert scores[0] == pytest.approx(1.0)
+    assert scores[1] == pytest.approx(scores[0])
+
+
+def test_sparse_output_matches_dense(load_data):
+    x, y = load_data.drop(columns="target"), load_data["target"]
+    x["color"] = np.array(["red", "blue", "green"])[x.index % 3]
+
+    def transformations():
+        return [
+            SplineTransformation(transformation_options={"petal length (cm)": {}}),
+            CategoricalEncoding(transformation_options={"color": "onehot"}),
+        ]
+
+    dense = CrossTransformer(transformations()).fit(x, y)
+    transformer = CrossTransformer(transformations(), sparse_output=True).fit(x, y)
+    transformed = transformer.transform(x)
+
+    assert isinstance(transformed["color_1"].dtype, pd.SparseDtype)
+    assert isinstance(transformed["petal length (cm)__spline_0"].dtype, pd.SparseDtype)
+    pd.testing.assert_frame_equal(
+        transformed.astype(dense.transform(x).dtypes.to_dict()), dense.transform(x)
+    )
+
+    matrix = transformer.transform(x, as_frame=False)
+    assert sparse.issparse(matrix)
+    np.testing.assert_allclose(matrix.toarray(), dense.transform(x).to_numpy(float))
+
+    model = LogisticRegression(max_iter=1000)
+    assert evaluate_model(
+        x, y, model, "accuracy", cv=3, transformer=transformer
+    ) == pytest.approx(evaluate_model(x, y, model, "accuracy", cv=3, transformer=dense))
+
+    with pytest.raises(ValueError):
+        transformer.compile()
+
+
+def test_arrow_input_matches_numpy(load_data):
+    pa = pytest.importorskip("pyarrow")
+
+    x, y = load_data.drop(columns="target"), load_data["target"]
+    x["date"] = pd.date_range("2024-01-01", periods=len(x), freq="5h")
+    x["color"] = np.resize(np.array(["red", "green", None], dtype=object), len(x))
+    x["shape"] = np.resize(np.array(["round", None, "flat"], dtype=object), len(x))
+    table = pa.Table.from_pandas(x, preserve_index=False)
+
+    def transformations():
+        return [
+            MissingValuesIndicator(features=["color", "shape"]),
+            MissingValuesHandler(transformation_options={"color": "most_frequent"}),
+            CategoricalEncoding(
+                transformation_options={"color": "onehot", "shape": "count"}
+            ),
+            ScaleTransformation(transformation_options={"sepal width (cm)": "standard"}),
+            MathematicalOperations(
+                operations_options=[
+                    ("sepal length (cm)", "petal length (cm)", "multiply")
+                ]
+            ),
+            NumericalBinning(transformation_options={"petal width (cm)": ("uniform", 4)}),
+            DateTimeTransformer(features=["date"]),
+        ]
+
+    expected = CrossTransformer(transformations()).fit(x, y).transform(x)
+    transformer = CrossTransformer(transformations(), arrow_output=True)
+    transformed = transformer.fit(table, y).transform(table)
+
+    assert isinstance(transformed, pa.Table)
+    pd.testing.assert_frame_equal(transformed.to_pandas(), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(
+        transformer.compile().transform(table).to_pandas(), expected, check_dtype=False
+    )
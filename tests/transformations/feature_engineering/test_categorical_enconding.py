@@ -52,3 +52,19 @@ class TestCategoricalEncoding:
         })
 
         pd.testing.assert_frame_equal(transformed_X, expected_X)
+
+    # Hashing encodes the column into its hash buckets, without missing values
+    def test_hashing_encoding(self):
+        X = pd.DataFrame({
+            'col1': ["A", "B", "C", "A", "B"],
+            'col2': [1, 2, 3, 4, 5],
+        })
+
+        ce = CategoricalEncoding(transformation_options={"col1": "hashing"})
+        transformed_X = ce.fit(X).transform(X)
+
+        hash_columns = [c for c in transformed_X.columns if c.startswith("col1_")]
+
+        assert list(transformed_X.columns) == ["col2"] + hash_columns
+        assert not transformed_X.isna().any().any()
+        assert (transformed_X[hash_columns].sum(axis=1) == 1).all()
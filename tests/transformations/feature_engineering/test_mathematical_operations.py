@@ -40,4 +40,24 @@ class TestMathematicalOperations:
         expected_data = data.copy()
         expected_data['A__divide__B'] = [0.25, 0.0, 0.0]
     
-        pd.testing.assert_frame_equal(transformed_data, expected_data)
\ No newline at end of file
+        pd.testing.assert_frame_equal(transformed_data, expected_data)
+
+    # Use the columns created by previous operations, which are appended in order
+    def test_chained_operations(self):
+        data = pd.DataFrame({
+            'A': [1.0, 2.0, 3.0],
+            'B': [4.0, 5.0, 6.0]
+        })
+
+        transformer = MathematicalOperations(operations_options=[
+            ('A', 'B', 'add'),
+            ('A__add__B', 'A', 'multiply'),
+        ])
+
+        transformed_data = transformer.transform(data)
+
+        expected_data = data.copy()
+        expected_data['A__add__B'] = [5.0, 7.0, 9.0]
+        expected_data['A__add__B__multiply__A'] = [5.0, 14.0, 27.0]
+
+        pd.testing.assert_frame_equal(transformed_data, expected_data)
@@ -33,7 +33,7 @@ class TestNormalization:
         retrieved_params = normalization.get_params()
 
         # Assert
-        assert retrieved_params == params
+        assert retrieved_params == {**params, "copy": True, "dtype_policy": None}
 
     # Successfully fits transformers for specified columns with 'l1' or 'l2' normalization
     def test_fit_transformers(self):
@@ -0,0 +1,68 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from cross.utils import Checkpoint, fingerprint
+
+
+@pytest.fixture
+def load_data():
+    return pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": ["x", "y", "z"]})
+
+
+class TestFingerprint:
+    def test_same_data_same_fingerprint(self, load_data):
+        df = load_data
+
+        assert fingerprint(df, "accuracy") == fingerprint(df.copy(), "accuracy")
+
+    def test_changes_are_detected(self, load_data):
+        df = load_data
+        changed = df.copy()
+        changed.loc[0, "a"] = 10.0
+
+        assert fingerprint(df) != fingerprint(changed)
+        assert fingerprint(df) != fingerprint(df.rename(columns={"a": "c"}))
+        assert fingerprint(df, "accuracy") != fingerprint(df, "f1")
+
+
+class TestCheckpoint:
+    def test_completed_stages_are_restored(self, tmp_path):
+        transformation = {"name": "ColumnSelection", "params": {"features": ["a"]}}
+
+        checkpoint = Checkpoint(tmp_path, "abc")
+        stage = checkpoint.stage("ColumnSelectionParameterSelector")
+        checkpoint.complete(stage, [transformation])
+
+        resumed = Checkpoint(tmp_path, "abc")
+        assert resumed.resumed
+        assert resumed.stage("ColumnSelectionParameterSelector") == stage
+        assert resumed.is_completed(stage)
+        assert resumed.result(stage) == [transformation]
+        assert not resumed.is_completed(resumed.stage("Other"))
+
+    def test_different_fingerprint_starts_over(self, tmp_path):
+        checkpoint = Checkpoint(tmp_path, "abc")
+        checkpoint.complete(checkpoint.stage("Selector"), [])
+
+        other = Checkpoint(tmp_path, "def")
+        assert not other.resumed
+        assert not other.is_completed(other.stage("Selector"))
+
+    def test_only_stages_are_written(self, tmp_path):
+        checkpoint = Checkpoint(tmp_path, "abc")
+        checkpoint.complete(checkpoint.stage("Selector"), [])
+
+        with open(checkpoint.path, "rb") as f:
+            assert set(pickle.load(f)) == {"fingerprint", "stages"}
+
+    def test_files_with_a_state_are_resumed(self, tmp_path):
+        with open(tmp_path / Checkpoint.FILENAME, "wb") as f:
+            pickle.dump(
+                {"fingerprint": "abc", "stages": {"00_Selector": []}, "state": {}}, f
+            )
+
+        resumed = Checkpoint(tmp_path, "abc")
+        assert resumed.resumed
+        assert resumed.is_completed(resumed.stage("Selector"))